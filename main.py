@@ -1,369 +1,787 @@
-import asyncio
-import logging
-import os
-import time
-from datetime import datetime, timedelta
-import getpass
-from urllib.parse import urljoin
-
-import feedparser
-import requests
-import translators as ts
-from bs4 import BeautifulSoup
-from dotenv import load_dotenv
-from telethon import TelegramClient
-from telethon.errors import (
-    FloodWaitError,
-    SessionPasswordNeededError,
-    PhotoInvalidError,
-    WebpageCurlFailedError,
-    MediaCaptionTooLongError,
-)
-
-import settings
-
-# --- Logging Setup ---
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
-
-# --- Helper Functions ---
-def load_posted_links():
-    """Loads the set of already posted links from the file."""
-    try:
-        with open(settings.POSTED_LINKS_FILE, "r") as f:
-            return set(line.strip() for line in f)
-    except FileNotFoundError:
-        return set()
-
-
-def save_posted_links(links_set):
-    """Saves the set of posted links to the file."""
-    with open(settings.POSTED_LINKS_FILE, "w") as f:
-        for link in sorted(list(links_set)):
-            f.write(link + "\n")
-
-
-def contains_keywords(text, keywords):
-    """Checks if the text contains any of the specified keywords."""
-    if not text:
-        return False
-    text_lower = text.lower()
-    return any(keyword in text_lower for keyword in keywords)
-
-
-def translate_text(
-    text, target_lang="uz", source_lang="en", translator_backend="google"
-):
-    """Translates text using the 'translators' library."""
-    if not text or not settings.ENABLE_TRANSLATION:
-        return text
-    try:
-        logging.info(f"Attempting translation with backend: {translator_backend}")
-        translated = ts.translate_text(
-            text,
-            translator=translator_backend,
-            from_language=source_lang,
-            to_language=target_lang,
-        )
-        logging.info(
-            f"Translated to {target_lang} using {translator_backend}: {translated[:50]}..."
-        )
-        return translated
-    except Exception as e:
-        logging.error(
-            f"Translation failed with backend {translator_backend}: {e}. Returning original text."
-        )
-        return text
-
-
-def extract_image_url(entry, article_url):
-    """Tries to find a suitable image URL from the RSS feed or article page."""
-    if not settings.ENABLE_IMAGE_FETCHING:
-        return None
-
-    # 1. Check RSS feed for standard media tags
-    for key in ["media_content", "media_thumbnail", "enclosures"]:
-        if key in entry:
-            for item in entry[key]:
-                if "url" in item and "image" in item.get("medium", ""):
-                    url = item["url"]
-                    logging.info(f"Found image in RSS {key}: {url}")
-                    return url
-                if "href" in item and "image" in item.get("type", ""):
-                    url = item["href"]
-                    logging.info(f"Found image in RSS {key}: {url}")
-                    return url
-
-    # 2. If not in RSS, fetch the article page and look for an Open Graph image
-    if article_url:
-        logging.info(
-            f"No image in RSS feed, attempting to fetch from page: {article_url}"
-        )
-        try:
-            response = requests.get(
-                article_url,
-                headers=settings.REQUEST_HEADERS,
-                timeout=settings.REQUEST_TIMEOUT,
-                allow_redirects=True,
-            )
-            response.raise_for_status()
-
-            content_type = response.headers.get("content-type", "").lower()
-            if "html" not in content_type:
-                logging.warning(
-                    f"Content type is not HTML ({content_type}), skipping image parse for {article_url}"
-                )
-                return None
-
-            soup = BeautifulSoup(response.text, "lxml")
-            og_image_tag = soup.find("meta", property="og:image")
-
-            if og_image_tag and og_image_tag.get("content"):
-                image_url = og_image_tag["content"]
-                if image_url.startswith("/"):
-                    image_url = urljoin(article_url, image_url)
-                logging.info(f"Found og:image on page: {image_url}")
-                return image_url
-            else:
-                logging.info(f"No og:image tag found on page: {article_url}")
-
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Failed to fetch article page {article_url}: {e}")
-        except Exception as e:
-            logging.error(f"Error parsing page {article_url} for image: {e}")
-
-    return None
-
-
-def format_base_message(entry):
-    """Formats the core English message parts from an RSS entry."""
-    title = entry.get("title", "No Title")
-    link = entry.get("link", "#")
-    summary = entry.get("summary", "")
-
-    if "<" in summary:
-        summary_soup = BeautifulSoup(summary, "html.parser")
-        summary = summary_soup.get_text(separator=" ", strip=True)
-    if len(summary) > 300:
-        summary = summary[:300].rsplit(" ", 1)[0] + "..."
-
-    return title, summary, link
-
-
-def create_final_message(
-    post_title,
-    post_summary,
-    en_post_title,
-    en_post_summary,
-    rupost_title,
-    rupost_summary,
-    article_link,
-):
-    """Constructs the final message text with translations and hashtags."""
-    hashtags = set()
-    combined_text_uz = (post_title + " " + post_summary).lower()
-    if "sun'iy intellekt" in combined_text_uz or "si " in combined_text_uz:
-        hashtags.add("#SuniyIntellekt")
-    if "innovat" in combined_text_uz:
-        hashtags.add("#Innovatsiya")
-    if "kelajak" in combined_text_uz:
-        hashtags.add("#Kelajak")
-    if not hashtags:
-        hashtags.add("#Yangilik")
-
-    hashtag_string = " ".join(sorted(list(hashtags)))
-
-    return (
-        f"🇺🇿:\n<b>{post_title}</b>\n\n"
-        f"{post_summary}\n\n"
-        "======================================\n\n"
-        f"🇺🇸:\n<b>{en_post_title}</b>\n\n"
-        f"<i>{en_post_summary}</i>\n\n"
-        "======================================\n\n"
-        f"🇷🇺:\n<b>{rupost_title}</b>\n\n"
-        f"<i>{rupost_summary}</i>\n\n"
-        f"<a href='{article_link}'>Batafsil o'qish</a>\n\n"
-        f"{hashtag_string}\n"
-        f"📰 PressLeaf - https://t.me/pressleaf. "
-    )
-
-
-async def post_article(client, target_entity, entry, posted_links):
-    """Processes a single article: formats, translates, and posts it."""
-    link = entry.get("link")
-    title = entry.get("title")
-
-    if not link or not title or link in posted_links:
-        return False
-
-    published_dt = None
-    if entry.get("published_parsed"):
-        try:
-            published_dt = datetime.fromtimestamp(
-                time.mktime(entry.get("published_parsed"))
-            )
-        except Exception:
-            pass
-
-    cutoff_time = datetime.now() - timedelta(hours=settings.MAX_ARTICLE_AGE_HOURS)
-    if published_dt and published_dt < cutoff_time:
-        return False
-
-    summary_en = entry.get("summary", "")
-    if not (
-        contains_keywords(title, settings.KEYWORDS)
-        or contains_keywords(summary_en, settings.KEYWORDS)
-    ):
-        return False
-
-    logging.info(f"Found relevant article: {title} ({link})")
-
-    en_title, en_summary, article_link = format_base_message(entry)
-
-    post_title = translate_text(en_title, target_lang="uz", translator_backend="bing")
-    post_summary = translate_text(
-        en_summary, target_lang="uz", translator_backend="bing"
-    )
-    rupost_title = translate_text(en_title, target_lang="ru", translator_backend="bing")
-    rupost_summary = translate_text(
-        en_summary, target_lang="ru", translator_backend="bing"
-    )
-
-    final_message = create_final_message(
-        post_title,
-        post_summary,
-        en_title,
-        en_summary,
-        rupost_title,
-        rupost_summary,
-        article_link,
-    )
-
-    image_to_post = extract_image_url(entry, article_link)
-
-    try:
-        if image_to_post:
-            await client.send_file(
-                entity=target_entity,
-                file=image_to_post,
-                caption=final_message,
-                parse_mode="html",
-                link_preview=True,
-            )
-        else:
-            await client.send_message(
-                entity=target_entity,
-                message=final_message,
-                parse_mode="html",
-                link_preview=True,
-            )
-        logging.info(f"Successfully posted to {settings.CHANNEL_USERNAME}: {en_title}")
-        return True
-
-    except (PhotoInvalidError, WebpageCurlFailedError) as img_err:
-        logging.warning(
-            f"Failed to send with image {image_to_post}: {img_err}. Attempting text-only post."
-        )
-        try:
-            await client.send_message(
-                target_entity, final_message, parse_mode="html", link_preview=True
-            )
-            logging.info(f"Successfully posted text-only fallback for {en_title}")
-            return True
-        except Exception as fallback_err:
-            logging.error(
-                f"Failed to send text-only fallback for {link}: {fallback_err}"
-            )
-    except MediaCaptionTooLongError:
-        logging.warning(
-            f"Caption too long for {link}. Trying to shorten and resend text-only."
-        )
-        # Implement shortening logic if necessary
-    except FloodWaitError as fwe:
-        logging.warning(f"Flood wait error: sleeping for {fwe.seconds} seconds.")
-        await asyncio.sleep(fwe.seconds + 5)
-    except Exception as e:
-        logging.error(f"Generic error sending message for {link}: {e}")
-
-    return False
-
-
-async def fetch_and_post_news(client):
-    """Fetches news from RSS feeds and posts new articles."""
-    posted_links = load_posted_links()
-    new_links_posted_count = 0
-
-    try:
-        target_entity = await client.get_entity(settings.CHANNEL_USERNAME)
-    except Exception as e:
-        logging.error(f"Failed to get entity '{settings.CHANNEL_USERNAME}': {e}")
-        return
-
-    logging.info(f"Checking {len(settings.RSS_FEEDS)} RSS feeds...")
-    for feed_url in settings.RSS_FEEDS:
-        try:
-            logging.info(f"Parsing feed: {feed_url}")
-            feed = feedparser.parse(feed_url)
-            if feed.bozo:
-                logging.warning(
-                    f"Feed potentially malformed: {feed_url} - Reason: {feed.bozo_exception}"
-                )
-
-            for entry in feed.entries:
-                if await post_article(client, target_entity, entry, posted_links):
-                    posted_links.add(entry.get("link"))
-                    new_links_posted_count += 1
-                    save_posted_links(posted_links)
-                    await asyncio.sleep(15)
-
-        except Exception as e:
-            logging.error(f"Failed to process feed {feed_url}: {e}")
-
-    logging.info(f"Feed check complete. Posted {new_links_posted_count} new articles.")
-
-
-async def main():
-    """Main function to connect to Telegram and start the news posting loop."""
-    load_dotenv()
-    try:
-        api_id = int(os.getenv("API_ID"))
-        api_hash = os.getenv("API_HASH")
-        phone_number = os.getenv("PHONE_NUMBER")
-    except (TypeError, ValueError):
-        logging.error(
-            "Could not load credentials from environment variables. Please check your .env file."
-        )
-        return
-
-    client = TelegramClient("noxrex_session", api_id, api_hash)
-
-    logging.info("Connecting to Telegram...")
-    await client.connect()
-
-    if not await client.is_user_authorized():
-        logging.info("First run: Authorization required.")
-        await client.send_code_request(phone_number)
-        code = input("Enter the code you received: ")
-        try:
-            await client.sign_in(phone_number, code)
-        except SessionPasswordNeededError:
-            password = getpass.getpass("Enter your Telegram password (2FA): ")
-            await client.sign_in(password=password)
-        except Exception as e:
-            logging.error(f"Failed to sign in: {e}")
-            await client.disconnect()
-            return
-
-    logging.info("Authorization successful.")
-
-    while True:
-        await fetch_and_post_news(client)
-        logging.info(
-            f"Scheduler finished. Waiting for {settings.CHECK_INTERVAL_SECONDS / 60:.0f} minutes."
-        )
-        await asyncio.sleep(settings.CHECK_INTERVAL_SECONDS)
-
-
-if __name__ == "__main__":
-    asyncio.run(main())
+import asyncio
+import calendar
+import io
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime
+from email.utils import mktime_tz, parsedate_tz
+import getpass
+from functools import lru_cache
+from urllib.parse import urljoin, urlparse
+
+import aiohttp
+from dotenv import dotenv_values
+from lxml import etree
+from telethon import TelegramClient
+from telethon.errors import (
+    FloodWaitError,
+    SessionPasswordNeededError,
+    PhotoInvalidError,
+    WebpageCurlFailedError,
+    MediaCaptionTooLongError,
+)
+
+import settings
+
+# Without a preset region, importing translators makes a blocking geolocation
+# request to pick its backend hosts
+os.environ.setdefault("translators_default_region", settings.TRANSLATOR_REGION)
+
+# feedparser, bs4 and translators are imported where they are used, so
+# starting the bot does not pay for them before the first check cycle
+
+# Uzbek hashtag triggers, scanned in a single pass over the message text
+HASHTAG_TRIGGERS = {
+    "sun'iy intellekt": "#SuniyIntellekt",
+    "si ": "#SuniyIntellekt",
+    "innovat": "#Innovatsiya",
+    "kelajak": "#Kelajak",
+}
+DEFAULT_HASHTAGS = frozenset({"#Yangilik"})
+
+# Fixed message pieces shared by every post
+FLAG_UZ, FLAG_US, FLAG_RU = "🇺🇿", "🇺🇸", "🇷🇺"
+SECTION_SEPARATOR = "======================================\n\n"
+CHANNEL_SIGNATURE = "📰 PressLeaf - https://t.me/pressleaf. "
+
+# The og:image tag lives in <head>, which fits in the first few KB of a page
+PAGE_HEAD_BYTES = 32768
+
+# Image URLs are checked with a quick HEAD request before Telegram fetches them
+IMAGE_CHECK_TIMEOUT = 3
+IMAGE_CHECK_CACHE_SIZE = 1024
+BAD_IMAGE_HOST_FAILURES = 2  # Failures in one cycle before a host is skipped
+
+# Feed XML namespaces and the entry tags parse_feed streams over
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+MEDIA_NS = "{http://search.yahoo.com/mrss/}"
+FEED_ENTRY_TAGS = ("item", f"{ATOM_NS}entry")
+
+# Posting pipeline: translator workers feed a single rate-limited poster
+TRANSLATOR_WORKERS = 3
+PIPELINE_QUEUE_SIZE = 5
+
+try:
+    import ahocorasick
+except ImportError:  # Optional speedup, fall back to a compiled regex
+    ahocorasick = None
+
+# --- Logging Setup ---
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+# --- Helper Functions ---
+@lru_cache(maxsize=1)
+def get_env():
+    """Reads the .env file once; real environment variables take precedence."""
+    return {**dotenv_values(), **os.environ}
+
+
+def load_posted_links():
+    """Loads the set of already posted links from the file."""
+    try:
+        with open(settings.POSTED_LINKS_FILE, "r") as f:
+            return set(line.strip() for line in f)
+    except FileNotFoundError:
+        return set()
+
+
+# Links posted so far; loaded once and extended in place as articles are posted
+POSTED_LINKS = load_posted_links()
+
+# Image URL check results (LRU) and the hosts that keep failing this cycle
+IMG_VALID_CACHE = OrderedDict()
+IMG_HOST_FAILURES = {}
+BAD_IMG_HOSTS = set()
+
+
+def open_posted_links_log():
+    """Opens the posted links file for appending, returning a raw descriptor."""
+    return os.open(
+        settings.POSTED_LINKS_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+    )
+
+
+def save_posted_link(posted_fd, link):
+    """Appends a posted link with a single unbuffered, atomic append write."""
+    os.write(posted_fd, f"{link}\n".encode())
+
+
+def build_keyword_matcher(keywords):
+    """Builds a single multi-pattern matcher that scans text in one pass."""
+    keywords = [keyword.lower() for keyword in keywords if keyword]
+    if not keywords:
+        return lambda text: False
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+
+    pattern = re.compile("|".join(map(re.escape, keywords)))
+    return lambda text: pattern.search(text) is not None
+
+
+KEYWORD_MATCHER = build_keyword_matcher(settings.KEYWORDS)
+
+
+def build_hashtag_matcher(triggers):
+    """Builds a one-pass scanner returning the hashtags whose triggers occur."""
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for trigger, hashtag in triggers.items():
+            automaton.add_word(trigger, hashtag)
+        automaton.make_automaton()
+        return lambda text: frozenset(hashtag for _, hashtag in automaton.iter(text))
+
+    pattern = re.compile("|".join(map(re.escape, triggers)))
+    return lambda text: frozenset(
+        triggers[match.group()] for match in pattern.finditer(text)
+    )
+
+
+HASHTAG_MATCHER = build_hashtag_matcher(HASHTAG_TRIGGERS)
+
+
+def derive_hashtags(text, matcher=HASHTAG_MATCHER):
+    """Returns the hashtags triggered by the (Uzbek) text, or the default tag."""
+    return matcher(text.lower()) or DEFAULT_HASHTAGS
+
+
+@lru_cache(maxsize=None)
+def join_hashtags(hashtags):
+    """Joins a hashtag set into sorted display order; only a few sets occur."""
+    return " ".join(sorted(hashtags))
+
+
+def contains_keywords(text, matcher=KEYWORD_MATCHER):
+    """Checks if the text contains any of the configured keywords."""
+    if not text:
+        return False
+    return matcher(text.lower())
+
+
+def is_older_than(entry, cutoff_ts):
+    """Checks if the entry was published before the cutoff (a UTC timestamp)."""
+    published_parsed = entry.get("published_parsed")
+    # published_parsed is a UTC struct_time, so timegm (not mktime) applies
+    return bool(published_parsed) and calendar.timegm(published_parsed) < cutoff_ts
+
+
+def filter_relevant_entries(entries, posted_links, cutoff_ts, matcher=KEYWORD_MATCHER):
+    """Keeps the new, recent entries whose title or summary mentions a keyword.
+
+    Checks run cheapest-first: the posted-link lookup, then the age check,
+    then the keyword scan. Title and summary are joined and scanned
+    together, so each entry costs one matcher call instead of two.
+    """
+    relevant = []
+    for entry in entries:
+        link = entry.get("link")
+        title = entry.get("title")
+        if not link or not title or link in posted_links:
+            continue
+        if is_older_than(entry, cutoff_ts):
+            continue
+        if not contains_keywords(f"{title}\n{entry.get('summary', '')}", matcher):
+            continue
+        relevant.append(entry)
+    return relevant
+
+
+@lru_cache(maxsize=1024)
+def _translate_cached(text, target_lang, source_lang, translator_backend):
+    """Calls the translation backend. Failures raise, so they are never cached."""
+    import translators as ts
+
+    return ts.translate_text(
+        text,
+        translator=translator_backend,
+        from_language=source_lang,
+        to_language=target_lang,
+    )
+
+
+def warm_up_translator(translator_backend="bing"):
+    """Opens the translator backend's session before the workers share it.
+
+    translators keeps one session per backend and rebuilds it when it goes
+    stale by fetching the backend's host page. Priming it once per cycle lets
+    the concurrent translation calls reuse that session instead of each
+    rebuilding it at the same time.
+    """
+    if not settings.ENABLE_TRANSLATION:
+        return
+    import translators as ts
+
+    try:
+        ts.translate_text(
+            "news",
+            translator=translator_backend,
+            from_language="en",
+            to_language=settings.TARGET_LANGUAGE,
+        )
+    except Exception as e:
+        logging.warning(f"Translator warm-up with {translator_backend} failed: {e}")
+
+
+def translate_text(
+    text, target_lang="uz", source_lang="en", translator_backend="google"
+):
+    """Translates text using the 'translators' library."""
+    if not text or not settings.ENABLE_TRANSLATION:
+        return text
+    try:
+        logging.info(f"Attempting translation with backend: {translator_backend}")
+        translated = _translate_cached(
+            text, target_lang, source_lang, translator_backend
+        )
+        logging.info(
+            f"Translated to {target_lang} using {translator_backend}: {translated[:50]}..."
+        )
+        return translated
+    except Exception as e:
+        logging.error(
+            f"Translation failed with backend {translator_backend}: {e}. Returning original text."
+        )
+        return text
+
+
+async def read_page_head(response, limit=PAGE_HEAD_BYTES):
+    """Reads a streamed response until </head> is seen or `limit` bytes arrive."""
+    head = bytearray()
+    async for chunk in response.content.iter_chunked(8192):
+        head += chunk
+        if b"</head>" in head[-len(chunk) - 7 :].lower() or len(head) >= limit:
+            break
+    return bytes(head)
+
+
+@lru_cache(maxsize=1)
+def og_image_strainer():
+    """Only <meta property="og:image"> tags are needed from article pages."""
+    from bs4 import SoupStrainer
+
+    return SoupStrainer("meta", property="og:image")
+
+
+async def extract_image_url(session, entry, article_url):
+    """Tries to find a suitable image URL from the RSS feed or article page."""
+    if not settings.ENABLE_IMAGE_FETCHING:
+        return None
+
+    # 1. Check RSS feed for standard media tags
+    for key in ["media_content", "media_thumbnail", "enclosures"]:
+        if key in entry:
+            for item in entry[key]:
+                if "url" in item and "image" in item.get("medium", ""):
+                    url = item["url"]
+                    logging.info(f"Found image in RSS {key}: {url}")
+                    return url
+                if "href" in item and "image" in item.get("type", ""):
+                    url = item["href"]
+                    logging.info(f"Found image in RSS {key}: {url}")
+                    return url
+
+    # 2. If not in RSS, fetch the article page and look for an Open Graph image
+    if article_url:
+        logging.info(
+            f"No image in RSS feed, attempting to fetch from page: {article_url}"
+        )
+        try:
+            async with session.get(
+                article_url,
+                headers={"Range": f"bytes=0-{PAGE_HEAD_BYTES - 1}"},
+                allow_redirects=True,
+            ) as response:
+                response.raise_for_status()
+
+                content_type = response.headers.get("content-type", "").lower()
+                if "html" not in content_type:
+                    logging.warning(
+                        f"Content type is not HTML ({content_type}), skipping image parse for {article_url}"
+                    )
+                    return None
+
+                page_head = await read_page_head(response)
+
+            from bs4 import BeautifulSoup
+
+            soup = BeautifulSoup(page_head, "lxml", parse_only=og_image_strainer())
+            og_image_tag = soup.find("meta", property="og:image")
+
+            if og_image_tag and og_image_tag.get("content"):
+                image_url = og_image_tag["content"]
+                if image_url.startswith("/"):
+                    image_url = urljoin(article_url, image_url)
+                logging.info(f"Found og:image on page: {image_url}")
+                return image_url
+            else:
+                logging.info(f"No og:image tag found on page: {article_url}")
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.error(f"Failed to fetch article page {article_url}: {e}")
+        except Exception as e:
+            logging.error(f"Error parsing page {article_url} for image: {e}")
+
+    return None
+
+
+def record_image_host_failure(image_url):
+    """Counts a failed image from this host; repeat offenders are skipped."""
+    host = urlparse(image_url).netloc
+    IMG_HOST_FAILURES[host] = IMG_HOST_FAILURES.get(host, 0) + 1
+    if IMG_HOST_FAILURES[host] >= BAD_IMAGE_HOST_FAILURES:
+        BAD_IMG_HOSTS.add(host)
+
+
+async def is_valid_image_url(session, image_url):
+    """Checks with a HEAD request that the URL serves an image Telegram can fetch."""
+    if urlparse(image_url).netloc in BAD_IMG_HOSTS:
+        return False
+
+    valid = IMG_VALID_CACHE.get(image_url)
+    if valid is not None:
+        IMG_VALID_CACHE.move_to_end(image_url)
+        return valid
+
+    # Only definitive answers are cached; timeouts and server errors may pass
+    definitive = True
+    try:
+        async with session.head(
+            image_url,
+            allow_redirects=True,
+            timeout=aiohttp.ClientTimeout(total=IMAGE_CHECK_TIMEOUT),
+        ) as response:
+            if response.status in (405, 501):
+                # The server does not answer HEAD; leave it to Telegram
+                valid = True
+            else:
+                content_type = response.headers.get("content-type", "")
+                valid = response.status == 200 and content_type.startswith("image/")
+                definitive = response.status < 500
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        valid = definitive = False
+
+    if definitive:
+        IMG_VALID_CACHE[image_url] = valid
+        if len(IMG_VALID_CACHE) > IMAGE_CHECK_CACHE_SIZE:
+            IMG_VALID_CACHE.popitem(last=False)
+    if not valid:
+        record_image_host_failure(image_url)
+    return valid
+
+
+def format_base_message(entry):
+    """Formats the core English message parts from an RSS entry."""
+    title = entry.get("title", "No Title")
+    link = entry.get("link", "#")
+    summary = entry.get("summary", "")
+
+    if "<" in summary:
+        from bs4 import BeautifulSoup
+
+        summary_soup = BeautifulSoup(summary, "lxml")
+        summary = summary_soup.get_text(separator=" ", strip=True)
+    if len(summary) > 300:
+        summary = summary[:300].rsplit(" ", 1)[0] + "..."
+
+    return title, summary, link
+
+
+def create_final_message(
+    post_title,
+    post_summary,
+    en_post_title,
+    en_post_summary,
+    rupost_title,
+    rupost_summary,
+    article_link,
+):
+    """Constructs the final message text with translations and hashtags."""
+    hashtag_string = join_hashtags(derive_hashtags(f"{post_title} {post_summary}"))
+
+    return (
+        f"{FLAG_UZ}:\n<b>{post_title}</b>\n\n"
+        f"{post_summary}\n\n"
+        f"{SECTION_SEPARATOR}"
+        f"{FLAG_US}:\n<b>{en_post_title}</b>\n\n"
+        f"<i>{en_post_summary}</i>\n\n"
+        f"{SECTION_SEPARATOR}"
+        f"{FLAG_RU}:\n<b>{rupost_title}</b>\n\n"
+        f"<i>{rupost_summary}</i>\n\n"
+        f"<a href='{article_link}'>Batafsil o'qish</a>\n\n"
+        f"{hashtag_string}\n"
+        f"{CHANNEL_SIGNATURE}"
+    )
+
+
+async def prepare_article(session, entry):
+    """Translates and formats an article, returning what the poster needs to send it."""
+    link = entry.get("link")
+    title = entry.get("title")
+
+    logging.info(f"Found relevant article: {title} ({link})")
+
+    en_title, en_summary, article_link = format_base_message(entry)
+
+    # The four translations are independent round-trips, so run them together
+    post_title, post_summary, rupost_title, rupost_summary = await asyncio.gather(
+        *(
+            asyncio.to_thread(translate_text, text, lang, "en", "bing")
+            for text, lang in (
+                (en_title, "uz"),
+                (en_summary, "uz"),
+                (en_title, "ru"),
+                (en_summary, "ru"),
+            )
+        )
+    )
+
+    final_message = create_final_message(
+        post_title,
+        post_summary,
+        en_title,
+        en_summary,
+        rupost_title,
+        rupost_summary,
+        article_link,
+    )
+
+    image_to_post = await extract_image_url(session, entry, article_link)
+    if image_to_post and not await is_valid_image_url(session, image_to_post):
+        logging.info(f"Image {image_to_post} failed validation, posting text-only.")
+        image_to_post = None
+
+    return link, en_title, final_message, image_to_post
+
+
+async def send_article(client, target_entity, prepared):
+    """Posts a prepared article to the channel, falling back to text-only."""
+    link, en_title, final_message, image_to_post = prepared
+
+    try:
+        if image_to_post:
+            await client.send_file(
+                entity=target_entity,
+                file=image_to_post,
+                caption=final_message,
+                parse_mode="html",
+                link_preview=True,
+            )
+        else:
+            await client.send_message(
+                entity=target_entity,
+                message=final_message,
+                parse_mode="html",
+                link_preview=True,
+            )
+        logging.info(f"Successfully posted to {settings.CHANNEL_USERNAME}: {en_title}")
+        return True
+
+    except (PhotoInvalidError, WebpageCurlFailedError) as img_err:
+        logging.warning(
+            f"Failed to send with image {image_to_post}: {img_err}. Attempting text-only post."
+        )
+        record_image_host_failure(image_to_post)
+        try:
+            await client.send_message(
+                target_entity, final_message, parse_mode="html", link_preview=True
+            )
+            logging.info(f"Successfully posted text-only fallback for {en_title}")
+            return True
+        except Exception as fallback_err:
+            logging.error(
+                f"Failed to send text-only fallback for {link}: {fallback_err}"
+            )
+    except MediaCaptionTooLongError:
+        logging.warning(
+            f"Caption too long for {link}. Trying to shorten and resend text-only."
+        )
+        # Implement shortening logic if necessary
+    except FloodWaitError as fwe:
+        logging.warning(f"Flood wait error: sleeping for {fwe.seconds} seconds.")
+        await asyncio.sleep(fwe.seconds + 5)
+    except Exception as e:
+        logging.error(f"Generic error sending message for {link}: {e}")
+
+    return False
+
+
+def _element_text(elem):
+    """Returns the stripped text of an element, including nested markup."""
+    if elem is None:
+        return ""
+    return "".join(elem.itertext()).strip()
+
+
+def _parse_feed_date(value):
+    """Parses an RSS (RFC 822) or Atom (ISO 8601) date into a UTC struct_time."""
+    if not value:
+        return None
+    parsed = parsedate_tz(value)
+    if parsed:
+        return time.gmtime(mktime_tz(parsed))
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        return dt.timetuple()
+    return time.gmtime(dt.timestamp())
+
+
+def _parse_feed_entry(elem):
+    """Extracts the fields the bot uses from an RSS <item> or Atom <entry>."""
+    if elem.tag == "item":
+        title = _element_text(elem.find("title"))
+        link = _element_text(elem.find("link"))
+        summary = _element_text(elem.find("description"))
+        published = _element_text(elem.find("pubDate"))
+        enclosures = [
+            {"href": enc.get("url", ""), "type": enc.get("type", "")}
+            for enc in elem.iterfind("enclosure")
+        ]
+    else:
+        title = _element_text(elem.find(f"{ATOM_NS}title"))
+        link = ""
+        enclosures = []
+        for link_elem in elem.iterfind(f"{ATOM_NS}link"):
+            rel = link_elem.get("rel", "alternate")
+            if rel == "alternate" and not link:
+                link = link_elem.get("href", "")
+            elif rel == "enclosure":
+                enclosures.append(
+                    {"href": link_elem.get("href", ""), "type": link_elem.get("type", "")}
+                )
+        summary = _element_text(elem.find(f"{ATOM_NS}summary")) or _element_text(
+            elem.find(f"{ATOM_NS}content")
+        )
+        published = _element_text(elem.find(f"{ATOM_NS}published"))
+
+    entry = {
+        "title": title,
+        "link": link,
+        "summary": summary,
+        "published_parsed": _parse_feed_date(published),
+    }
+    media_content = [dict(m.attrib) for m in elem.iter(f"{MEDIA_NS}content")]
+    if media_content:
+        entry["media_content"] = media_content
+    media_thumbnail = [dict(m.attrib) for m in elem.iter(f"{MEDIA_NS}thumbnail")]
+    if media_thumbnail:
+        entry["media_thumbnail"] = media_thumbnail
+    if enclosures:
+        entry["enclosures"] = enclosures
+    return entry
+
+
+def parse_feed(body, feed_url=""):
+    """Parses RSS/Atom bytes into entry dicts shaped like feedparser's.
+
+    Streams over the entries with lxml and frees each one once it is read.
+    Malformed feeds, and formats without RSS 2.0 items or Atom entries, fall
+    back to feedparser.
+    """
+    entries = []
+    try:
+        for _, elem in etree.iterparse(
+            io.BytesIO(body), tag=FEED_ENTRY_TAGS, resolve_entities=False
+        ):
+            entries.append(_parse_feed_entry(elem))
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    except etree.XMLSyntaxError as e:
+        logging.warning(f"Feed potentially malformed: {feed_url} - Reason: {e}")
+        return _parse_feed_fallback(body)
+    return entries or _parse_feed_fallback(body)
+
+
+def _parse_feed_fallback(body):
+    """Parses a feed the lxml path cannot handle with feedparser."""
+    import feedparser
+
+    return feedparser.parse(body).entries
+
+
+async def fetch_feed(session, feed_url):
+    """Downloads a feed and parses it in a worker thread."""
+    logging.info(f"Fetching feed: {feed_url}")
+    async with session.get(feed_url) as response:
+        response.raise_for_status()
+        body = await response.read()
+    return await asyncio.to_thread(parse_feed, body, feed_url)
+
+
+async def fetch_and_post_news(client, session, posted_fd):
+    """Fetches news from RSS feeds and posts new articles.
+
+    Runs as a pipeline: the producer queues relevant entries, translator
+    workers prepare them, and a single poster sends them one at a time. The
+    next articles are translated while the poster waits out its rate limit.
+    """
+    posted_links = POSTED_LINKS
+    new_links_posted_count = 0
+
+    try:
+        target_entity = await client.get_entity(settings.CHANNEL_USERNAME)
+    except Exception as e:
+        logging.error(f"Failed to get entity '{settings.CHANNEL_USERNAME}': {e}")
+        return
+
+    cutoff_ts = time.time() - settings.MAX_ARTICLE_AGE_HOURS * 3600
+    # Bad image hosts are only skipped for the rest of the cycle they failed in
+    IMG_HOST_FAILURES.clear()
+    BAD_IMG_HOSTS.clear()
+    filter_q = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    post_q = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+
+    async def producer():
+        queued_links = set()
+        logging.info(f"Checking {len(settings.RSS_FEEDS)} RSS feeds...")
+        feeds = await asyncio.gather(
+            *(fetch_feed(session, feed_url) for feed_url in settings.RSS_FEEDS),
+            return_exceptions=True,
+        )
+
+        for feed_url, entries in zip(settings.RSS_FEEDS, feeds):
+            if isinstance(entries, Exception):
+                logging.error(f"Failed to fetch feed {feed_url}: {entries}")
+                continue
+            try:
+                for entry in filter_relevant_entries(
+                    entries, posted_links, cutoff_ts
+                ):
+                    # The same story often appears in several feeds
+                    link = entry.get("link")
+                    if link in queued_links:
+                        continue
+                    queued_links.add(link)
+                    await filter_q.put(entry)
+
+            except Exception as e:
+                logging.error(f"Failed to process feed {feed_url}: {e}")
+
+        # Tell each translator there is no more input
+        for _ in range(TRANSLATOR_WORKERS):
+            await filter_q.put(None)
+
+    warm_up = None
+
+    async def translator():
+        nonlocal warm_up
+        while (entry := await filter_q.get()) is not None:
+            # Prime the translator session once, and only in cycles with work
+            if warm_up is None:
+                warm_up = asyncio.create_task(
+                    asyncio.to_thread(warm_up_translator, "bing")
+                )
+            await warm_up
+            try:
+                prepared = await prepare_article(session, entry)
+            except Exception as e:
+                logging.error(f"Failed to prepare article {entry.get('link')}: {e}")
+                continue
+            if prepared:
+                await post_q.put(prepared)
+
+    async def translators():
+        await asyncio.gather(*(translator() for _ in range(TRANSLATOR_WORKERS)))
+        await post_q.put(None)
+
+    async def poster():
+        nonlocal new_links_posted_count
+        while (prepared := await post_q.get()) is not None:
+            link = prepared[0]
+            try:
+                posted = await send_article(client, target_entity, prepared)
+            except Exception as e:
+                logging.error(f"Failed to post article {link}: {e}")
+                continue
+            if posted:
+                posted_links.add(link)
+                new_links_posted_count += 1
+                try:
+                    save_posted_link(posted_fd, link)
+                except OSError as e:
+                    logging.error(f"Failed to record posted link {link}: {e}")
+                await asyncio.sleep(15)
+
+    stages = [asyncio.create_task(stage) for stage in (producer(), translators(), poster())]
+    try:
+        # A stage that dies leaves the others blocked on its queue, so stop them
+        # all; the end-of-input markers are only sent when a stage finishes normally
+        await asyncio.wait(stages, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for stage in stages:
+            stage.cancel()
+        results = await asyncio.gather(*stages, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logging.error(f"News pipeline stage failed: {result}")
+
+    logging.info(f"Feed check complete. Posted {new_links_posted_count} new articles.")
+
+
+async def main():
+    """Main function to connect to Telegram and start the news posting loop."""
+    env = get_env()
+    try:
+        api_id = int(env.get("API_ID"))
+        api_hash = env.get("API_HASH")
+        phone_number = env.get("PHONE_NUMBER")
+    except (TypeError, ValueError):
+        logging.error(
+            "Could not load credentials from environment variables. Please check your .env file."
+        )
+        return
+
+    client = TelegramClient("noxrex_session", api_id, api_hash)
+
+    logging.info("Connecting to Telegram...")
+    await client.connect()
+
+    if not await client.is_user_authorized():
+        logging.info("First run: Authorization required.")
+        await client.send_code_request(phone_number)
+        code = input("Enter the code you received: ")
+        try:
+            await client.sign_in(phone_number, code)
+        except SessionPasswordNeededError:
+            password = getpass.getpass("Enter your Telegram password (2FA): ")
+            await client.sign_in(password=password)
+        except Exception as e:
+            logging.error(f"Failed to sign in: {e}")
+            await client.disconnect()
+            return
+
+    logging.info("Authorization successful.")
+
+    # One pooled HTTP session for feeds and article pages, kept for the whole run
+    session = aiohttp.ClientSession(
+        headers=settings.REQUEST_HEADERS,
+        timeout=aiohttp.ClientTimeout(total=settings.REQUEST_TIMEOUT),
+        connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+    )
+    posted_fd = open_posted_links_log()
+    try:
+        async with session:
+            while True:
+                await fetch_and_post_news(client, session, posted_fd)
+                logging.info(
+                    f"Scheduler finished. Waiting for {settings.CHECK_INTERVAL_SECONDS / 60:.0f} minutes."
+                )
+                await asyncio.sleep(settings.CHECK_INTERVAL_SECONDS)
+    finally:
+        os.close(posted_fd)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,20 +1,19 @@
-"""Application launcher script."""
-
-import asyncio
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
-
-from src.main import main
-
-if __name__ == "__main__":
-    """Run the application."""
-    try:
-        asyncio.run(main())
-    except KeyboardInterrupt:
-        print("\nApplication stopped by user")
-    except Exception as e:
-        print(f"Fatal error: {e}")
-        sys.exit(1)
+"""Application launcher script."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.main import run_main
+
+if __name__ == "__main__":
+    """Run the application."""
+    try:
+        run_main()
+    except KeyboardInterrupt:
+        print("\nApplication stopped by user")
+    except Exception as e:
+        print(f"Fatal error: {e}")
+        sys.exit(1)
@@ -1,5 +1,5 @@
-"""Source package."""
-
-__version__ = "2.0.0"
-__author__ = "Telegram Autoposting Bot"
-__description__ = "Professional Telegram autoposting bot with multi-language support"
+"""Source package."""
+
+__version__ = "2.0.0"
+__author__ = "Telegram Autoposting Bot"
+__description__ = "Professional Telegram autoposting bot with multi-language support"
@@ -1,38 +1,45 @@
-"""Logging configuration using Loguru."""
-
-import sys
-from pathlib import Path
-from loguru import logger
-from src.config.settings import settings
-
-
-def setup_logging():
-    """Configure logging with rotation and formatting."""
-    
-    # Remove default handler
-    logger.remove()
-    
-    # Console handler with colors
-    logger.add(
-        sys.stdout,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-        level=settings.log_level,
-        colorize=True,
-    )
-    
-    # File handler with rotation
-    log_dir = Path("data/logs")
-    log_dir.mkdir(parents=True, exist_ok=True)
-    
-    logger.add(
-        log_dir / "autopost.log",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-        level=settings.log_level,
-        rotation=settings.log_rotation,
-        retention=settings.log_retention,
-        compression="zip",
-        encoding="utf-8",
-    )
-    
-    logger.info("Logging configured successfully")
-    return logger
+"""Logging configuration using Loguru."""
+
+import sys
+from pathlib import Path
+from loguru import logger
+from src.config.settings import settings
+
+
+def setup_logging():
+    """
+    Configure logging with rotation and formatting.
+    
+    Sinks are enqueued: records are written by a background thread, so file
+    and console I/O stay off the event loop.
+    """
+    
+    # Remove default handler
+    logger.remove()
+    
+    # Console handler with colors
+    logger.add(
+        sys.stdout,
+        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        level=settings.log_level,
+        colorize=True,
+        enqueue=True,
+    )
+    
+    # File handler with rotation
+    log_dir = Path("data/logs")
+    log_dir.mkdir(parents=True, exist_ok=True)
+    
+    logger.add(
+        log_dir / "autopost.log",
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        level=settings.log_level,
+        rotation=settings.log_rotation,
+        retention=settings.log_retention,
+        compression="zip",
+        encoding="utf-8",
+        enqueue=True,
+    )
+    
+    logger.info("Logging configured successfully")
+    return logger
@@ -1,15 +1,15 @@
-"""Core package."""
-
-from src.core.content_formatter import ContentFormatter
-from src.core.article_processor import ArticleProcessor
-from src.core.scheduler import Scheduler
-from src.core.article_scorer import ArticleScorer
-from src.core.content_library import ContentLibrary
-
-__all__ = [
-    "ContentFormatter",
-    "ArticleProcessor",
-    "Scheduler",
-    "ArticleScorer",
-    "ContentLibrary",
-]
+"""Core package."""
+
+from src.core.content_formatter import ContentFormatter
+from src.core.article_processor import ArticleProcessor
+from src.core.scheduler import Scheduler
+from src.core.article_scorer import ArticleScorer
+from src.core.content_library import ContentLibrary
+
+__all__ = [
+    "ContentFormatter",
+    "ArticleProcessor",
+    "Scheduler",
+    "ArticleScorer",
+    "ContentLibrary",
+]
@@ -1,115 +1,213 @@
-"""Article processor - orchestrates the article processing pipeline."""
-
-from typing import Dict, Any, Optional
-from loguru import logger
-
-from src.services.rss_service import RSSService
-from src.services.groq_service import GroqService
-from src.services.image_service import ImageService
-from src.core.content_formatter import ContentFormatter
-
-
-class ArticleProcessor:
-    """Processes articles through the complete pipeline."""
-    
-    def __init__(self):
-        """Initialize the article processor."""
-        self.rss_service = RSSService()
-        self.groq_service = GroqService()
-        self.image_service = ImageService()
-        self.formatter = ContentFormatter()
-    
-    async def process_article(self, entry_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """
-        Process a single article through the complete pipeline.
-        
-        Args:
-            entry_data: Article data from RSS feed
-        
-        Returns:
-            Processed article data with message and image, or None if processing fails
-        """
-        try:
-            title = entry_data["title"]
-            summary = entry_data["summary"] or entry_data.get("description", "")
-            link = entry_data["link"]
-            raw_entry = entry_data.get("raw_entry")
-            
-            logger.info(f"Processing article: {title}")
-            
-            # Step 1: Generate AI Summary via Groq
-            logger.info("Generating AI summary via Groq...")
-            groq_content = await self.groq_service.generate_summary(
-                text=summary,
-                title=title,
-                link=link
-            )
-            
-            if not groq_content:
-                logger.warning("Groq generation failed, skipping article")
-                return None
-            
-            # Step 2: Format message
-            logger.info("Formatting message...")
-            # We pass the Groq result directly to formatter
-            message = self.formatter.format_message_groq(groq_content, link)
-            
-            # Step 3: Extract image
-            logger.info("Extracting image...")
-            image_url = None
-            if raw_entry:
-                image_url = self.image_service.extract_image(raw_entry, link)
-            
-            # Step 4: Validate message length
-            has_image = image_url is not None
-            if not self.formatter.validate_message_length(message, has_image):
-                logger.warning("Message too long, will attempt to send anyway")
-            
-            # Return processed data
-            processed_data = {
-                "title": groq_content["title"],
-                "summary": groq_content["summary"],
-                "link": link,
-                "published_at": entry_data.get("published_at"),
-                "message": message,
-                "image_url": image_url,
-                "raw_title": title # Store original for reference
-            }
-            
-            logger.success(f"Article processed successfully: {title}")
-            return processed_data
-            
-        except Exception as e:
-            logger.error(f"Failed to process article: {e}")
-            return None
-    
-    async def process_feed(self, feed_url: str) -> list:
-        """
-        Process all relevant articles from a feed.
-        
-        Args:
-            feed_url: RSS feed URL
-        
-        Returns:
-            List of processed articles
-        """
-        logger.info(f"Processing feed: {feed_url}")
-        
-        # Fetch relevant entries
-        entries = await self.rss_service.fetch_relevant_entries(feed_url)
-        
-        if not entries:
-            logger.info(f"No relevant entries found in feed: {feed_url}")
-            return []
-        
-        # Process each entry
-        processed_articles = []
-        for entry_data in entries:
-            processed = await self.process_article(entry_data)
-            if processed:
-                processed_articles.append(processed)
-        
-        logger.info(
-            f"Processed {len(processed_articles)} articles from {feed_url}"
-        )
-        return processed_articles
+"""Article processor - orchestrates the article processing pipeline."""
+
+import asyncio
+import hashlib
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+import aiohttp
+from loguru import logger
+
+from src.config.settings import settings
+
+
+class ArticleProcessor:
+    """Processes articles through the complete pipeline."""
+    
+    def __init__(self):
+        """Initialize the article processor; services are built on first use."""
+        # Caps in-flight Groq calls so concurrent articles stay under its rate limit
+        self._groq_semaphore = asyncio.Semaphore(settings.groq_concurrency)
+        # Caps feeds downloaded and parsed at once when a cycle fans out over all feeds
+        self._feed_semaphore = asyncio.Semaphore(settings.feed_concurrency)
+        # Shared HTTP connection pool for feeds and Groq, opened on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    @cached_property
+    def rss_service(self):
+        """RSS feed service."""
+        from src.services.rss_service import RSSService
+        return RSSService()
+    
+    @cached_property
+    def groq_service(self):
+        """Groq summary service."""
+        from src.services.groq_service import GroqService
+        return GroqService()
+    
+    @cached_property
+    def image_service(self):
+        """Image extraction service."""
+        from src.services.image_service import ImageService
+        return ImageService()
+    
+    @cached_property
+    def formatter(self):
+        """Telegram message formatter."""
+        from src.core.content_formatter import ContentFormatter
+        return ContentFormatter()
+    
+    @cached_property
+    def groq_cache(self):
+        """On-disk cache of Groq output; feeds re-serve the same items across polls."""
+        from src.utils.cache import PersistentCache
+        return PersistentCache(
+            str(Path(settings.cache_dir) / "groq"),
+            ttl_seconds=settings.groq_cache_days * 86400
+        )
+    
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it inside the running loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100, ttl_dns_cache=300, keepalive_timeout=60
+                )
+            )
+        return self._session
+    
+    async def close(self):
+        """Release resources held by the processor."""
+        if self._session is not None:
+            await self._session.close()
+        if "groq_cache" in self.__dict__:
+            self.groq_cache.close()
+    
+    async def process_article(self, entry_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Process a single article through the complete pipeline.
+        
+        Args:
+            entry_data: Article data from RSS feed
+        
+        Returns:
+            Processed article data with message and image, or None if processing fails
+        """
+        try:
+            title = entry_data["title"]
+            summary = entry_data["summary"] or entry_data.get("description", "")
+            link = entry_data["link"]
+            raw_entry = entry_data.get("raw_entry")
+            
+            logger.info(f"Processing article: {title}")
+            
+            # Step 1: Generate AI Summary via Groq
+            cache_key = hashlib.blake2b(
+                f"{title}\n{summary}".encode(), digest_size=16
+            ).hexdigest()
+            groq_content = self.groq_cache.get(cache_key)
+            if groq_content:
+                logger.info("Using cached AI summary")
+            else:
+                logger.info("Generating AI summary via Groq...")
+                async with self._groq_semaphore:
+                    groq_content = await self.groq_service.generate_summary(
+                        text=summary,
+                        title=title,
+                        link=link,
+                        session=self.session
+                    )
+                if groq_content:
+                    self.groq_cache.set(cache_key, groq_content)
+            
+            if not groq_content:
+                logger.warning("Groq generation failed, skipping article")
+                return None
+            
+            # Step 2: Format message
+            logger.info("Formatting message...")
+            # We pass the Groq result directly to formatter
+            message = self.formatter.format_message_groq(groq_content, link)
+            
+            # Step 3: Extract image
+            logger.info("Extracting image...")
+            image_url = None
+            if raw_entry:
+                image_url = await self.image_service.extract_image(raw_entry, link, self.session)
+            
+            # Step 4: Validate message length
+            has_image = image_url is not None
+            if not self.formatter.validate_message_length(message, has_image):
+                logger.warning("Message too long, will attempt to send anyway")
+            
+            # Return processed data
+            processed_data = {
+                "title": groq_content["title"],
+                "summary": groq_content["summary"],
+                "link": link,
+                "published_at": entry_data.get("published_at"),
+                "message": message,
+                "image_url": image_url,
+                "raw_title": title # Store original for reference
+            }
+            
+            logger.success(f"Article processed successfully: {title}")
+            return processed_data
+            
+        except Exception as e:
+            logger.error(f"Failed to process article: {e}")
+            return None
+    
+    async def process_feed(self, feed_url: str) -> list:
+        """
+        Process all relevant articles from a feed.
+        
+        Args:
+            feed_url: RSS feed URL
+        
+        Returns:
+            List of processed articles
+        """
+        logger.info(f"Processing feed: {feed_url}")
+        
+        # Fetch relevant entries
+        async with self._feed_semaphore:
+            entries = await self.rss_service.fetch_relevant_entries(feed_url, self.session)
+        
+        if not entries:
+            logger.info(f"No relevant entries found in feed: {feed_url}")
+            return []
+        
+        # Process entries concurrently; the Groq semaphore bounds the fan-out
+        results = await asyncio.gather(
+            *(self.process_article(entry_data) for entry_data in entries),
+            return_exceptions=True
+        )
+        processed_articles = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to process article: {result}")
+            elif result:
+                processed_articles.append(result)
+        
+        logger.info(
+            f"Processed {len(processed_articles)} articles from {feed_url}"
+        )
+        return processed_articles
+    
+    async def process_feeds(self, feed_urls: List[str]) -> Tuple[list, List[str]]:
+        """
+        Process several feeds concurrently.
+        
+        Args:
+            feed_urls: RSS feed URLs
+        
+        Returns:
+            Tuple of (processed articles from all feeds, URLs of feeds that failed)
+        """
+        results = await asyncio.gather(
+            *(self.process_feed(feed_url) for feed_url in feed_urls),
+            return_exceptions=True
+        )
+        
+        processed_articles = []
+        failed_feeds = []
+        for feed_url, result in zip(feed_urls, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error processing feed {feed_url}: {result}")
+                failed_feeds.append(feed_url)
+            else:
+                processed_articles.extend(result)
+        
+        return processed_articles, failed_feeds
@@ -1,225 +1,357 @@
-"""Article scoring and ranking system."""
-
-from datetime import datetime
-from typing import Dict, Any
-from urllib.parse import urlparse
-from loguru import logger
-
-
-class ArticleScorer:
-    """Scores articles by importance and relevance."""
-    
-    # Source reputation scores
-    SOURCE_SCORES = {
-        'techcrunch.com': 30,
-        'wired.com': 25,
-        'bbc.com': 20,
-        'cnet.com': 15,
-    }
-    
-    # High-impact keywords (worth more points)
-    HIGH_IMPACT_KEYWORDS = [
-        # AI & ML - highest priority
-        'ai', 'artificial intelligence', 'chatgpt', 'gpt-4', 'gpt-5', 'claude',
-        'gemini', 'llama', 'machine learning', 'deep learning', 'neural network',
-        'transformer', 'diffusion', 'stable diffusion', 'midjourney', 'dall-e',
-        # Major announcements
-        'breakthrough', 'major', 'announces', 'launches', 'releases', 'unveils',
-        'revolutionary', 'game-changing', 'first-ever', 'new model',
-        # Security & Important
-        'security breach', 'vulnerability', 'zero-day', 'hack', 'breach',
-        # Business
-        'acquisition', 'funding', 'ipo', 'billion', 'million', 'raises',
-        # Programming & Dev
-        'programming', 'python', 'javascript', 'rust', 'go', 'framework',
-        'open source', 'github', 'developer', 'coding',
-    ]
-    
-    # Major tech companies and AI labs
-    MAJOR_COMPANIES = [
-        # AI Labs (highest priority)
-        'openai', 'anthropic', 'deepmind', 'google ai', 'meta ai',
-        # Big Tech
-        'google', 'apple', 'microsoft', 'meta', 'facebook', 'amazon',
-        'tesla', 'nvidia', 'spacex', 'twitter', 'x corp',
-        # Important Tech
-        'samsung', 'intel', 'amd', 'qualcomm', 'arm',
-        'github', 'gitlab', 'stackoverflow', 'reddit',
-    ]
-    
-    @staticmethod
-    def extract_domain(url: str) -> str:
-        """Extract domain from URL."""
-        try:
-            parsed = urlparse(url)
-            return parsed.netloc.replace('www.', '')
-        except Exception:
-            return ''
-    
-    @staticmethod
-    def score_source(url: str) -> float:
-        """Score based on source reputation (0-30 points)."""
-        domain = ArticleScorer.extract_domain(url)
-        return ArticleScorer.SOURCE_SCORES.get(domain, 10)
-    
-    @staticmethod
-    def _get_text_content(content: Any) -> str:
-        """Extract text content from string or dict summary."""
-        if isinstance(content, str):
-            return content
-        if isinstance(content, dict):
-            parts = []
-            for key, value in content.items():
-                parts.append(str(key))
-                if isinstance(value, (list, tuple)):
-                    parts.extend([str(v) for v in value])
-                elif isinstance(value, dict):
-                    parts.append(ArticleScorer._get_text_content(value))
-                else:
-                    parts.append(str(value))
-            return " ".join(parts)
-        return str(content)
-
-    @staticmethod
-    def score_keywords(title: str, summary: Any) -> float:
-        """Score based on high-impact keywords (0-25 points)."""
-        summary_text = ArticleScorer._get_text_content(summary)
-        text = (title + ' ' + summary_text).lower()
-        score = 0
-        
-        for keyword in ArticleScorer.HIGH_IMPACT_KEYWORDS:
-            if keyword in text:
-                score += 5
-        
-        return min(score, 25)  # Cap at 25
-    
-    @staticmethod
-    def score_recency(published_at: datetime) -> float:
-        """Score based on article age (0-20 points)."""
-        if not published_at:
-            return 5  # Default for unknown age
-        
-        hours_old = (datetime.now() - published_at).total_seconds() / 3600
-        
-        if hours_old < 2:
-            return 20
-        elif hours_old < 6:
-            return 15
-        elif hours_old < 12:
-            return 10
-        elif hours_old < 24:
-            return 5
-        else:
-            return 0
-    
-    @staticmethod
-    def score_companies(title: str, summary: Any) -> float:
-        """Score based on major company mentions (0-15 points)."""
-        summary_text = ArticleScorer._get_text_content(summary)
-        text = (title + ' ' + summary_text).lower()
-        score = 0
-        
-        for company in ArticleScorer.MAJOR_COMPANIES:
-            if company in text:
-                score += 3
-        
-        return min(score, 15)  # Cap at 15
-    
-    @staticmethod
-    def score_engagement(title: str) -> float:
-        """Score based on engagement indicators (0-10 points)."""
-        engagement_words = ['breaking', 'exclusive', 'first', 'new', 'just']
-        title_lower = title.lower()
-        
-        if any(word in title_lower for word in engagement_words):
-            return 10
-        return 0
-    
-    @staticmethod
-    def score_article(article_data: Dict[str, Any]) -> float:
-        """
-        Calculate total article score (0-100).
-        
-        Components:
-        - Source reputation: 0-30 points
-        - High-impact keywords: 0-25 points
-        - Recency: 0-20 points
-        - Company mentions: 0-15 points
-        - Engagement indicators: 0-10 points
-        
-        Total: 0-100 points
-        """
-        title = article_data.get('title', '')
-        summary = article_data.get('summary', '')
-        link = article_data.get('link', '')
-        published_at = article_data.get('published_at')
-        
-        # Calculate component scores
-        source_score = ArticleScorer.score_source(link)
-        keyword_score = ArticleScorer.score_keywords(title, summary)
-        recency_score = ArticleScorer.score_recency(published_at)
-        company_score = ArticleScorer.score_companies(title, summary)
-        engagement_score = ArticleScorer.score_engagement(title)
-        
-        # Total score
-        total = source_score + keyword_score + recency_score + company_score + engagement_score
-        
-        logger.debug(
-            f"Article score: {total:.1f} | "
-            f"Source: {source_score} | Keywords: {keyword_score} | "
-            f"Recency: {recency_score} | Companies: {company_score} | "
-            f"Engagement: {engagement_score} | Title: {title[:50]}..."
-        )
-        
-        return min(total, 100)  # Cap at 100
-    
-    @staticmethod
-    def rank_articles(articles: list) -> list:
-        """
-        Rank articles by score (highest first).
-        
-        Args:
-            articles: List of article data dictionaries
-        
-        Returns:
-            List of articles sorted by score (descending)
-        """
-        # Score each article
-        scored_articles = []
-        for article in articles:
-            score = ArticleScorer.score_article(article)
-            article['score'] = score
-            scored_articles.append(article)
-        
-        # Sort by score (highest first)
-        ranked = sorted(scored_articles, key=lambda x: x['score'], reverse=True)
-        
-        logger.info(
-            f"Ranked {len(ranked)} articles. "
-            f"Top score: {ranked[0]['score']:.1f}, "
-            f"Lowest: {ranked[-1]['score']:.1f}"
-        )
-        
-        return ranked
-    
-    @staticmethod
-    def select_top_n(articles: list, n: int = 5) -> list:
-        """
-        Select top N articles by score.
-        
-        Args:
-            articles: List of article data dictionaries
-            n: Number of articles to select
-        
-        Returns:
-            Top N articles
-        """
-        ranked = ArticleScorer.rank_articles(articles)
-        top_n = ranked[:n]
-        
-        logger.info(
-            f"Selected top {len(top_n)} articles from {len(articles)} total. "
-            f"Score range: {top_n[0]['score']:.1f} - {top_n[-1]['score']:.1f}"
-        )
-        
-        return top_n
+"""Article scoring and ranking system."""
+
+import heapq
+import re
+from bisect import bisect_right
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlparse
+from loguru import logger
+
+try:
+    import ahocorasick
+except ImportError:  # Optional speedup, fall back to the compiled regexes
+    ahocorasick = None
+
+
+# Source reputation scores, kept at module level for a cheap lookup
+_SOURCE_SCORES = {
+    'techcrunch.com': 30,
+    'wired.com': 25,
+    'bbc.com': 20,
+    'cnet.com': 15,
+}
+_DEFAULT_SOURCE_SCORE = 10
+
+
+def _compile_terms(terms: list) -> re.Pattern:
+    """Compile lowercase terms into one whole-word alternation, longest first."""
+    alternation = "|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    return re.compile(rf"\b(?:{alternation})\b")
+
+
+def _count_distinct(pattern: re.Pattern, text: str, limit: int) -> int:
+    """Count distinct matches of pattern in text, stopping once limit is reached."""
+    seen = set()
+    for match in pattern.finditer(text):
+        seen.add(match.group())
+        if len(seen) >= limit:
+            break
+    return len(seen)
+
+
+def _build_automaton(keywords: list, companies: list, engagement: list):
+    """Fold keywords, companies and engagement words into one Aho-Corasick automaton, if available."""
+    if ahocorasick is None:
+        return None
+    kinds = {}
+    for kind, terms in (('kw', keywords), ('co', companies), ('eng', engagement)):
+        for term in terms:
+            kinds.setdefault(term.lower(), set()).add(kind)
+    automaton = ahocorasick.Automaton()
+    for term, term_kinds in kinds.items():
+        automaton.add_word(term, (term, frozenset(term_kinds)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_char(char: str) -> bool:
+    """Same notion of a word character as the regex \\b boundary."""
+    return char.isalnum() or char == '_'
+
+
+class ArticleScorer:
+    """Scores articles by importance and relevance."""
+    
+    # Source reputation scores
+    SOURCE_SCORES = _SOURCE_SCORES
+    
+    # High-impact keywords (worth more points)
+    HIGH_IMPACT_KEYWORDS = [
+        # AI & ML - highest priority
+        'ai', 'artificial intelligence', 'chatgpt', 'gpt-4', 'gpt-5', 'claude',
+        'gemini', 'llama', 'machine learning', 'deep learning', 'neural network',
+        'transformer', 'diffusion', 'stable diffusion', 'midjourney', 'dall-e',
+        # Major announcements
+        'breakthrough', 'major', 'announces', 'launches', 'releases', 'unveils',
+        'revolutionary', 'game-changing', 'first-ever', 'new model',
+        # Security & Important
+        'security breach', 'vulnerability', 'zero-day', 'hack', 'breach',
+        # Business
+        'acquisition', 'funding', 'ipo', 'billion', 'million', 'raises',
+        # Programming & Dev
+        'programming', 'python', 'javascript', 'rust', 'go', 'framework',
+        'open source', 'github', 'developer', 'coding',
+    ]
+    
+    # Major tech companies and AI labs
+    MAJOR_COMPANIES = [
+        # AI Labs (highest priority)
+        'openai', 'anthropic', 'deepmind', 'google ai', 'meta ai',
+        # Big Tech
+        'google', 'apple', 'microsoft', 'meta', 'facebook', 'amazon',
+        'tesla', 'nvidia', 'spacex', 'twitter', 'x corp',
+        # Important Tech
+        'samsung', 'intel', 'amd', 'qualcomm', 'arm',
+        'github', 'gitlab', 'stackoverflow', 'reddit',
+    ]
+    
+    # Recency bands: age in hours below each threshold -> points
+    RECENCY_THRESHOLDS = (2, 6, 12, 24)
+    RECENCY_SCORES = (20, 15, 10, 5, 0)
+    
+    # Engagement indicators in titles
+    ENGAGEMENT_WORDS = ['breaking', 'exclusive', 'first', 'new', 'just']
+    
+    # Single-pass matchers for the lists above
+    _ENGAGEMENT_RE = _compile_terms(ENGAGEMENT_WORDS)
+    _KW_RE = _compile_terms(HIGH_IMPACT_KEYWORDS)
+    _CO_RE = _compile_terms(MAJOR_COMPANIES)
+    _AUTOMATON = _build_automaton(HIGH_IMPACT_KEYWORDS, MAJOR_COMPANIES, ENGAGEMENT_WORDS)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def extract_domain(url: str) -> str:
+        """Extract domain from URL."""
+        try:
+            return urlparse(url).netloc.removeprefix('www.')
+        except Exception:
+            return ''
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def score_source(url: str) -> float:
+        """Score based on source reputation (0-30 points)."""
+        if not url:
+            return _DEFAULT_SOURCE_SCORE
+        return _SOURCE_SCORES.get(ArticleScorer.extract_domain(url), _DEFAULT_SOURCE_SCORE)
+    
+    @staticmethod
+    def _get_text_content(content: Any) -> str:
+        """Extract text content from string or dict summary."""
+        if isinstance(content, str):
+            return content
+        if not isinstance(content, dict):
+            return str(content)
+        
+        # Walk nested dicts with an explicit stack of item iterators and join
+        # every part once at the end, instead of re-joining at each level
+        parts = []
+        stack = deque([iter(content.items())])
+        while stack:
+            for key, value in stack[-1]:
+                parts.append(str(key))
+                if isinstance(value, (list, tuple)):
+                    parts.extend(map(str, value))
+                elif isinstance(value, dict):
+                    if value:
+                        stack.append(iter(value.items()))
+                        break
+                    parts.append('')  # An empty dict still counts as an (empty) part
+                else:
+                    parts.append(str(value))
+            else:
+                stack.pop()
+        return " ".join(parts)
+
+    @staticmethod
+    def _full_text(title_lc: str, summary: Any) -> str:
+        """Lowercased title plus summary text, as scanned for terms (title first)."""
+        return title_lc + ' ' + ArticleScorer._get_text_content(summary).lower()
+    
+    @staticmethod
+    def score_keywords(full_lc: str) -> float:
+        """Score based on high-impact keywords in lowercased text (0-25 points)."""
+        return 5 * _count_distinct(ArticleScorer._KW_RE, full_lc, 5)  # Cap at 25
+    
+    @staticmethod
+    def score_text(title_lc: str, full_lc: str) -> Tuple[float, float, float]:
+        """
+        Score keywords, companies and engagement in one scan of the lowercased text.
+        
+        full_lc must start with title_lc, as built by _full_text; engagement
+        words only count inside that title prefix.
+        
+        Returns:
+            Tuple of (keyword score 0-25, company score 0-15, engagement score 0-10)
+        """
+        automaton = ArticleScorer._AUTOMATON
+        if automaton is None:
+            return (
+                ArticleScorer.score_keywords(full_lc),
+                ArticleScorer.score_companies(full_lc),
+                ArticleScorer.score_engagement(title_lc),
+            )
+        
+        kw_hits, co_hits, engaging = ArticleScorer._scan_automaton(automaton, full_lc, len(title_lc))
+        return min(5 * len(kw_hits), 25), min(3 * len(co_hits), 15), 10 if engaging else 0
+    
+    @staticmethod
+    def _select_hits(found: list) -> set:
+        """Keep the leftmost-longest non-overlapping matches, like the regex would."""
+        hits = set()
+        next_start = 0
+        for start, neg_length, term in sorted(found):
+            if start >= next_start:
+                hits.add(term)
+                next_start = start - neg_length
+        return hits
+    
+    @staticmethod
+    def _scan_automaton(automaton, text: str, title_len: int) -> Tuple[set, set, bool]:
+        """
+        Collect keyword and company hits, and whether the title is engaging,
+        from one automaton pass.
+        
+        Keeps the regex semantics: whole words only, and per list the
+        leftmost-longest non-overlapping matches.
+        """
+        matches = {'kw': [], 'co': []}
+        engaging = False
+        for end, (term, kinds) in automaton.iter(text):
+            start = end - len(term) + 1
+            if start > 0 and _is_word_char(text[start - 1]):
+                continue
+            if end + 1 < len(text) and _is_word_char(text[end + 1]):
+                continue
+            for kind in kinds:
+                if kind == 'eng':
+                    engaging = engaging or end < title_len
+                else:
+                    matches[kind].append((start, -len(term), term))
+        
+        select_hits = ArticleScorer._select_hits
+        return select_hits(matches['kw']), select_hits(matches['co']), engaging
+    
+    @staticmethod
+    def score_recency(published_at: datetime, now: Optional[datetime] = None) -> float:
+        """Score based on article age (0-20 points), relative to now unless given."""
+        if not published_at:
+            return 5  # Default for unknown age
+        
+        if now is None:
+            now = datetime.now()
+        hours_old = (now - published_at).total_seconds() / 3600
+        band = bisect_right(ArticleScorer.RECENCY_THRESHOLDS, hours_old)
+        return ArticleScorer.RECENCY_SCORES[band]
+    
+    @staticmethod
+    def score_companies(full_lc: str) -> float:
+        """Score based on major company mentions in lowercased text (0-15 points)."""
+        return 3 * _count_distinct(ArticleScorer._CO_RE, full_lc, 5)  # Cap at 15
+    
+    @staticmethod
+    def score_engagement(title_lc: str) -> float:
+        """Score based on engagement indicators in the lowercased title (0-10 points)."""
+        return 10 if ArticleScorer._ENGAGEMENT_RE.search(title_lc) else 0
+    
+    @staticmethod
+    def score_article(article_data: Dict[str, Any], now: Optional[datetime] = None) -> float:
+        """
+        Calculate total article score (0-100).
+        
+        now lets a batch caller share one reference time for recency.
+        
+        Components:
+        - Source reputation: 0-30 points
+        - High-impact keywords: 0-25 points
+        - Recency: 0-20 points
+        - Company mentions: 0-15 points
+        - Engagement indicators: 0-10 points
+        
+        Total: 0-100 points
+        """
+        title = article_data.get('title', '')
+        summary = article_data.get('summary', '')
+        link = article_data.get('link', '')
+        published_at = article_data.get('published_at')
+        
+        # Lowercase the text once and score all text-based components in one scan
+        title_lc = title.lower()
+        keyword_score, company_score, engagement_score = ArticleScorer.score_text(
+            title_lc, ArticleScorer._full_text(title_lc, summary)
+        )
+        
+        # Calculate component scores
+        source_score = ArticleScorer.score_source(link)
+        recency_score = ArticleScorer.score_recency(published_at, now)
+        
+        # Total score
+        total = source_score + keyword_score + recency_score + company_score + engagement_score
+        
+        logger.debug(
+            f"Article score: {total:.1f} | "
+            f"Source: {source_score} | Keywords: {keyword_score} | "
+            f"Recency: {recency_score} | Companies: {company_score} | "
+            f"Engagement: {engagement_score} | Title: {title[:50]}..."
+        )
+        
+        return min(total, 100)  # Cap at 100
+    
+    @staticmethod
+    def score_articles(articles: list) -> list:
+        """
+        Score a batch of articles in place.
+        
+        Args:
+            articles: List of article data dictionaries
+        
+        Returns:
+            The same list, each article carrying its 'score'
+        """
+        score_article = ArticleScorer.score_article
+        now = datetime.now()  # One reference time for the whole batch
+        for article in articles:
+            article['score'] = score_article(article, now=now)
+        return articles
+    
+    @staticmethod
+    def rank_articles(articles: list) -> list:
+        """
+        Rank articles by score (highest first).
+        
+        Args:
+            articles: List of article data dictionaries
+        
+        Returns:
+            List of articles sorted by score (descending)
+        """
+        # Score each article, then sort by score (highest first)
+        scored_articles = ArticleScorer.score_articles(list(articles))
+        ranked = sorted(scored_articles, key=itemgetter('score'), reverse=True)
+        
+        logger.info(
+            f"Ranked {len(ranked)} articles. "
+            f"Top score: {ranked[0]['score']:.1f}, "
+            f"Lowest: {ranked[-1]['score']:.1f}"
+        )
+        
+        return ranked
+    
+    @staticmethod
+    def select_top_n(articles: list, n: int = 5) -> list:
+        """
+        Select top N articles by score.
+        
+        Args:
+            articles: List of article data dictionaries
+            n: Number of articles to select
+        
+        Returns:
+            Top N articles
+        """
+        # Only the top N need ordering, so avoid sorting the whole list
+        ArticleScorer.score_articles(articles)
+        top_n = heapq.nlargest(n, articles, key=itemgetter('score'))
+        if not top_n:
+            return top_n
+        
+        logger.info(
+            f"Selected top {len(top_n)} articles from {len(articles)} total. "
+            f"Score range: {top_n[0]['score']:.1f} - {top_n[-1]['score']:.1f}"
+        )
+        
+        return top_n
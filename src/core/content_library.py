@@ -1,409 +1,504 @@
-"""Content library with educational tech content."""
-
-import random
-from typing import Dict, List
-from loguru import logger
-
-
-class ContentLibrary:
-    """Library of curated educational tech content."""
-    
-    # Tech Facts - Focus on AI, Programming, CS
-    TECH_FACTS = [
-        {
-            "title": "🤖 AI Model Training",
-            "content": "GPT-4 was trained on ~13 trillion tokens and cost over $100 million to train. The model has 1.76 trillion parameters - that's more than the number of stars in the Milky Way galaxy!",
-            "hashtags": "#AI #MachineLearning #GPT4"
-        },
-        {
-            "title": "💻 Programming Languages",
-            "content": "Python is now the #1 most popular programming language, surpassing JavaScript. It's used in 48% of all data science projects and powers AI frameworks like TensorFlow and PyTorch.",
-            "hashtags": "#Python #Programming #DataScience"
-        },
-        {
-            "title": "🧠 Neural Networks",
-            "content": "The human brain has ~86 billion neurons. GPT-3 has 175 billion parameters. But here's the twist: your brain uses only 20 watts of power, while training GPT-3 consumed enough electricity to power 120 homes for a year!",
-            "hashtags": "#AI #NeuralNetworks #DeepLearning"
-        },
-        {
-            "title": "⚡ Code Execution Speed",
-            "content": "C++ is ~100x faster than Python for the same task. But Python's development speed is 5-10x faster. That's why we use Python for AI research and C++ for production systems!",
-            "hashtags": "#Programming #Performance #CPlusPlus"
-        },
-        {
-            "title": "🔐 Encryption Power",
-            "content": "Breaking a 256-bit encryption would take a supercomputer longer than the age of the universe (13.8 billion years). Even with quantum computers, it would still take millions of years!",
-            "hashtags": "#Cybersecurity #Encryption #Quantum"
-        },
-        {
-            "title": "🎮 Game Development",
-            "content": "Unreal Engine 5 can render 10 billion triangles per frame in real-time. That's more detail than the human eye can perceive! Modern games are basically interactive movies.",
-            "hashtags": "#GameDev #UnrealEngine #Graphics"
-        },
-        {
-            "title": "🌐 Internet Scale",
-            "content": "Google processes over 8.5 billion searches per day. That's ~99,000 searches per second! Their index contains over 100 petabytes of data - enough to fill 100 million laptops.",
-            "hashtags": "#Google #Internet #BigData"
-        },
-        {
-            "title": "🚀 Open Source Impact",
-            "content": "96% of all applications use open source code. Linux powers 96.3% of the world's top 1 million servers. Open source isn't just free - it's the foundation of modern technology!",
-            "hashtags": "#OpenSource #Linux #GitHub"
-        },
-    ]
-    
-    # Quick Tutorials - Programming, AI, CS, Tools
-    TUTORIALS = [
-        {
-            "title": "📚 Python for AI/ML",
-            "content": """Essential Python libraries for AI:
-
-1️⃣ NumPy - Fast numerical computing
-2️⃣ Pandas - Data manipulation
-3️⃣ TensorFlow/PyTorch - Deep learning
-4️⃣ Scikit-learn - Machine learning
-5️⃣ Matplotlib - Data visualization
-
-Install: pip install numpy pandas tensorflow
-
-Start your AI journey! 🤖""",
-            "hashtags": "#Tutorial #Python #AI #MachineLearning"
-        },
-        {
-            "title": "📚 Git Basics",
-            "content": """Essential Git commands:
-
-1️⃣ git init - Start repository
-2️⃣ git add . - Stage changes
-3️⃣ git commit -m "msg" - Save changes
-4️⃣ git push - Upload to remote
-5️⃣ git pull - Download updates
-6️⃣ git branch - Create branches
-7️⃣ git merge - Merge branches
-
-Master version control! 🚀""",
-            "hashtags": "#Tutorial #Git #Programming"
-        },
-        {
-            "title": "📚 JavaScript Async/Await",
-            "content": """Modern async JavaScript:
-
-// Old way (callbacks)
-fetch(url).then(res => res.json())
-
-// New way (async/await)
-const data = await fetch(url).then(r => r.json())
-
-✅ Cleaner code
-✅ Better error handling
-✅ Easier to read
-
-Async made simple! ⚡""",
-            "hashtags": "#Tutorial #JavaScript #WebDev"
-        },
-        {
-            "title": "📚 Big O Notation",
-            "content": """Algorithm complexity explained:
-
-O(1) - Constant: Array access
-O(log n) - Logarithmic: Binary search
-O(n) - Linear: Simple loop
-O(n log n) - Efficient sort
-O(n²) - Quadratic: Nested loops
-O(2ⁿ) - Exponential: Avoid!
-
-Optimize your code! 🎯""",
-            "hashtags": "#Tutorial #Algorithms #CS"
-        },
-        {
-            "title": "📚 Docker Basics",
-            "content": """Essential Docker commands:
-
-1️⃣ docker build -t name . - Build image
-2️⃣ docker run -p 8080:80 name - Run container
-3️⃣ docker ps - List containers
-4️⃣ docker stop id - Stop container
-5️⃣ docker rm id - Remove container
-
-Containerize everything! 🐳""",
-            "hashtags": "#Tutorial #Docker #DevOps"
-        },
-        {
-            "title": "📚 VS Code Extensions",
-            "content": """Must-have VS Code extensions:
-
-1️⃣ Prettier - Code formatter
-2️⃣ GitLens - Git superpowers
-3️⃣ Live Server - Local web server
-4️⃣ Python - Python support
-5️⃣ ESLint - JavaScript linter
-
-Supercharge your editor! ⚡""",
-            "hashtags": "#Tutorial #VSCode #Tools"
-        },
-        {
-            "title": "📚 SQL Basics",
-            "content": """Essential SQL queries:
-
-SELECT * FROM users WHERE age > 18
-INSERT INTO users VALUES ('John', 25)
-UPDATE users SET age = 26 WHERE name = 'John'
-DELETE FROM users WHERE id = 1
-JOIN tables ON users.id = orders.user_id
-
-Data at your fingertips! 📊""",
-            "hashtags": "#Tutorial #SQL #Database"
-        },
-        {
-            "title": "📚 Regex Patterns",
-            "content": """Useful regex patterns:
-
-📧 Email: ^[\\w.-]+@[\\w.-]+\\.\\w+$
-🔗 URL: https?://[\\w.-]+\\.\\w+
-📱 Phone: ^\\+?\\d{10,15}$
-💳 Credit Card: ^\\d{4}[- ]?\\d{4}[- ]?\\d{4}[- ]?\\d{4}$
-
-Pattern matching mastered! 🎯""",
-            "hashtags": "#Tutorial #Regex #Programming"
-        },
-        {
-            "title": "📚 Free AI Tools",
-            "content": """100% Free AI tools you should use:
-
-🤖 ChatGPT (free tier) - AI assistant
-🎨 Stable Diffusion - Image generation
-💻 GitHub Copilot (students) - Code completion
-📝 Grammarly - Writing assistant
-🎵 Suno AI - Music generation
-
-No limits, no costs! 🆓""",
-            "hashtags": "#Tutorial #AI #FreeTools"
-        },
-        {
-            "title": "📚 Linux Commands",
-            "content": """Essential Linux commands:
-
-1️⃣ ls -la - List files (detailed)
-2️⃣ cd ~/path - Change directory
-3️⃣ grep "text" file - Search in files
-4️⃣ chmod +x file - Make executable
-5️⃣ top - Monitor processes
-
-Command line power! 💪""",
-            "hashtags": "#Tutorial #Linux #Terminal"
-        },
-    ]
-    
-    # Pro Tips - Useful Tools & Lifehacks
-    PRO_TIPS = [
-        {
-            "title": "🎯 Free Developer Tools",
-            "content": """Amazing free tools for developers:
-
-🔧 VS Code - Best code editor
-🎨 Figma - UI/UX design
-📊 Postman - API testing
-🗄️ MongoDB Atlas - Free database
-🚀 Vercel/Netlify - Free hosting
-
-Build without spending! 💰""",
-            "hashtags": "#ProTip #Tools #Free"
-        },
-        {
-            "title": "🎯 AI Productivity Hacks",
-            "content": """Use AI to 10x your productivity:
-
-💡 ChatGPT - Code debugging
-📝 Claude - Document writing
-🎨 Midjourney - Design mockups
-🔍 Perplexity - Research
-📧 Gmail AI - Email drafts
-
-Work smarter with AI! 🤖""",
-            "hashtags": "#ProTip #AI #Productivity"
-        },
-        {
-            "title": "🎯 GitHub Secrets",
-            "content": """Hidden GitHub features:
-
-1️⃣ Press '.' on any repo - VS Code in browser
-2️⃣ Press 't' - File finder
-3️⃣ Press 'l' - Jump to line
-4️⃣ Add '.dev' to URL - GitHub Codespaces
-5️⃣ Use GitHub CLI - gh repo clone
-
-GitHub power user! 🚀""",
-            "hashtags": "#ProTip #GitHub #Tools"
-        },
-        {
-            "title": "🎯 Chrome Extensions",
-            "content": """Must-have Chrome extensions:
-
-🔐 Bitwarden - Password manager
-📚 Pocket - Save articles
-🎨 ColorZilla - Color picker
-📊 Wappalyzer - Tech stack detector
-⚡ uBlock Origin - Ad blocker
-
-Browse like a pro! 🌐""",
-            "hashtags": "#ProTip #Chrome #Extensions"
-        },
-        {
-            "title": "🎯 Keyboard Shortcuts",
-            "content": """Universal productivity shortcuts:
-
-⌨️ Ctrl+Z - Undo
-⌨️ Ctrl+Shift+Z - Redo
-⌨️ Ctrl+F - Find
-⌨️ Ctrl+Shift+T - Reopen tab
-⌨️ Win+V - Clipboard history
-⌨️ Win+Shift+S - Screenshot
-
-Save hours daily! ⏱️""",
-            "hashtags": "#ProTip #Productivity #Shortcuts"
-        },
-        {
-            "title": "🎯 Free Learning Resources",
-            "content": """Best free learning platforms:
-
-📚 freeCodeCamp - Web development
-🎓 CS50 - Computer science
-🤖 Fast.ai - Deep learning
-💻 The Odin Project - Full stack
-📖 MDN - Web documentation
-
-Learn anything, free! 🆓""",
-            "hashtags": "#ProTip #Learning #Free"
-        },
-        {
-            "title": "🎯 Code Optimization",
-            "content": """Quick optimization tips:
-
-1️⃣ Use const/let instead of var
-2️⃣ Avoid nested loops
-3️⃣ Cache DOM queries
-4️⃣ Use async/await
-5️⃣ Minimize HTTP requests
-
-Faster code = happier users! ⚡""",
-            "hashtags": "#ProTip #Programming #Performance"
-        },
-        {
-            "title": "🎯 Terminal Aliases",
-            "content": """Save time with aliases:
-
-alias gs='git status'
-alias gc='git commit -m'
-alias gp='git push'
-alias ll='ls -la'
-alias ..='cd ..'
-
-Add to ~/.bashrc or ~/.zshrc
-
-Type less, do more! 🚀""",
-            "hashtags": "#ProTip #Terminal #Productivity"
-        },
-    ]
-    
-    
-    def __init__(self):
-        """Initialize content library."""
-        from src.core.dynamic_content_fetcher import DynamicContentFetcher
-        self.dynamic_fetcher = DynamicContentFetcher()
-        self.used_facts = set()
-        self.used_tutorials = set()
-        self.used_tips = set()
-    
-    def get_random_fact(self) -> Dict[str, str]:
-        """Get a random tech fact (avoid recently used)."""
-        available = [f for i, f in enumerate(self.TECH_FACTS) if i not in self.used_facts]
-        
-        if not available:
-            # Reset if all used
-            self.used_facts.clear()
-            available = self.TECH_FACTS
-        
-        fact = random.choice(available)
-        self.used_facts.add(self.TECH_FACTS.index(fact))
-        
-        logger.info(f"Selected tech fact: {fact['title']}")
-        return fact
-    
-    def get_random_tutorial(self) -> Dict[str, str]:
-        """Get a random tutorial (avoid recently used)."""
-        available = [t for i, t in enumerate(self.TUTORIALS) if i not in self.used_tutorials]
-        
-        if not available:
-            self.used_tutorials.clear()
-            available = self.TUTORIALS
-        
-        tutorial = random.choice(available)
-        self.used_tutorials.add(self.TUTORIALS.index(tutorial))
-        
-        logger.info(f"Selected tutorial: {tutorial['title']}")
-        return tutorial
-    
-    def get_random_tip(self) -> Dict[str, str]:
-        """Get a random pro tip (avoid recently used)."""
-        available = [t for i, t in enumerate(self.PRO_TIPS) if i not in self.used_tips]
-        
-        if not available:
-            self.used_tips.clear()
-            available = self.PRO_TIPS
-        
-        tip = random.choice(available)
-        self.used_tips.add(self.PRO_TIPS.index(tip))
-        
-        logger.info(f"Selected pro tip: {tip['title']}")
-        return tip
-    
-    async def get_random_educational_content(self) -> Dict[str, str]:
-        """
-        Get random educational content.
-        Tries to get dynamic content first (80% chance), falls back to static.
-        """
-        # Try dynamic content 80% of the time if enabled
-        if random.random() < 0.8:
-            try:
-                logger.info("Fetching dynamic educational content...")
-                content = await self.dynamic_fetcher.get_random_content()
-                if content:
-                    logger.success(f"Fetched dynamic content: {content['title']}")
-                    return content
-            except Exception as e:
-                logger.error(f"Failed to fetch dynamic content: {e}")
-        
-        # Fallback to static content
-        logger.info("Using static educational content (fallback)")
-        content_type = random.choice(['fact', 'tutorial', 'tip'])
-        
-        if content_type == 'fact':
-            return self.get_random_fact()
-        elif content_type == 'tutorial':
-            return self.get_random_tutorial()
-        else:
-            return self.get_random_tip()
-    
-    def format_educational_post(self, content: Dict[str, str]) -> str:
-        """Format educational content for Telegram post."""
-        from src.core.content_formatter import ContentFormatter
-        
-        main_content_raw = content.get('summary') or content.get('content', '')
-        # Use helper to handle dict/str
-        main_content = ContentFormatter._format_summary(main_content_raw)
-        
-        parts = [
-            f"<b>{content['title']}</b>",
-            "",
-            main_content,
-            "",
-            content.get('hashtags', ''),
-        ]
-        
-        footer = ContentFormatter.create_social_footer()
-        if footer:
-            parts.append("")
-            parts.append("━━━━━━━━━━━━━━━━━━━━")
-            parts.append(footer)
-            
-        return "\n".join(parts)
+"""Content library with educational tech content."""
+
+import json
+import random
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Sequence, Tuple
+from loguru import logger
+
+from src.config.settings import settings
+from src.core.content_formatter import ContentFormatter
+from src.core.dynamic_content_fetcher import DynamicContentFetcher
+
+
+def _freeze(items: List[Dict[str, str]]) -> Tuple[Mapping[str, str], ...]:
+    """Turn a list of content dicts into a tuple of read-only mappings, prebuilding each post body."""
+    for item in items:
+        item["_post"] = f"<b>{item['title']}</b>\n\n{item['content']}\n\n{item['hashtags']}"
+    return tuple(MappingProxyType(item) for item in items)
+
+
+# Tech Facts - Focus on AI, Programming, CS
+_TECH_FACTS = _freeze([
+    {
+        "title": "🤖 AI Model Training",
+        "content": "GPT-4 was trained on ~13 trillion tokens and cost over $100 million to train. The model has 1.76 trillion parameters - that's more than the number of stars in the Milky Way galaxy!",
+        "hashtags": "#AI #MachineLearning #GPT4"
+    },
+    {
+        "title": "💻 Programming Languages",
+        "content": "Python is now the #1 most popular programming language, surpassing JavaScript. It's used in 48% of all data science projects and powers AI frameworks like TensorFlow and PyTorch.",
+        "hashtags": "#Python #Programming #DataScience"
+    },
+    {
+        "title": "🧠 Neural Networks",
+        "content": "The human brain has ~86 billion neurons. GPT-3 has 175 billion parameters. But here's the twist: your brain uses only 20 watts of power, while training GPT-3 consumed enough electricity to power 120 homes for a year!",
+        "hashtags": "#AI #NeuralNetworks #DeepLearning"
+    },
+    {
+        "title": "⚡ Code Execution Speed",
+        "content": "C++ is ~100x faster than Python for the same task. But Python's development speed is 5-10x faster. That's why we use Python for AI research and C++ for production systems!",
+        "hashtags": "#Programming #Performance #CPlusPlus"
+    },
+    {
+        "title": "🔐 Encryption Power",
+        "content": "Breaking a 256-bit encryption would take a supercomputer longer than the age of the universe (13.8 billion years). Even with quantum computers, it would still take millions of years!",
+        "hashtags": "#Cybersecurity #Encryption #Quantum"
+    },
+    {
+        "title": "🎮 Game Development",
+        "content": "Unreal Engine 5 can render 10 billion triangles per frame in real-time. That's more detail than the human eye can perceive! Modern games are basically interactive movies.",
+        "hashtags": "#GameDev #UnrealEngine #Graphics"
+    },
+    {
+        "title": "🌐 Internet Scale",
+        "content": "Google processes over 8.5 billion searches per day. That's ~99,000 searches per second! Their index contains over 100 petabytes of data - enough to fill 100 million laptops.",
+        "hashtags": "#Google #Internet #BigData"
+    },
+    {
+        "title": "🚀 Open Source Impact",
+        "content": "96% of all applications use open source code. Linux powers 96.3% of the world's top 1 million servers. Open source isn't just free - it's the foundation of modern technology!",
+        "hashtags": "#OpenSource #Linux #GitHub"
+    },
+])
+
+# Quick Tutorials - Programming, AI, CS, Tools
+_TUTORIALS = _freeze([
+    {
+        "title": "📚 Python for AI/ML",
+        "content": """Essential Python libraries for AI:
+
+1️⃣ NumPy - Fast numerical computing
+2️⃣ Pandas - Data manipulation
+3️⃣ TensorFlow/PyTorch - Deep learning
+4️⃣ Scikit-learn - Machine learning
+5️⃣ Matplotlib - Data visualization
+
+Install: pip install numpy pandas tensorflow
+
+Start your AI journey! 🤖""",
+        "hashtags": "#Tutorial #Python #AI #MachineLearning"
+    },
+    {
+        "title": "📚 Git Basics",
+        "content": """Essential Git commands:
+
+1️⃣ git init - Start repository
+2️⃣ git add . - Stage changes
+3️⃣ git commit -m "msg" - Save changes
+4️⃣ git push - Upload to remote
+5️⃣ git pull - Download updates
+6️⃣ git branch - Create branches
+7️⃣ git merge - Merge branches
+
+Master version control! 🚀""",
+        "hashtags": "#Tutorial #Git #Programming"
+    },
+    {
+        "title": "📚 JavaScript Async/Await",
+        "content": """Modern async JavaScript:
+
+// Old way (callbacks)
+fetch(url).then(res => res.json())
+
+// New way (async/await)
+const data = await fetch(url).then(r => r.json())
+
+✅ Cleaner code
+✅ Better error handling
+✅ Easier to read
+
+Async made simple! ⚡""",
+        "hashtags": "#Tutorial #JavaScript #WebDev"
+    },
+    {
+        "title": "📚 Big O Notation",
+        "content": """Algorithm complexity explained:
+
+O(1) - Constant: Array access
+O(log n) - Logarithmic: Binary search
+O(n) - Linear: Simple loop
+O(n log n) - Efficient sort
+O(n²) - Quadratic: Nested loops
+O(2ⁿ) - Exponential: Avoid!
+
+Optimize your code! 🎯""",
+        "hashtags": "#Tutorial #Algorithms #CS"
+    },
+    {
+        "title": "📚 Docker Basics",
+        "content": """Essential Docker commands:
+
+1️⃣ docker build -t name . - Build image
+2️⃣ docker run -p 8080:80 name - Run container
+3️⃣ docker ps - List containers
+4️⃣ docker stop id - Stop container
+5️⃣ docker rm id - Remove container
+
+Containerize everything! 🐳""",
+        "hashtags": "#Tutorial #Docker #DevOps"
+    },
+    {
+        "title": "📚 VS Code Extensions",
+        "content": """Must-have VS Code extensions:
+
+1️⃣ Prettier - Code formatter
+2️⃣ GitLens - Git superpowers
+3️⃣ Live Server - Local web server
+4️⃣ Python - Python support
+5️⃣ ESLint - JavaScript linter
+
+Supercharge your editor! ⚡""",
+        "hashtags": "#Tutorial #VSCode #Tools"
+    },
+    {
+        "title": "📚 SQL Basics",
+        "content": """Essential SQL queries:
+
+SELECT * FROM users WHERE age > 18
+INSERT INTO users VALUES ('John', 25)
+UPDATE users SET age = 26 WHERE name = 'John'
+DELETE FROM users WHERE id = 1
+JOIN tables ON users.id = orders.user_id
+
+Data at your fingertips! 📊""",
+        "hashtags": "#Tutorial #SQL #Database"
+    },
+    {
+        "title": "📚 Regex Patterns",
+        "content": """Useful regex patterns:
+
+📧 Email: ^[\\w.-]+@[\\w.-]+\\.\\w+$
+🔗 URL: https?://[\\w.-]+\\.\\w+
+📱 Phone: ^\\+?\\d{10,15}$
+💳 Credit Card: ^\\d{4}[- ]?\\d{4}[- ]?\\d{4}[- ]?\\d{4}$
+
+Pattern matching mastered! 🎯""",
+        "hashtags": "#Tutorial #Regex #Programming"
+    },
+    {
+        "title": "📚 Free AI Tools",
+        "content": """100% Free AI tools you should use:
+
+🤖 ChatGPT (free tier) - AI assistant
+🎨 Stable Diffusion - Image generation
+💻 GitHub Copilot (students) - Code completion
+📝 Grammarly - Writing assistant
+🎵 Suno AI - Music generation
+
+No limits, no costs! 🆓""",
+        "hashtags": "#Tutorial #AI #FreeTools"
+    },
+    {
+        "title": "📚 Linux Commands",
+        "content": """Essential Linux commands:
+
+1️⃣ ls -la - List files (detailed)
+2️⃣ cd ~/path - Change directory
+3️⃣ grep "text" file - Search in files
+4️⃣ chmod +x file - Make executable
+5️⃣ top - Monitor processes
+
+Command line power! 💪""",
+        "hashtags": "#Tutorial #Linux #Terminal"
+    },
+])
+
+# Pro Tips - Useful Tools & Lifehacks
+_PRO_TIPS = _freeze([
+    {
+        "title": "🎯 Free Developer Tools",
+        "content": """Amazing free tools for developers:
+
+🔧 VS Code - Best code editor
+🎨 Figma - UI/UX design
+📊 Postman - API testing
+🗄️ MongoDB Atlas - Free database
+🚀 Vercel/Netlify - Free hosting
+
+Build without spending! 💰""",
+        "hashtags": "#ProTip #Tools #Free"
+    },
+    {
+        "title": "🎯 AI Productivity Hacks",
+        "content": """Use AI to 10x your productivity:
+
+💡 ChatGPT - Code debugging
+📝 Claude - Document writing
+🎨 Midjourney - Design mockups
+🔍 Perplexity - Research
+📧 Gmail AI - Email drafts
+
+Work smarter with AI! 🤖""",
+        "hashtags": "#ProTip #AI #Productivity"
+    },
+    {
+        "title": "🎯 GitHub Secrets",
+        "content": """Hidden GitHub features:
+
+1️⃣ Press '.' on any repo - VS Code in browser
+2️⃣ Press 't' - File finder
+3️⃣ Press 'l' - Jump to line
+4️⃣ Add '.dev' to URL - GitHub Codespaces
+5️⃣ Use GitHub CLI - gh repo clone
+
+GitHub power user! 🚀""",
+        "hashtags": "#ProTip #GitHub #Tools"
+    },
+    {
+        "title": "🎯 Chrome Extensions",
+        "content": """Must-have Chrome extensions:
+
+🔐 Bitwarden - Password manager
+📚 Pocket - Save articles
+🎨 ColorZilla - Color picker
+📊 Wappalyzer - Tech stack detector
+⚡ uBlock Origin - Ad blocker
+
+Browse like a pro! 🌐""",
+        "hashtags": "#ProTip #Chrome #Extensions"
+    },
+    {
+        "title": "🎯 Keyboard Shortcuts",
+        "content": """Universal productivity shortcuts:
+
+⌨️ Ctrl+Z - Undo
+⌨️ Ctrl+Shift+Z - Redo
+⌨️ Ctrl+F - Find
+⌨️ Ctrl+Shift+T - Reopen tab
+⌨️ Win+V - Clipboard history
+⌨️ Win+Shift+S - Screenshot
+
+Save hours daily! ⏱️""",
+        "hashtags": "#ProTip #Productivity #Shortcuts"
+    },
+    {
+        "title": "🎯 Free Learning Resources",
+        "content": """Best free learning platforms:
+
+📚 freeCodeCamp - Web development
+🎓 CS50 - Computer science
+🤖 Fast.ai - Deep learning
+💻 The Odin Project - Full stack
+📖 MDN - Web documentation
+
+Learn anything, free! 🆓""",
+        "hashtags": "#ProTip #Learning #Free"
+    },
+    {
+        "title": "🎯 Code Optimization",
+        "content": """Quick optimization tips:
+
+1️⃣ Use const/let instead of var
+2️⃣ Avoid nested loops
+3️⃣ Cache DOM queries
+4️⃣ Use async/await
+5️⃣ Minimize HTTP requests
+
+Faster code = happier users! ⚡""",
+        "hashtags": "#ProTip #Programming #Performance"
+    },
+    {
+        "title": "🎯 Terminal Aliases",
+        "content": """Save time with aliases:
+
+alias gs='git status'
+alias gc='git commit -m'
+alias gp='git push'
+alias ll='ls -la'
+alias ..='cd ..'
+
+Add to ~/.bashrc or ~/.zshrc
+
+Type less, do more! 🚀""",
+        "hashtags": "#ProTip #Terminal #Productivity"
+    },
+])
+
+
+class ContentLibrary:
+    """Library of curated educational tech content."""
+    
+    __slots__ = (
+        "dynamic_fetcher",
+        "_unused_facts", "_used_facts",
+        "_unused_tutorials", "_used_tutorials",
+        "_unused_tips", "_used_tips",
+        "_state_path", "_write_accum", "_footer_suffix",
+        "_dyn_failures", "_dyn_cooldown_until",
+    )
+    
+    TECH_FACTS = _TECH_FACTS
+    TUTORIALS = _TUTORIALS
+    PRO_TIPS = _PRO_TIPS
+    
+    # Share of picks that adds up to one write of the rotation state
+    _FLUSH_P = 0.25
+    
+    # Consecutive dynamic failures before dynamic content is paused, and the longest pause
+    DYNAMIC_FAILURE_THRESHOLD = 3
+    DYNAMIC_MAX_COOLDOWN = 300
+    
+    def __init__(self):
+        """Initialize content library."""
+        self.dynamic_fetcher = DynamicContentFetcher()
+        # Indices not yet shown this round, and those already shown
+        self._unused_facts = list(range(len(_TECH_FACTS)))
+        self._used_facts: List[int] = []
+        self._unused_tutorials = list(range(len(_TUTORIALS)))
+        self._used_tutorials: List[int] = []
+        self._unused_tips = list(range(len(_PRO_TIPS)))
+        self._used_tips: List[int] = []
+        # Rotation survives restarts, so a fresh process doesn't repeat the last posts
+        self._state_path = Path(settings.cache_dir) / "content_library.json"
+        self._write_accum = 0.0
+        self._load_used()
+        # The footer depends only on settings, so build its block once
+        footer = ContentFormatter.create_social_footer()
+        self._footer_suffix = f"\n\n{ContentFormatter.FOOTER_SEPARATOR}\n{footer}" if footer else ""
+        # Circuit breaker for the Groq-backed dynamic fetcher
+        self._dyn_failures = 0
+        self._dyn_cooldown_until = 0.0
+    
+    def _pools(self):
+        """Yield (name, items, unused, used) for each static content type."""
+        yield "facts", _TECH_FACTS, self._unused_facts, self._used_facts
+        yield "tutorials", _TUTORIALS, self._unused_tutorials, self._used_tutorials
+        yield "tips", _PRO_TIPS, self._unused_tips, self._used_tips
+    
+    def _load_used(self):
+        """Seed the used pools from the state saved by a previous run."""
+        try:
+            state = json.loads(self._state_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable content rotation state: {e}")
+            return
+        if not isinstance(state, dict):
+            logger.warning("Ignoring malformed content rotation state")
+            return
+        
+        for name, items, unused, used in self._pools():
+            seen = list(dict.fromkeys(
+                i for i in state.get(name, ()) if isinstance(i, int) and 0 <= i < len(items)
+            ))
+            seen_set = set(seen)
+            used[:] = seen
+            unused[:] = [i for i in range(len(items)) if i not in seen_set]
+    
+    def _flush_used_to_disk(self):
+        """Write the used pools to disk."""
+        state = {name: used for name, _, _, used in self._pools()}
+        try:
+            self._state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._state_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(state), encoding="utf-8")
+            tmp_path.replace(self._state_path)
+        except OSError as e:
+            logger.warning(f"Failed to save content rotation state: {e}")
+    
+    def _draw(self, items: Sequence[Mapping[str, str]], unused: List[int], used: List[int]) -> Mapping[str, str]:
+        """Pick a random item not used this round, starting a new round when all are used."""
+        if not unused:
+            # Reset if all used
+            unused.extend(used)
+            used.clear()
+        
+        # Swap-remove the picked index so the draw stays O(1)
+        j = random.randrange(len(unused))
+        index = unused[j]
+        unused[j] = unused[-1]
+        unused.pop()
+        used.append(index)
+        
+        # Persist every 1/_FLUSH_P picks rather than on each one
+        self._write_accum += self._FLUSH_P
+        if self._write_accum >= 1.0:
+            self._write_accum -= 1.0
+            self._flush_used_to_disk()
+        return items[index]
+    
+    def get_random_fact(self) -> Mapping[str, str]:
+        """Get a random tech fact (avoid recently used)."""
+        fact = self._draw(_TECH_FACTS, self._unused_facts, self._used_facts)
+        
+        logger.info(f"Selected tech fact: {fact['title']}")
+        return fact
+    
+    def get_random_tutorial(self) -> Mapping[str, str]:
+        """Get a random tutorial (avoid recently used)."""
+        tutorial = self._draw(_TUTORIALS, self._unused_tutorials, self._used_tutorials)
+        
+        logger.info(f"Selected tutorial: {tutorial['title']}")
+        return tutorial
+    
+    def get_random_tip(self) -> Mapping[str, str]:
+        """Get a random pro tip (avoid recently used)."""
+        tip = self._draw(_PRO_TIPS, self._unused_tips, self._used_tips)
+        
+        logger.info(f"Selected pro tip: {tip['title']}")
+        return tip
+    
+    def start_warming(self):
+        """Have the dynamic fetcher prepare content in the background between posts."""
+        self.dynamic_fetcher.start_warming()
+    
+    async def close(self):
+        """Save picks not yet on disk and release the dynamic fetcher's network resources."""
+        if self._write_accum > 0:
+            self._write_accum = 0.0
+            self._flush_used_to_disk()
+        await self.dynamic_fetcher.close()
+    
+    def _record_dynamic_failure(self):
+        """Count a dynamic fetch failure, pausing dynamic content once they pile up."""
+        self._dyn_failures += 1
+        if self._dyn_failures >= self.DYNAMIC_FAILURE_THRESHOLD:
+            cooldown = min(self.DYNAMIC_MAX_COOLDOWN, 10 * 2 ** self._dyn_failures)
+            self._dyn_cooldown_until = time.monotonic() + cooldown
+            logger.warning(f"Dynamic content failing, using static content for {cooldown}s")
+    
+    async def get_random_educational_content(self) -> Mapping[str, str]:
+        """
+        Get random educational content.
+        Tries to get dynamic content first (80% chance), falls back to static.
+        After repeated dynamic failures, dynamic content is skipped for a
+        growing cooldown.
+        """
+        # Try dynamic content 80% of the time if enabled
+        if random.random() < 0.8 and time.monotonic() >= self._dyn_cooldown_until:
+            try:
+                logger.info("Fetching dynamic educational content...")
+                content = await self.dynamic_fetcher.get_random_content()
+                if content:
+                    logger.success(f"Fetched dynamic content: {content['title']}")
+                    self._dyn_failures = 0
+                    self._dyn_cooldown_until = 0.0
+                    return content
+            except Exception as e:
+                logger.error(f"Failed to fetch dynamic content: {e}")
+            self._record_dynamic_failure()
+        
+        # Fallback to static content
+        logger.info("Using static educational content (fallback)")
+        pick = random.choice((self.get_random_fact, self.get_random_tutorial, self.get_random_tip))
+        return pick()
+    
+    def format_educational_post(self, content: Mapping[str, str]) -> str:
+        """Format educational content for Telegram post."""
+        # Static items carry their body prebuilt; only the footer is added
+        prebuilt = content.get('_post')
+        if prebuilt is not None:
+            return prebuilt + self._footer_suffix
+        
+        main_content_raw = content.get('summary') or content.get('content', '')
+        # Use helper to handle dict/str
+        main_content = ContentFormatter._format_summary(main_content_raw)
+        
+        return (
+            f"<b>{content['title']}</b>\n\n{main_content}\n\n"
+            f"{content.get('hashtags', '')}{self._footer_suffix}"
+        )
@@ -1,137 +1,233 @@
-"""Service for fetching dynamic educational content from RSS feeds and APIs."""
-
-import asyncio
-import random
-import feedparser
-import aiohttp
-from typing import Dict, List, Optional, Any
-from loguru import logger
-from bs4 import BeautifulSoup
-
-from src.services.groq_service import GroqService
-
-class DynamicContentFetcher:
-    """Fetches educational content from various dynamic sources."""
-    
-    def __init__(self):
-        self.groq_service = GroqService()
-    
-    # Educational RSS Feeds
-    FEEDS = {
-        'tutorial': [
-            'https://dev.to/feed',
-            'https://www.freecodecamp.org/news/rss/',
-            'https://css-tricks.com/feed/',
-            'https://realpython.com/atom.xml',
-        ],
-        'ai_ml': [
-            'https://towardsdatascience.com/feed',
-            'https://machinelearningmastery.com/feed/',
-        ],
-        'cs': [
-            'https://www.geeksforgeeks.org/feed/',
-            'https://betterprogramming.pub/feed',
-        ]
-    }
-    
-    async def fetch_rss_content(self, category: str) -> Optional[Dict[str, str]]:
-        """Fetch content from RSS feeds for a specific category."""
-        if category not in self.FEEDS:
-            return None
-            
-        feed_url = random.choice(self.FEEDS[category])
-        try:
-            # We use aiohttp to fetch raw XML then parse with feedparser
-            async with aiohttp.ClientSession() as session:
-                async with session.get(feed_url, timeout=10) as response:
-                    if response.status != 200:
-                        logger.warning(f"Failed to fetch feed {feed_url}: {response.status}")
-                        return None
-                    xml_content = await response.text()
-            
-            feed = feedparser.parse(xml_content)
-            
-            if not feed.entries:
-                logger.warning(f"No entries found in feed {feed_url}")
-                return None
-                
-            # Pick a random entry from recent ones
-            entries = feed.entries[:10]
-            entry = random.choice(entries)
-            
-            title = entry.get('title', 'No Title')
-            link = entry.get('link', '')
-            summary = entry.get('summary', '') or entry.get('description', '')
-            
-            # Use Groq to summarize/translate this educational content
-            groq_content = await self.groq_service.generate_summary(
-                text=summary, 
-                title=title, 
-                link=link
-            )
-            
-            if groq_content:
-                return groq_content
-                
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error fetching RSS content from {feed_url}: {e}")
-            return None
-
-    async def generate_ai_fact(self) -> Optional[Dict[str, str]]:
-        """Generate a random tech fact/tutorial using Groq."""
-        try:
-            topics = [
-                "Python programming trick", "JavaScript modern feature", 
-                "Linux command line tip", "Cybersecurity best practice",
-                "AI/ML concept explained", "History of computing fact",
-                "Web performance optimization tip", "Database scaling strategy"
-            ]
-            topic = random.choice(topics)
-            
-            # We treat this as "summarizing" a concept
-            fake_title = f"Random Tech Knowledge: {topic}"
-            fake_summary = f"Please generate a fascinating and useful fact or mini-tutorial about {topic}."
-            
-            return await self.groq_service.generate_summary(
-                text=fake_summary,
-                title=topic, 
-                link="" # No link for random facts
-            )
-        except Exception as e:
-            logger.error(f"Error generating AI fact: {e}")
-            return None
-
-    async def generate_coding_lesson(self) -> Optional[Dict[str, str]]:
-        """Generate a full coding lesson using Groq."""
-        try:
-            topics = [
-                "Python List Comprehensions", "Python Decorators", "Python Async/Await",
-                "JavaScript Promises", "JavaScript Destructuring", "JavaScript Arrow Functions",
-                "React Hooks", "CSS Flexbox", "CSS Grid",
-                "SQL Joins", "Git Branching", "Docker Containers"
-            ]
-            topic = random.choice(topics)
-            
-            return await self.groq_service.generate_coding_lesson(topic)
-        except Exception as e:
-            logger.error(f"Error generating coding lesson: {e}")
-            return None
-
-    async def get_random_content(self) -> Optional[Dict[str, str]]:
-        """Get random content from any source."""
-        # 40% RSS, 30% AI Fact, 30% AI Lesson
-        rand_val = random.random()
-        
-        if rand_val < 0.4:
-            # RSS
-            category = random.choice(list(self.FEEDS.keys()))
-            return await self.fetch_rss_content(category)
-        elif rand_val < 0.7:
-            # AI Fact
-            return await self.generate_ai_fact()
-        else:
-            # AI Lesson
-            return await self.generate_coding_lesson()
-
+"""Service for fetching dynamic educational content from RSS feeds and APIs."""
+
+import asyncio
+import hashlib
+import random
+from collections import deque
+import feedparser
+import aiohttp
+from typing import Dict, List, Optional, Any
+from loguru import logger
+
+from src.services.groq_service import GroqService
+from src.utils.cache import LRUCache
+from src.utils.markup import html_to_text
+
+
+class DynamicContentFetcher:
+    """Fetches educational content from various dynamic sources."""
+    
+    __slots__ = (
+        "groq_service", "_feed_cache", "_summary_cache",
+        "_session", "_warm_queue", "_warm_task",
+    )
+    
+    def __init__(self):
+        self.groq_service = GroqService()
+        # Recent entries per feed, so repeated picks from a feed skip the download
+        self._feed_cache = LRUCache(maxsize=64, ttl_seconds=900)
+        # Groq output per feed entry, so an entry picked again isn't re-summarized
+        self._summary_cache = LRUCache(maxsize=256)
+        # Pooled HTTP session for feeds and Groq, opened on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Content generated ahead of time by the warm-up task
+        self._warm_queue: deque = deque(maxlen=8)
+        self._warm_task: Optional[asyncio.Task] = None
+    
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it inside the running loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=16, ttl_dns_cache=300, keepalive_timeout=60
+                )
+            )
+        return self._session
+    
+    async def close(self):
+        """Stop the warm-up task and close the shared HTTP session."""
+        if self._warm_task is not None:
+            self._warm_task.cancel()
+            try:
+                await self._warm_task
+            except asyncio.CancelledError:
+                pass
+            self._warm_task = None
+        if self._session is not None:
+            await self._session.close()
+    
+    # Feed downloads only; Groq calls on the same session keep their own default
+    FEED_TIMEOUT = aiohttp.ClientTimeout(total=10)
+    
+    # Educational RSS Feeds
+    FEEDS = {
+        'tutorial': (
+            'https://dev.to/feed',
+            'https://www.freecodecamp.org/news/rss/',
+            'https://css-tricks.com/feed/',
+            'https://realpython.com/atom.xml',
+        ),
+        'ai_ml': (
+            'https://towardsdatascience.com/feed',
+            'https://machinelearningmastery.com/feed/',
+        ),
+        'cs': (
+            'https://www.geeksforgeeks.org/feed/',
+            'https://betterprogramming.pub/feed',
+        )
+    }
+    _CATEGORIES = tuple(FEEDS)
+
+    # 40% RSS, 30% AI Fact, 30% AI Lesson
+    CONTENT_SOURCES = ('fetch_random_rss_content', 'generate_ai_fact', 'generate_coding_lesson')
+    CONTENT_CUM_WEIGHTS = (0.4, 0.7, 1.0)
+    
+    # Items the warm-up task keeps ready, and its pause once full or after a failure
+    WARM_TARGET = 4
+    WARM_IDLE_SECONDS = 60
+    
+    async def fetch_rss_content(self, category: str) -> Optional[Dict[str, str]]:
+        """Fetch content from RSS feeds for a specific category."""
+        if category not in self.FEEDS:
+            return None
+            
+        feed_url = random.choice(self.FEEDS[category])
+        try:
+            entries = await self._fetch_recent_entries(feed_url)
+            if not entries:
+                return None
+            
+            # Pick a random entry from recent ones
+            entry = random.choice(entries)
+            
+            title = entry.get('title', 'No Title')
+            link = entry.get('link', '')
+            summary = entry.get('summary', '') or entry.get('description', '')
+            
+            # Use Groq to summarize/translate this educational content
+            cache_key = hashlib.blake2b(
+                f"{title}\n{link}\n{summary[:512]}".encode(), digest_size=16
+            ).digest()
+            groq_content = self._summary_cache.get(cache_key)
+            if groq_content is None:
+                # Plain text is cheaper to send and gives the model fewer tokens
+                groq_content = await self.groq_service.generate_summary(
+                    text=html_to_text(summary), 
+                    title=title, 
+                    link=link,
+                    session=self.session
+                )
+                if groq_content:
+                    self._summary_cache.set(cache_key, groq_content)
+            
+            if groq_content:
+                return groq_content
+                
+            return None
+            
+        except Exception as e:
+            logger.error(f"Error fetching RSS content from {feed_url}: {e}")
+            return None
+    
+    async def _fetch_recent_entries(self, feed_url: str) -> Optional[tuple]:
+        """Fetch and parse a feed, returning its most recent entries (cached for a while)."""
+        entries = self._feed_cache.get(feed_url)
+        if entries is not None:
+            return entries
+        
+        # We use aiohttp to fetch raw XML then parse with feedparser
+        async with self.session.get(feed_url, timeout=self.FEED_TIMEOUT) as response:
+            if response.status != 200:
+                logger.warning(f"Failed to fetch feed {feed_url}: {response.status}")
+                return None
+            xml_content = await response.read()
+        
+        # feedparser is pure Python; parse in a worker thread so the loop stays free.
+        # Summaries only ever reach html_to_text, so skip sanitizing and URI rewriting.
+        feed = await asyncio.to_thread(
+            feedparser.parse, xml_content, sanitize_html=False, resolve_relative_uris=False
+        )
+        
+        if not feed.entries:
+            logger.warning(f"No entries found in feed {feed_url}")
+            return None
+        
+        entries = tuple(feed.entries[:10])
+        self._feed_cache.set(feed_url, entries)
+        return entries
+
+    async def generate_ai_fact(self) -> Optional[Dict[str, str]]:
+        """Generate a random tech fact/tutorial using Groq."""
+        try:
+            topics = [
+                "Python programming trick", "JavaScript modern feature", 
+                "Linux command line tip", "Cybersecurity best practice",
+                "AI/ML concept explained", "History of computing fact",
+                "Web performance optimization tip", "Database scaling strategy"
+            ]
+            topic = random.choice(topics)
+            
+            # We treat this as "summarizing" a concept
+            fake_title = f"Random Tech Knowledge: {topic}"
+            fake_summary = f"Please generate a fascinating and useful fact or mini-tutorial about {topic}."
+            
+            return await self.groq_service.generate_summary(
+                text=fake_summary,
+                title=topic, 
+                link="", # No link for random facts
+                session=self.session
+            )
+        except Exception as e:
+            logger.error(f"Error generating AI fact: {e}")
+            return None
+
+    async def generate_coding_lesson(self) -> Optional[Dict[str, str]]:
+        """Generate a full coding lesson using Groq."""
+        try:
+            topics = [
+                "Python List Comprehensions", "Python Decorators", "Python Async/Await",
+                "JavaScript Promises", "JavaScript Destructuring", "JavaScript Arrow Functions",
+                "React Hooks", "CSS Flexbox", "CSS Grid",
+                "SQL Joins", "Git Branching", "Docker Containers"
+            ]
+            topic = random.choice(topics)
+            
+            return await self.groq_service.generate_coding_lesson(topic, session=self.session)
+        except Exception as e:
+            logger.error(f"Error generating coding lesson: {e}")
+            return None
+
+    async def fetch_random_rss_content(self) -> Optional[Dict[str, str]]:
+        """Fetch content from a random RSS category."""
+        return await self.fetch_rss_content(random.choice(self._CATEGORIES))
+
+    async def _fetch_random_content(self) -> Optional[Dict[str, str]]:
+        """Fetch or generate one item from a randomly weighted source."""
+        source = random.choices(self.CONTENT_SOURCES, cum_weights=self.CONTENT_CUM_WEIGHTS)[0]
+        return await getattr(self, source)()
+    
+    def start_warming(self):
+        """Start keeping a few items ready in the background, if not already running."""
+        if self._warm_task is None or self._warm_task.done():
+            self._warm_task = asyncio.create_task(self._warm_loop())
+    
+    async def _warm_loop(self):
+        """Refill the warm queue whenever it drops below WARM_TARGET."""
+        while True:
+            if len(self._warm_queue) < self.WARM_TARGET:
+                try:
+                    content = await self._fetch_random_content()
+                except Exception as e:
+                    logger.error(f"Error warming dynamic content: {e}")
+                    content = None
+                if content:
+                    self._warm_queue.append(content)
+                    continue
+            await asyncio.sleep(self.WARM_IDLE_SECONDS)
+    
+    async def get_random_content(self) -> Optional[Dict[str, str]]:
+        """Get random content from any source, preferring items prepared in advance."""
+        if self._warm_queue:
+            return self._warm_queue.popleft()
+        return await self._fetch_random_content()
@@ -1,265 +1,485 @@
-"""Scheduler for managing the posting workflow."""
-
-import asyncio
-import random
-from datetime import datetime
-from typing import List
-from loguru import logger
-
-from src.config.settings import settings
-from src.database import (
-    db,
-    FeedRepository,
-    ArticleRepository,
-    PostingLogRepository,
-    StatisticsRepository,
-)
-from src.services.telegram_service import TelegramService
-from src.core.article_processor import ArticleProcessor
-from src.core.article_scorer import ArticleScorer
-from src.core.content_library import ContentLibrary
-import random
-
-
-class Scheduler:
-    """Manages the article fetching and posting workflow."""
-    
-    def __init__(self):
-        """Initialize the scheduler."""
-        self.telegram_service = TelegramService()
-        self.article_processor = ArticleProcessor()
-        self.content_library = ContentLibrary()
-        self.running = False
-        self.posts_today = 0
-        self.last_reset_date = datetime.now().date()
-    
-    async def initialize(self):
-        """Initialize services."""
-        logger.info("Initializing scheduler...")
-        
-        # Connect to Telegram
-        await self.telegram_service.connect()
-        
-        # Initialize feeds in database
-        await self._initialize_feeds()
-        
-        logger.success("Scheduler initialized")
-    
-    async def _initialize_feeds(self):
-        """Initialize feeds in the database."""
-        async with db.get_session() as session:
-            for feed_url in settings.rss_feed_list:
-                existing = await FeedRepository.get_by_url(session, feed_url)
-                if not existing:
-                    await FeedRepository.create(session, feed_url)
-                    logger.info(f"Added feed to database: {feed_url}")
-    
-    async def process_and_post_article(self, processed_article: dict) -> bool:
-        """
-        Process and post a single article.
-        
-        Args:
-            processed_article: Processed article data
-        
-        Returns:
-            True if posted successfully, False otherwise
-        """
-        link = processed_article["link"]
-        
-        # Check if already posted
-        async with db.get_session() as session:
-            if await ArticleRepository.exists(session, link):
-                logger.info(f"Article already posted: {link}")
-                await StatisticsRepository.increment_skipped(session)
-                return False
-        
-        # Send to Telegram
-        message = processed_article["message"]
-        image_url = processed_article.get("image_url")
-        
-        sent_message = await self.telegram_service.send_message(message, image_url)
-        
-        # Save to database
-        async with db.get_session() as session:
-            # Get or create feed
-            feed = await FeedRepository.get_by_url(session, "unknown")
-            if not feed:
-                feed = await FeedRepository.create(session, "unknown")
-            
-            if sent_message:
-                # Prepare summary for DB (serialize if dict)
-                summary_val = processed_article["summary"]
-                if isinstance(summary_val, dict):
-                    import json
-                    summary_val = json.dumps(summary_val, ensure_ascii=False)
-                    
-                # Create article record
-                article = await ArticleRepository.create(
-                    session,
-                    feed_id=feed.id,
-                    url=link,
-                    title=processed_article["title"],
-                    summary=summary_val,
-                    published_at=processed_article.get("published_at"),
-                    image_url=image_url,
-                    telegram_message_id=sent_message.id,
-                )
-                
-                # Log success
-                await PostingLogRepository.create(
-                    session,
-                    article_id=article.id,
-                    status="success",
-                )
-                
-                # Update statistics
-                await StatisticsRepository.increment_posted(session)
-                
-                logger.success(f"Article posted and saved: {link}")
-                return True
-            else:
-                # Log failure
-                await StatisticsRepository.increment_failed(session)
-                logger.error(f"Failed to post article: {link}")
-                return False
-    
-    
-    async def post_educational_content(self) -> bool:
-        """Post educational content (fact, tutorial, or tip)."""
-        try:
-            content = await self.content_library.get_random_educational_content()
-            message = self.content_library.format_educational_post(content)
-            
-            sent_message = await self.telegram_service.send_message(message, image_url=None)
-            
-            if sent_message:
-                logger.success(f"Educational content posted: {content['title']}")
-                return True
-            else:
-                logger.error("Failed to post educational content")
-                return False
-        except Exception as e:
-            logger.error(f"Error posting educational content: {e}")
-            return False
-    
-    async def run_cycle(self):
-        """Run a single posting cycle with content curation."""
-        logger.info("Starting posting cycle...")
-        
-        # Reset daily counter if new day
-        today = datetime.now().date()
-        if today != self.last_reset_date:
-            self.posts_today = 0
-            self.last_reset_date = today
-            logger.info("Daily post counter reset")
-        
-        # Check daily limit
-        if self.posts_today >= settings.max_posts_per_day:
-            logger.warning(
-                f"Daily posting limit reached ({settings.max_posts_per_day}). "
-                "Skipping this cycle."
-            )
-            return
-        
-        posted_count = 0
-        all_processed_articles = []
-        
-        # Collect articles from all feeds
-        for feed_url in settings.rss_feed_list:
-            try:
-                # Update feed last checked
-                async with db.get_session() as session:
-                    feed = await FeedRepository.get_by_url(session, feed_url)
-                    if feed:
-                        await FeedRepository.update_last_checked(session, feed.id, success=True)
-                
-                # Process feed
-                processed_articles = await self.article_processor.process_feed(feed_url)
-                all_processed_articles.extend(processed_articles)
-                
-            except Exception as e:
-                logger.error(f"Error processing feed {feed_url}: {e}")
-                
-                # Update feed error count
-                async with db.get_session() as session:
-                    feed = await FeedRepository.get_by_url(session, feed_url)
-                    if feed:
-                        await FeedRepository.update_last_checked(session, feed.id, success=False)
-        
-        if not all_processed_articles:
-            logger.info("No articles found in any feed")
-            
-            # Maybe post educational content instead
-            if settings.enable_educational_content and self.posts_today < settings.max_posts_per_day:
-                if await self.post_educational_content():
-                    self.posts_today += 1
-            return
-        
-        # Score and rank articles
-        logger.info(f"Scoring {len(all_processed_articles)} articles...")
-        top_articles = ArticleScorer.select_top_n(
-            all_processed_articles,
-            n=settings.max_news_per_cycle
-        )
-        
-        logger.info(
-            f"Selected top {len(top_articles)} articles from {len(all_processed_articles)} total"
-        )
-        
-        # Post top articles
-        for processed_article in top_articles:
-            # Check daily limit
-            if self.posts_today >= settings.max_posts_per_day:
-                logger.warning(f"Daily limit reached ({settings.max_posts_per_day}). Stopping.")
-                break
-            
-            if await self.process_and_post_article(processed_article):
-                posted_count += 1
-                self.posts_today += 1
-                
-                # Wait between posts
-                await asyncio.sleep(15)
-                
-                # Maybe post educational content after some news
-                if settings.enable_educational_content:
-                    if random.random() < settings.educational_content_frequency:
-                        if self.posts_today < settings.max_posts_per_day:
-                            logger.info("Mixing in educational content...")
-                            if await self.post_educational_content():
-                                self.posts_today += 1
-                            await asyncio.sleep(15)
-        
-        logger.info(
-            f"Posting cycle complete. Posted {posted_count} articles. "
-            f"Total posts today: {self.posts_today}/{settings.max_posts_per_day}"
-        )
-    
-    async def start(self):
-        """Start the scheduler loop."""
-        self.running = True
-        logger.info("Scheduler started")
-        
-        while self.running:
-            try:
-                await self.run_cycle()
-                
-                # Wait for next cycle
-                wait_minutes = settings.check_interval_minutes
-                logger.info(f"Waiting {wait_minutes} minutes until next cycle...")
-                await asyncio.sleep(settings.check_interval_seconds)
-                
-            except KeyboardInterrupt:
-                logger.info("Keyboard interrupt received, stopping...")
-                break
-            except Exception as e:
-                logger.error(f"Error in scheduler loop: {e}")
-                logger.info("Waiting 5 minutes before retry...")
-                await asyncio.sleep(300)  # Wait 5 minutes on error
-    
-    async def stop(self):
-        """Stop the scheduler."""
-        logger.info("Stopping scheduler...")
-        self.running = False
-        await self.telegram_service.disconnect()
-        await db.close()
-        logger.success("Scheduler stopped")
+"""Scheduler for managing the posting workflow."""
+
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from datetime import datetime, time as dt_time, timedelta
+from typing import List, Optional, Sequence
+from loguru import logger
+
+from src.config.settings import Settings, settings
+from src.database import (
+    db,
+    FeedRepository,
+    ArticleRepository,
+    PostingLogRepository,
+    StatisticsRepository,
+)
+from src.services.telegram_service import TelegramService
+from src.services.translation_service import TranslationService
+from src.core.article_processor import ArticleProcessor
+from src.core.article_scorer import ArticleScorer
+from src.core.content_library import ContentLibrary
+from src.utils.cache import LRUCache
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib encoder
+    orjson = None
+
+
+def _dumps(value) -> str:
+    """Serialize a value to a JSON string, keeping non-ASCII text as is."""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _next_local_midnight() -> float:
+    """Epoch timestamp of the coming local midnight."""
+    tomorrow = datetime.now().date() + timedelta(days=1)
+    return datetime.combine(tomorrow, dt_time.min).timestamp()
+
+
+class Scheduler:
+    """Manages the article fetching and posting workflow."""
+    
+    __slots__ = (
+        "telegram_service", "article_processor", "content_library",
+        "running", "posts_today", "_next_reset_at",
+        "_feed_urls", "_default_feed_id", "_default_feed_lock",
+        "_next_post_at", "_db_lock", "_stat_deltas", "_posted_urls",
+    )
+    
+    # Gap between consecutive channel posts
+    POST_INTERVAL_SECONDS = 15
+    # Articles claimed ahead of the one being sent
+    POST_QUEUE_SIZE = 4
+    # Posted URLs remembered in memory, so repeats skip the database
+    POSTED_URL_CACHE_SIZE = 4096
+    # Age after which a claimed but unsent article is treated as abandoned
+    STALE_CLAIM_MINUTES = 10
+    
+    def __init__(self):
+        """Initialize the scheduler."""
+        self.telegram_service = TelegramService()
+        self.article_processor = ArticleProcessor()
+        self.content_library = ContentLibrary()
+        self.running = False
+        self.posts_today = 0
+        # Epoch time of the next local midnight, when posts_today starts over
+        self._next_reset_at = _next_local_midnight()
+        # Feed URLs for this run, snapshotted from settings
+        self._feed_urls = tuple(settings.rss_feed_list)
+        # Articles are filed under a placeholder feed; resolve its id once
+        self._default_feed_id: Optional[int] = None
+        self._default_feed_lock = asyncio.Lock()
+        # Monotonic time before which the next post has to wait
+        self._next_post_at = 0.0
+        # Orders the producer's claims against the poster's releases, outcome
+        # writes and stats flushes; SQLite takes one writer at a time anyway
+        self._db_lock = asyncio.Lock()
+        # Statistics counted while posting, written in one go when a batch ends
+        self._stat_deltas: Counter = Counter()
+        # URLs known to be posted; only ever holds articles stored for good
+        self._posted_urls = LRUCache(maxsize=self.POSTED_URL_CACHE_SIZE)
+    
+    async def initialize(self):
+        """Initialize services."""
+        logger.info("Initializing scheduler...")
+        
+        # Connect to Telegram
+        await self.telegram_service.connect()
+        
+        # Initialize feeds in database
+        await self._initialize_feeds()
+        
+        # Free URLs left claimed by a run that stopped mid-post
+        await self._release_stale_claims()
+        
+        # Remember recent posts, so the first cycle's repeats skip the database
+        async with db.get_session() as session:
+            for url in reversed(await ArticleRepository.get_recent_urls(
+                session, limit=self.POSTED_URL_CACHE_SIZE
+            )):
+                self._posted_urls.set(url, True)
+        
+        # Prepare dynamic educational content while the scheduler sleeps
+        if settings.enable_educational_content:
+            self.content_library.start_warming()
+        
+        logger.success("Scheduler initialized")
+    
+    async def _initialize_feeds(self):
+        """Initialize feeds in the database."""
+        async with db.get_session() as session:
+            for feed_url in self._feed_urls:
+                existing = await FeedRepository.get_by_url(session, feed_url)
+                if not existing:
+                    await FeedRepository.create(session, feed_url)
+                    logger.info(f"Added feed to database: {feed_url}")
+    
+    async def reload_feeds(self, feed_urls: Optional[Sequence[str]] = None):
+        """
+        Switch to a new feed list at runtime.
+        
+        Args:
+            feed_urls: Feed URLs to use; re-read from the environment and .env if omitted
+        """
+        if feed_urls is None:
+            # Load the settings source again, then drop the cached list so it is parsed anew
+            settings.rss_feeds = Settings().rss_feeds
+            settings.__dict__.pop("rss_feed_list", None)
+            feed_urls = settings.rss_feed_list
+        self._feed_urls = tuple(feed_urls)
+        await self._initialize_feeds()
+        logger.info(f"Reloaded {len(self._feed_urls)} feeds")
+    
+    async def _get_default_feed_id(self) -> int:
+        """Get the id of the placeholder feed articles are saved under, creating it once."""
+        if self._default_feed_id is None:
+            async with self._default_feed_lock:
+                if self._default_feed_id is None:
+                    async with db.get_session() as session:
+                        feed = await FeedRepository.get_by_url(session, "unknown")
+                        if not feed:
+                            feed = await FeedRepository.create(session, "unknown")
+                        self._default_feed_id = feed.id
+        return self._default_feed_id
+    
+    async def process_and_post_article(self, processed_article: dict) -> bool:
+        """
+        Process and post a single article.
+        
+        Args:
+            processed_article: Processed article data
+        
+        Returns:
+            True if posted successfully, False otherwise
+        """
+        try:
+            article_id = await self._claim_article(processed_article)
+            if article_id is None:
+                return False
+            return await self._send_claimed_article(processed_article, article_id)
+        finally:
+            await self._flush_stats()
+    
+    async def _claim_article(self, processed_article: dict) -> Optional[int]:
+        """
+        Record an article before it is sent.
+        
+        The insert is skipped if the URL was already posted, so two cycles can
+        never both post the same article.
+        
+        Returns:
+            The new article id, or None if the article was already posted
+        """
+        link = processed_article["link"]
+        
+        # Prepare summary for DB (serialize if dict)
+        summary_val = processed_article["summary"]
+        if isinstance(summary_val, dict):
+            summary_val = _dumps(summary_val)
+        
+        async with self._db_lock, db.get_session() as session:
+            feed_id = await self._get_default_feed_id()
+            article_id = await ArticleRepository.insert_if_new(
+                session,
+                feed_id=feed_id,
+                url=link,
+                title=processed_article["title"],
+                summary=summary_val,
+                published_at=processed_article.get("published_at"),
+                image_url=processed_article.get("image_url"),
+            )
+            if article_id is None:
+                logger.info(f"Article already posted: {link}")
+                self._stat_deltas["skipped"] += 1
+        return article_id
+    
+    async def _release_article(self, article_id: int):
+        """Drop a claimed article that won't be sent, so a later cycle can retry it."""
+        async with self._db_lock, db.get_session() as session:
+            await ArticleRepository.delete(session, article_id)
+    
+    async def _release_stale_claims(self):
+        """Drop claims that were never sent and are too old to still be in flight."""
+        async with self._db_lock, db.get_session() as session:
+            released = await ArticleRepository.release_stale_claims(
+                session, self.STALE_CLAIM_MINUTES
+            )
+        if released:
+            logger.warning(f"Released {released} stale unsent article claim(s)")
+    
+    async def _send_claimed_article(self, processed_article: dict, article_id: int) -> bool:
+        """Send a claimed article to Telegram and record the outcome."""
+        link = processed_article["link"]
+        
+        # Send to Telegram
+        message = processed_article["message"]
+        image_url = processed_article.get("image_url")
+        
+        try:
+            sent_message = await self.telegram_service.send_message(message, image_url)
+        except Exception as e:
+            # Nothing was posted, so fall through to releasing the claim
+            logger.error(f"Error sending article {link}: {e}")
+            sent_message = None
+        
+        # Save to database
+        async with self._db_lock, db.get_session() as session:
+            if sent_message:
+                # Stored in the same commit as the success log below
+                await ArticleRepository.set_telegram_message_id(
+                    session, article_id, sent_message.id, commit=False
+                )
+                
+                # Log success
+                await PostingLogRepository.create(
+                    session,
+                    article_id=article_id,
+                    status="success",
+                )
+                
+                # Update statistics
+                self._stat_deltas["posted"] += 1
+                
+                self._posted_urls.set(link, True)
+                logger.success(f"Article posted and saved: {link}")
+                return True
+            else:
+                # Release the claim so a later cycle can retry the article
+                await ArticleRepository.delete(session, article_id)
+                
+                # Log failure
+                self._stat_deltas["failed"] += 1
+                logger.error(f"Failed to post article: {link}")
+                return False
+    
+    async def _wait_for_post_slot(self):
+        """Sleep until the gap since the previous post has passed."""
+        delay = self._next_post_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def _start_post_gap(self):
+        """Start the wait that must pass before the next post."""
+        self._next_post_at = time.monotonic() + self.POST_INTERVAL_SECONDS
+    
+    async def _post_articles(self, articles: list) -> int:
+        """
+        Post ranked articles, claiming the next ones while waiting between posts.
+        
+        A producer claims articles in the database ahead of time; the
+        consumer sends them one by one, spaced POST_INTERVAL_SECONDS apart.
+        
+        Returns:
+            Number of articles posted
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.POST_QUEUE_SIZE)
+        stopping = asyncio.Event()
+        
+        async def produce():
+            try:
+                for processed_article in articles:
+                    if stopping.is_set():
+                        break
+                    article_id = await self._claim_article(processed_article)
+                    if article_id is not None:
+                        await queue.put((processed_article, article_id))
+            finally:
+                await queue.put(None)
+        
+        producer = asyncio.create_task(produce())
+        posted_count = 0
+        producer_done = False
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    producer_done = True
+                    break
+                processed_article, article_id = item
+                
+                # Check daily limit
+                if self.posts_today >= settings.max_posts_per_day:
+                    logger.warning(f"Daily limit reached ({settings.max_posts_per_day}). Stopping.")
+                    await self._release_article(article_id)
+                    break
+                
+                await self._wait_for_post_slot()
+                if not await self._send_claimed_article(processed_article, article_id):
+                    continue
+                posted_count += 1
+                self.posts_today += 1
+                self._start_post_gap()
+                
+                # Maybe post educational content after some news
+                if settings.enable_educational_content:
+                    if random.random() < settings.educational_content_frequency:
+                        if self.posts_today < settings.max_posts_per_day:
+                            logger.info("Mixing in educational content...")
+                            await self._wait_for_post_slot()
+                            if await self.post_educational_content():
+                                self.posts_today += 1
+                            self._start_post_gap()
+        finally:
+            # Stop claiming and hand back whatever was claimed but not sent
+            stopping.set()
+            while not producer_done:
+                item = await queue.get()
+                if item is None:
+                    producer_done = True
+                else:
+                    await self._release_article(item[1])
+            await producer
+            await self._flush_stats()
+        
+        return posted_count
+    
+    async def _flush_stats(self):
+        """Write the statistics counted since the last flush."""
+        if not self._stat_deltas:
+            return
+        deltas = dict(self._stat_deltas)
+        self._stat_deltas.clear()
+        async with self._db_lock, db.get_session() as session:
+            await StatisticsRepository.apply_deltas(session, **deltas)
+    
+    async def post_educational_content(self) -> bool:
+        """Post educational content (fact, tutorial, or tip)."""
+        try:
+            content = await self.content_library.get_random_educational_content()
+            message = self.content_library.format_educational_post(content)
+            
+            sent_message = await self.telegram_service.send_message(message, image_url=None)
+            
+            if sent_message:
+                logger.success(f"Educational content posted: {content['title']}")
+                return True
+            else:
+                logger.error("Failed to post educational content")
+                return False
+        except Exception as e:
+            logger.error(f"Error posting educational content: {e}")
+            return False
+    
+    async def run_cycle(self):
+        """Run a single posting cycle with content curation."""
+        logger.info("Starting posting cycle...")
+        
+        # Reset daily counter if new day
+        if time.time() >= self._next_reset_at:
+            self.posts_today = 0
+            self._next_reset_at = _next_local_midnight()
+            logger.info("Daily post counter reset")
+        
+        # Check daily limit
+        if self.posts_today >= settings.max_posts_per_day:
+            logger.warning(
+                f"Daily posting limit reached ({settings.max_posts_per_day}). "
+                "Skipping this cycle."
+            )
+            return
+        
+        # Free claims abandoned by an earlier cycle that crashed mid-post
+        await self._release_stale_claims()
+        
+        # Collect articles from all feeds concurrently
+        feed_urls = list(self._feed_urls)
+        all_processed_articles, failed_feeds = await self.article_processor.process_feeds(
+            feed_urls
+        )
+        
+        # Update feed last checked and error counts in one transaction
+        failed = set(failed_feeds)
+        async with db.get_session() as session:
+            feeds = await FeedRepository.get_map_by_urls(session, feed_urls)
+            await FeedRepository.update_last_checked_many(
+                session,
+                succeeded_ids=[feed.id for url, feed in feeds.items() if url not in failed],
+                failed_ids=[feed.id for url, feed in feeds.items() if url in failed],
+            )
+        
+        if not all_processed_articles:
+            logger.info("No articles found in any feed")
+            
+            # Maybe post educational content instead
+            if settings.enable_educational_content and self.posts_today < settings.max_posts_per_day:
+                if await self.post_educational_content():
+                    self.posts_today += 1
+            return
+        
+        # Drop articles posted in earlier cycles so they don't take top slots
+        links = {article["link"] for article in all_processed_articles}
+        posted_urls = {link for link in links if self._posted_urls.get(link)}
+        unknown = links - posted_urls
+        if unknown:
+            async with self._db_lock, db.get_session() as session:
+                stored = await ArticleRepository.existing_urls(session, unknown)
+            for url in stored:
+                self._posted_urls.set(url, True)
+            posted_urls |= stored
+        if posted_urls:
+            all_processed_articles = [
+                article for article in all_processed_articles
+                if article["link"] not in posted_urls
+            ]
+        if not all_processed_articles:
+            logger.info("All fetched articles were already posted")
+            return
+        
+        # Score and rank articles
+        logger.info(f"Scoring {len(all_processed_articles)} articles...")
+        top_articles = ArticleScorer.select_top_n(
+            all_processed_articles,
+            n=settings.max_news_per_cycle
+        )
+        
+        logger.info(
+            f"Selected top {len(top_articles)} articles from {len(all_processed_articles)} total"
+        )
+        
+        # Post top articles
+        posted_count = await self._post_articles(top_articles)
+        
+        logger.info(
+            f"Posting cycle complete. Posted {posted_count} articles. "
+            f"Total posts today: {self.posts_today}/{settings.max_posts_per_day}"
+        )
+    
+    async def start(self):
+        """Start the scheduler loop."""
+        self.running = True
+        logger.info("Scheduler started")
+        
+        while self.running:
+            try:
+                await self.run_cycle()
+                
+                # Wait for next cycle
+                wait_minutes = settings.check_interval_minutes
+                logger.info(f"Waiting {wait_minutes} minutes until next cycle...")
+                await asyncio.sleep(settings.check_interval_seconds)
+                
+            except KeyboardInterrupt:
+                logger.info("Keyboard interrupt received, stopping...")
+                break
+            except Exception as e:
+                logger.error(f"Error in scheduler loop: {e}")
+                logger.info("Waiting 5 minutes before retry...")
+                await asyncio.sleep(300)  # Wait 5 minutes on error
+    
+    async def stop(self):
+        """Stop the scheduler."""
+        logger.info("Stopping scheduler...")
+        self.running = False
+        await self.telegram_service.disconnect()
+        await self.article_processor.close()
+        await self.content_library.close()
+        TranslationService.close()
+        await db.close()
+        logger.success("Scheduler stopped")
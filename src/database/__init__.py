@@ -1,23 +1,23 @@
-"""Database package."""
-
-from src.database.database import db, init_database
-from src.database.models import Feed, Article, PostingLog, Statistics
-from src.database.repositories import (
-    FeedRepository,
-    ArticleRepository,
-    PostingLogRepository,
-    StatisticsRepository,
-)
-
-__all__ = [
-    "db",
-    "init_database",
-    "Feed",
-    "Article",
-    "PostingLog",
-    "Statistics",
-    "FeedRepository",
-    "ArticleRepository",
-    "PostingLogRepository",
-    "StatisticsRepository",
-]
+"""Database package."""
+
+from src.database.database import db, init_database
+from src.database.models import Feed, Article, PostingLog, Statistics
+from src.database.repositories import (
+    FeedRepository,
+    ArticleRepository,
+    PostingLogRepository,
+    StatisticsRepository,
+)
+
+__all__ = [
+    "db",
+    "init_database",
+    "Feed",
+    "Article",
+    "PostingLog",
+    "Statistics",
+    "FeedRepository",
+    "ArticleRepository",
+    "PostingLogRepository",
+    "StatisticsRepository",
+]
@@ -1,189 +1,381 @@
-"""Data access layer - repositories for database operations."""
-
-from datetime import datetime, date
-from typing import Optional, List
-from sqlalchemy import select, func, and_
-from sqlalchemy.ext.asyncio import AsyncSession
-from loguru import logger
-
-from src.database.models import Feed, Article, PostingLog, Statistics
-
-
-class FeedRepository:
-    """Repository for Feed operations."""
-    
-    @staticmethod
-    async def create(session: AsyncSession, url: str, name: Optional[str] = None) -> Feed:
-        """Create a new feed."""
-        feed = Feed(url=url, name=name)
-        session.add(feed)
-        await session.commit()
-        await session.refresh(feed)
-        logger.info(f"Created feed: {url}")
-        return feed
-    
-    @staticmethod
-    async def get_by_url(session: AsyncSession, url: str) -> Optional[Feed]:
-        """Get feed by URL."""
-        result = await session.execute(select(Feed).where(Feed.url == url))
-        return result.scalar_one_or_none()
-    
-    @staticmethod
-    async def get_all_enabled(session: AsyncSession) -> List[Feed]:
-        """Get all enabled feeds."""
-        result = await session.execute(select(Feed).where(Feed.enabled == True))
-        return list(result.scalars().all())
-    
-    @staticmethod
-    async def update_last_checked(session: AsyncSession, feed_id: int, success: bool = True):
-        """Update feed last checked timestamp."""
-        result = await session.execute(select(Feed).where(Feed.id == feed_id))
-        feed = result.scalar_one_or_none()
-        if feed:
-            feed.last_checked = datetime.utcnow()
-            if success:
-                feed.last_success = datetime.utcnow()
-                feed.error_count = 0
-            else:
-                feed.error_count += 1
-            await session.commit()
-
-
-class ArticleRepository:
-    """Repository for Article operations."""
-    
-    @staticmethod
-    async def create(
-        session: AsyncSession,
-        feed_id: int,
-        url: str,
-        title: str,
-        summary: str,
-        published_at: Optional[datetime] = None,
-        image_url: Optional[str] = None,
-        telegram_message_id: Optional[int] = None,
-    ) -> Article:
-        """Create a new article."""
-        article = Article(
-            feed_id=feed_id,
-            url=url,
-            title=title,
-            summary=summary,
-            published_at=published_at,
-            image_url=image_url,
-            telegram_message_id=telegram_message_id,
-        )
-        session.add(article)
-        await session.commit()
-        await session.refresh(article)
-        logger.info(f"Created article: {title}")
-        return article
-    
-    @staticmethod
-    async def get_by_url(session: AsyncSession, url: str) -> Optional[Article]:
-        """Get article by URL."""
-        result = await session.execute(select(Article).where(Article.url == url))
-        return result.scalar_one_or_none()
-    
-    @staticmethod
-    async def exists(session: AsyncSession, url: str) -> bool:
-        """Check if article exists."""
-        result = await session.execute(select(Article.id).where(Article.url == url))
-        return result.scalar_one_or_none() is not None
-    
-    @staticmethod
-    async def get_recent(session: AsyncSession, limit: int = 100) -> List[Article]:
-        """Get recent articles."""
-        result = await session.execute(
-            select(Article).order_by(Article.posted_at.desc()).limit(limit)
-        )
-        return list(result.scalars().all())
-
-
-class PostingLogRepository:
-    """Repository for PostingLog operations."""
-    
-    @staticmethod
-    async def create(
-        session: AsyncSession,
-        article_id: int,
-        status: str,
-        error_message: Optional[str] = None,
-        attempt_count: int = 1,
-    ) -> PostingLog:
-        """Create a posting log entry."""
-        log = PostingLog(
-            article_id=article_id,
-            status=status,
-            error_message=error_message,
-            attempt_count=attempt_count,
-        )
-        session.add(log)
-        await session.commit()
-        await session.refresh(log)
-        return log
-    
-    @staticmethod
-    async def get_by_article(session: AsyncSession, article_id: int) -> List[PostingLog]:
-        """Get all logs for an article."""
-        result = await session.execute(
-            select(PostingLog).where(PostingLog.article_id == article_id)
-        )
-        return list(result.scalars().all())
-
-
-class StatisticsRepository:
-    """Repository for Statistics operations."""
-    
-    @staticmethod
-    async def get_or_create_today(session: AsyncSession) -> Statistics:
-        """Get or create statistics for today."""
-        today = date.today()
-        result = await session.execute(
-            select(Statistics).where(func.date(Statistics.date) == today)
-        )
-        stats = result.scalar_one_or_none()
-        
-        if not stats:
-            stats = Statistics(date=datetime.combine(today, datetime.min.time()))
-            session.add(stats)
-            await session.commit()
-            await session.refresh(stats)
-        
-        return stats
-    
-    @staticmethod
-    async def increment_checked(session: AsyncSession):
-        """Increment articles checked count."""
-        stats = await StatisticsRepository.get_or_create_today(session)
-        stats.articles_checked += 1
-        await session.commit()
-    
-    @staticmethod
-    async def increment_posted(session: AsyncSession):
-        """Increment articles posted count."""
-        stats = await StatisticsRepository.get_or_create_today(session)
-        stats.articles_posted += 1
-        await session.commit()
-    
-    @staticmethod
-    async def increment_failed(session: AsyncSession):
-        """Increment articles failed count."""
-        stats = await StatisticsRepository.get_or_create_today(session)
-        stats.articles_failed += 1
-        await session.commit()
-    
-    @staticmethod
-    async def increment_skipped(session: AsyncSession):
-        """Increment articles skipped count."""
-        stats = await StatisticsRepository.get_or_create_today(session)
-        stats.articles_skipped += 1
-        await session.commit()
-    
-    @staticmethod
-    async def get_recent(session: AsyncSession, days: int = 7) -> List[Statistics]:
-        """Get statistics for recent days."""
-        result = await session.execute(
-            select(Statistics).order_by(Statistics.date.desc()).limit(days)
-        )
-        return list(result.scalars().all())
+"""Data access layer - repositories for database operations."""
+
+from datetime import datetime, date
+from typing import Dict, Iterable, Optional, List, Set
+from sqlalchemy import bindparam, select, func, and_, update, delete
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from loguru import logger
+
+from src.database.models import Feed, Article, PostingLog, Statistics
+
+# Lookups run for every feed and article; build them once and bind the URL per call
+_FEED_BY_URL = select(Feed).where(Feed.url == bindparam("url"))
+_ARTICLE_BY_URL = select(Article).where(Article.url == bindparam("url"))
+_ARTICLE_EXISTS = select(1).where(Article.url == bindparam("url")).limit(1)
+
+
+def _today_key() -> datetime:
+    """Today's local midnight, the value each day's statistics row is stored under."""
+    return datetime.combine(date.today(), datetime.min.time())
+
+
+class FeedRepository:
+    """Repository for Feed operations."""
+    
+    @staticmethod
+    async def create(session: AsyncSession, url: str, name: Optional[str] = None) -> Feed:
+        """Create a new feed."""
+        feed = Feed(url=url, name=name)
+        session.add(feed)
+        await session.commit()
+        logger.info(f"Created feed: {url}")
+        return feed
+    
+    @staticmethod
+    async def get_by_url(session: AsyncSession, url: str) -> Optional[Feed]:
+        """Get feed by URL."""
+        result = await session.execute(_FEED_BY_URL, {"url": url})
+        return result.scalar_one_or_none()
+    
+    @staticmethod
+    async def get_map_by_urls(session: AsyncSession, urls: Iterable[str]) -> Dict[str, Feed]:
+        """Get feeds for several URLs in one query, keyed by URL."""
+        urls = list(urls)
+        if not urls:
+            return {}
+        result = await session.execute(select(Feed).where(Feed.url.in_(urls)))
+        return {feed.url: feed for feed in result.scalars()}
+    
+    @staticmethod
+    async def get_all_enabled(session: AsyncSession) -> List[Feed]:
+        """Get all enabled feeds."""
+        result = await session.execute(select(Feed).where(Feed.enabled == True))
+        return list(result.scalars().all())
+    
+    @staticmethod
+    async def update_last_checked(session: AsyncSession, feed_id: int, success: bool = True):
+        """Update feed last checked timestamp with a single UPDATE."""
+        await FeedRepository.update_last_checked_many(
+            session,
+            succeeded_ids=[feed_id] if success else (),
+            failed_ids=() if success else [feed_id],
+        )
+    
+    @staticmethod
+    async def update_last_checked_many(
+        session: AsyncSession,
+        succeeded_ids: Iterable[int],
+        failed_ids: Iterable[int],
+    ):
+        """Update last checked timestamps for many feeds with one statement per outcome."""
+        succeeded_ids = list(succeeded_ids)
+        failed_ids = list(failed_ids)
+        now = func.current_timestamp()
+        if succeeded_ids:
+            await session.execute(
+                update(Feed)
+                .where(Feed.id.in_(succeeded_ids))
+                .values(last_checked=now, last_success=now, error_count=0)
+            )
+        if failed_ids:
+            await session.execute(
+                update(Feed)
+                .where(Feed.id.in_(failed_ids))
+                .values(last_checked=now, error_count=func.coalesce(Feed.error_count, 0) + 1)
+            )
+        await session.commit()
+
+
+class ArticleRepository:
+    """Repository for Article operations."""
+    
+    @staticmethod
+    async def create(
+        session: AsyncSession,
+        feed_id: int,
+        url: str,
+        title: str,
+        summary: str,
+        published_at: Optional[datetime] = None,
+        image_url: Optional[str] = None,
+        telegram_message_id: Optional[int] = None,
+    ) -> Article:
+        """Create a new article."""
+        article = Article(
+            feed_id=feed_id,
+            url=url,
+            title=title,
+            summary=summary,
+            published_at=published_at,
+            image_url=image_url,
+            telegram_message_id=telegram_message_id,
+        )
+        session.add(article)
+        await session.commit()
+        logger.debug(f"Created article: {title}")
+        return article
+    
+    @staticmethod
+    async def insert_if_new(
+        session: AsyncSession,
+        feed_id: int,
+        url: str,
+        title: str,
+        summary: str,
+        published_at: Optional[datetime] = None,
+        image_url: Optional[str] = None,
+        telegram_message_id: Optional[int] = None,
+    ) -> Optional[int]:
+        """
+        Insert an article unless its URL is already stored, in one statement.
+        
+        Returns:
+            The new article id, or None if the URL already existed
+        """
+        result = await session.execute(
+            sqlite_insert(Article)
+            .values(
+                feed_id=feed_id,
+                url=url,
+                title=title,
+                summary=summary,
+                published_at=published_at,
+                image_url=image_url,
+                telegram_message_id=telegram_message_id,
+            )
+            .on_conflict_do_nothing(index_elements=[Article.url])
+            .returning(Article.id)
+        )
+        article_id = result.scalar_one_or_none()
+        await session.commit()
+        return article_id
+    
+    @staticmethod
+    async def set_telegram_message_id(
+        session: AsyncSession,
+        article_id: int,
+        message_id: int,
+        commit: bool = True,
+    ):
+        """
+        Record the Telegram message an article was posted as.
+        
+        Args:
+            commit: Commit right away; pass False to leave it to the caller's next commit
+        """
+        await session.execute(
+            update(Article).where(Article.id == article_id).values(telegram_message_id=message_id)
+        )
+        if commit:
+            await session.commit()
+    
+    @staticmethod
+    async def delete(session: AsyncSession, article_id: int):
+        """Delete an article."""
+        await session.execute(delete(Article).where(Article.id == article_id))
+        await session.commit()
+    
+    @staticmethod
+    async def get_by_url(session: AsyncSession, url: str) -> Optional[Article]:
+        """Get article by URL."""
+        result = await session.execute(_ARTICLE_BY_URL, {"url": url})
+        return result.scalar_one_or_none()
+    
+    @staticmethod
+    async def exists(session: AsyncSession, url: str) -> bool:
+        """Check if article exists."""
+        result = await session.execute(_ARTICLE_EXISTS, {"url": url})
+        return result.first() is not None
+    
+    @staticmethod
+    async def existing_urls(session: AsyncSession, urls: Iterable[str]) -> Set[str]:
+        """Return the subset of urls already stored, in one query."""
+        urls = set(urls)
+        if not urls:
+            return set()
+        result = await session.execute(select(Article.url).where(Article.url.in_(urls)))
+        return set(result.scalars().all())
+    
+    @staticmethod
+    async def get_recent(session: AsyncSession, limit: int = 100) -> List[Article]:
+        """Get recent articles."""
+        result = await session.execute(
+            select(Article).order_by(Article.posted_at.desc()).limit(limit)
+        )
+        return list(result.scalars().all())
+    
+    @staticmethod
+    async def get_recent_urls(session: AsyncSession, limit: int = 1000) -> List[str]:
+        """Get the URLs of the most recently posted articles, newest first."""
+        result = await session.execute(
+            select(Article.url)
+            .where(Article.telegram_message_id.is_not(None))
+            .order_by(Article.id.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+    
+    @staticmethod
+    async def release_stale_claims(session: AsyncSession, older_than_minutes: int) -> int:
+        """
+        Delete claimed articles that were never sent, e.g. after a crash mid-post.
+        
+        Args:
+            session: Database session
+            older_than_minutes: Only claims stored longer ago than this are dropped
+            
+        Returns:
+            Number of claims released
+        """
+        result = await session.execute(
+            delete(Article).where(
+                Article.telegram_message_id.is_(None),
+                Article.created_at < func.datetime("now", f"-{int(older_than_minutes)} minutes"),
+            )
+        )
+        await session.commit()
+        return result.rowcount
+
+
+class PostingLogRepository:
+    """Repository for PostingLog operations."""
+    
+    @staticmethod
+    async def create(
+        session: AsyncSession,
+        article_id: int,
+        status: str,
+        error_message: Optional[str] = None,
+        attempt_count: int = 1,
+    ) -> PostingLog:
+        """Create a posting log entry."""
+        log = PostingLog(
+            article_id=article_id,
+            status=status,
+            error_message=error_message,
+            attempt_count=attempt_count,
+        )
+        session.add(log)
+        await session.commit()
+        return log
+    
+    @staticmethod
+    async def get_by_article(session: AsyncSession, article_id: int) -> List[PostingLog]:
+        """Get all logs for an article."""
+        result = await session.execute(
+            select(PostingLog).where(PostingLog.article_id == article_id)
+        )
+        return list(result.scalars().all())
+
+
+class StatisticsRepository:
+    """Repository for Statistics operations."""
+    
+    COUNTERS = frozenset({
+        "articles_checked", "articles_posted", "articles_failed", "articles_skipped",
+    })
+    
+    @staticmethod
+    async def get_or_create_today(session: AsyncSession) -> Statistics:
+        """Get or create statistics for today."""
+        today = _today_key()
+        result = await session.execute(
+            select(Statistics)
+            .where(Statistics.date == today)
+            .execution_options(populate_existing=True)
+        )
+        stats = result.scalar_one_or_none()
+        
+        if not stats:
+            stats = Statistics(date=today)
+            session.add(stats)
+            await session.commit()
+        
+        return stats
+    
+    @staticmethod
+    async def increment(session: AsyncSession, field: str):
+        """
+        Add one to a counter in today's statistics row, creating the row if needed.
+        
+        A single INSERT ... ON CONFLICT DO UPDATE, so concurrent callers can't
+        race to create the same day's row.
+        
+        Args:
+            field: One of COUNTERS
+        """
+        if field not in StatisticsRepository.COUNTERS:
+            raise ValueError(f"Unknown statistics counter: {field}")
+        today = _today_key()
+        await session.execute(
+            sqlite_insert(Statistics)
+            .values(date=today, **{field: 1})
+            .on_conflict_do_update(
+                index_elements=[Statistics.date],
+                set_={field: func.coalesce(getattr(Statistics, field), 0) + 1},
+            )
+        )
+        await session.commit()
+    
+    @staticmethod
+    async def apply_deltas(
+        session: AsyncSession,
+        checked: int = 0,
+        posted: int = 0,
+        failed: int = 0,
+        skipped: int = 0,
+    ):
+        """Add several counts to today's statistics row in one UPSERT and one commit."""
+        deltas = {
+            "articles_checked": checked,
+            "articles_posted": posted,
+            "articles_failed": failed,
+            "articles_skipped": skipped,
+        }
+        deltas = {field: amount for field, amount in deltas.items() if amount}
+        if not deltas:
+            return
+        await session.execute(
+            sqlite_insert(Statistics)
+            .values(date=_today_key(), **deltas)
+            .on_conflict_do_update(
+                index_elements=[Statistics.date],
+                set_={
+                    field: func.coalesce(getattr(Statistics, field), 0) + amount
+                    for field, amount in deltas.items()
+                },
+            )
+        )
+        await session.commit()
+    
+    @staticmethod
+    async def increment_checked(session: AsyncSession):
+        """Increment articles checked count."""
+        await StatisticsRepository.increment(session, "articles_checked")
+    
+    @staticmethod
+    async def increment_posted(session: AsyncSession):
+        """Increment articles posted count."""
+        await StatisticsRepository.increment(session, "articles_posted")
+    
+    @staticmethod
+    async def increment_failed(session: AsyncSession):
+        """Increment articles failed count."""
+        await StatisticsRepository.increment(session, "articles_failed")
+    
+    @staticmethod
+    async def increment_skipped(session: AsyncSession):
+        """Increment articles skipped count."""
+        await StatisticsRepository.increment(session, "articles_skipped")
+    
+    @staticmethod
+    async def get_recent(session: AsyncSession, days: int = 7) -> List[Statistics]:
+        """Get statistics for recent days."""
+        result = await session.execute(
+            select(Statistics)
+            .order_by(Statistics.date.desc())
+            .limit(days)
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
@@ -1,13 +1,13 @@
-"""Services package."""
-
-from src.services.rss_service import RSSService
-from src.services.translation_service import TranslationService
-from src.services.image_service import ImageService
-from src.services.telegram_service import TelegramService
-
-__all__ = [
-    "RSSService",
-    "TranslationService",
-    "ImageService",
-    "TelegramService",
-]
+"""Services package."""
+
+from src.services.rss_service import RSSService
+from src.services.translation_service import TranslationService
+from src.services.image_service import ImageService
+from src.services.telegram_service import TelegramService
+
+__all__ = [
+    "RSSService",
+    "TranslationService",
+    "ImageService",
+    "TelegramService",
+]
@@ -1,144 +1,188 @@
-"""Image extraction service."""
-
-from typing import Optional, Dict, Any
-from urllib.parse import urljoin
-import requests
-from bs4 import BeautifulSoup
-from loguru import logger
-
-from src.config.settings import settings
-
-
-class ImageService:
-    """Service for extracting images from RSS feeds and web pages."""
-    
-    @staticmethod
-    def extract_from_rss(entry: Dict[str, Any]) -> Optional[str]:
-        """Extract image URL from RSS feed entry."""
-        if not settings.enable_image_fetching:
-            return None
-        
-        # Check standard media tags
-        for key in ["media_content", "media_thumbnail", "enclosures"]:
-            if key in entry:
-                for item in entry[key]:
-                    # Check for image in media_content
-                    if "url" in item and "image" in item.get("medium", ""):
-                        url = item["url"]
-                        logger.info(f"Found image in RSS {key}: {url}")
-                        return url
-                    
-                    # Check for image in href
-                    if "href" in item and "image" in item.get("type", ""):
-                        url = item["href"]
-                        logger.info(f"Found image in RSS {key}: {url}")
-                        return url
-        
-        return None
-    
-    @staticmethod
-    def extract_from_page(article_url: str) -> Optional[str]:
-        """Extract Open Graph image from article page."""
-        if not settings.enable_image_fetching or not article_url:
-            return None
-        
-        try:
-            logger.info(f"Fetching page for image: {article_url}")
-            
-            response = requests.get(
-                article_url,
-                headers={"User-Agent": settings.user_agent},
-                timeout=settings.request_timeout,
-                allow_redirects=True,
-            )
-            response.raise_for_status()
-            
-            # Check content type
-            content_type = response.headers.get("content-type", "").lower()
-            if "html" not in content_type:
-                logger.warning(
-                    f"Content type is not HTML ({content_type}), "
-                    f"skipping image parse for {article_url}"
-                )
-                return None
-            
-            # Parse HTML
-            soup = BeautifulSoup(response.text, "lxml")
-            
-            # Look for Open Graph image
-            og_image_tag = soup.find("meta", property="og:image")
-            if og_image_tag and og_image_tag.get("content"):
-                image_url = og_image_tag["content"]
-                
-                # Handle relative URLs
-                if image_url.startswith("/"):
-                    image_url = urljoin(article_url, image_url)
-                
-                logger.success(f"Found og:image: {image_url}")
-                return image_url
-            
-            # Fallback: look for Twitter image
-            twitter_image_tag = soup.find("meta", attrs={"name": "twitter:image"})
-            if twitter_image_tag and twitter_image_tag.get("content"):
-                image_url = twitter_image_tag["content"]
-                if image_url.startswith("/"):
-                    image_url = urljoin(article_url, image_url)
-                logger.success(f"Found twitter:image: {image_url}")
-                return image_url
-            
-            logger.info(f"No image meta tags found on page: {article_url}")
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to fetch article page {article_url}: {e}")
-        except Exception as e:
-            logger.error(f"Error parsing page {article_url} for image: {e}")
-        
-        return None
-    
-    @staticmethod
-    def extract_image(entry: Dict[str, Any], article_url: str) -> Optional[str]:
-        """
-        Extract image URL from RSS entry or article page.
-        
-        Args:
-            entry: Raw RSS entry
-            article_url: URL of the article
-        
-        Returns:
-            Image URL or None
-        """
-        # Try RSS first
-        image_url = ImageService.extract_from_rss(entry)
-        if image_url:
-            return image_url
-        
-        # Fallback to page scraping
-        return ImageService.extract_from_page(article_url)
-    
-    @staticmethod
-    def validate_image_url(url: Optional[str]) -> bool:
-        """Validate that an image URL is accessible."""
-        if not url:
-            return False
-        
-        try:
-            response = requests.head(
-                url,
-                headers={"User-Agent": settings.user_agent},
-                timeout=5,
-                allow_redirects=True,
-            )
-            
-            content_type = response.headers.get("content-type", "").lower()
-            is_image = "image" in content_type
-            
-            if is_image:
-                logger.success(f"Image URL validated: {url}")
-            else:
-                logger.warning(f"URL is not an image: {url} ({content_type})")
-            
-            return is_image
-            
-        except Exception as e:
-            logger.error(f"Failed to validate image URL {url}: {e}")
-            return False
+"""Image extraction service."""
+
+import asyncio
+from typing import Optional, Dict, Any
+from urllib.parse import urljoin
+import aiohttp
+from loguru import logger
+
+from src.config.settings import settings
+from src.utils.cache import LRUCache
+from src.utils.markup import find_meta_content
+
+_OG_IMAGE = ("property", "og:image")
+_TWITTER_IMAGE = ("name", "twitter:image")
+
+# Image meta tags live in <head>; stop reading a page once it ends, or at this size
+_HEAD_END = b"</head>"
+_HEAD_READ_LIMIT = 256 * 1024
+
+
+async def _read_head(response: aiohttp.ClientResponse) -> str:
+    """Read a page up to the end of its <head>, without downloading the body."""
+    buf = bytearray()
+    async for chunk in response.content.iter_chunked(16 * 1024):
+        start = max(0, len(buf) - len(_HEAD_END))
+        buf += chunk
+        end = buf[start:].lower().find(_HEAD_END)
+        if end != -1:
+            del buf[start + end + len(_HEAD_END):]
+            break
+        if len(buf) >= _HEAD_READ_LIMIT:
+            break
+    try:
+        return buf.decode(response.charset or "utf-8", errors="replace")
+    except LookupError:  # Unknown charset name in the header
+        return buf.decode("utf-8", errors="replace")
+
+
+class ImageService:
+    """Service for extracting images from RSS feeds and web pages."""
+    
+    # URL -> whether it served an image; default thumbnails recur across feeds
+    _validated = LRUCache(maxsize=2048, ttl_seconds=3600)
+    
+    @staticmethod
+    def extract_from_rss(entry: Dict[str, Any]) -> Optional[str]:
+        """Extract image URL from RSS feed entry."""
+        if not settings.enable_image_fetching:
+            return None
+        
+        # Check standard media tags
+        for key in ["media_content", "media_thumbnail", "enclosures"]:
+            if key in entry:
+                for item in entry[key]:
+                    # Check for image in media_content
+                    if "url" in item and "image" in item.get("medium", ""):
+                        url = item["url"]
+                        logger.info(f"Found image in RSS {key}: {url}")
+                        return url
+                    
+                    # Check for image in href
+                    if "href" in item and "image" in item.get("type", ""):
+                        url = item["href"]
+                        logger.info(f"Found image in RSS {key}: {url}")
+                        return url
+        
+        return None
+    
+    @staticmethod
+    def find_meta_image(html: str, article_url: str) -> Optional[str]:
+        """Find the Open Graph or Twitter image declared in a page's HTML."""
+        meta = find_meta_content(html, (_OG_IMAGE, _TWITTER_IMAGE))
+        
+        # Look for Open Graph image
+        image_url = meta[_OG_IMAGE]
+        if image_url:
+            # Handle relative URLs
+            if image_url.startswith("/"):
+                image_url = urljoin(article_url, image_url)
+            
+            logger.success(f"Found og:image: {image_url}")
+            return image_url
+        
+        # Fallback: look for Twitter image
+        image_url = meta[_TWITTER_IMAGE]
+        if image_url:
+            if image_url.startswith("/"):
+                image_url = urljoin(article_url, image_url)
+            logger.success(f"Found twitter:image: {image_url}")
+            return image_url
+        
+        logger.info(f"No image meta tags found on page: {article_url}")
+        return None
+    
+    @staticmethod
+    async def extract_from_page(
+        article_url: str, session: aiohttp.ClientSession
+    ) -> Optional[str]:
+        """Extract Open Graph image from article page, fetched over a shared session."""
+        if not settings.enable_image_fetching or not article_url:
+            return None
+        
+        try:
+            logger.info(f"Fetching page for image: {article_url}")
+            
+            async with session.get(
+                article_url,
+                headers={"User-Agent": settings.user_agent},
+                timeout=aiohttp.ClientTimeout(total=settings.request_timeout),
+                allow_redirects=True,
+            ) as response:
+                response.raise_for_status()
+                
+                # Check content type
+                content_type = response.headers.get("content-type", "").lower()
+                if "html" not in content_type:
+                    logger.warning(
+                        f"Content type is not HTML ({content_type}), "
+                        f"skipping image parse for {article_url}"
+                    )
+                    return None
+                
+                html = await _read_head(response)
+            
+            # Parse HTML off the event loop
+            return await asyncio.to_thread(ImageService.find_meta_image, html, article_url)
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Failed to fetch article page {article_url}: {e}")
+        except Exception as e:
+            logger.error(f"Error parsing page {article_url} for image: {e}")
+        
+        return None
+    
+    @staticmethod
+    async def extract_image(
+        entry: Dict[str, Any], article_url: str, session: aiohttp.ClientSession
+    ) -> Optional[str]:
+        """
+        Extract image URL from RSS entry or article page.
+        
+        Args:
+            entry: Raw RSS entry
+            article_url: URL of the article
+            session: Shared HTTP session for the page fetch
+        
+        Returns:
+            Image URL or None
+        """
+        # Try RSS first
+        image_url = ImageService.extract_from_rss(entry)
+        if image_url:
+            return image_url
+        
+        # Fallback to page scraping
+        return await ImageService.extract_from_page(article_url, session)
+    
+    @staticmethod
+    async def validate_image_url(url: Optional[str], session: aiohttp.ClientSession) -> bool:
+        """Validate that an image URL is accessible."""
+        if not url:
+            return False
+        
+        cached = ImageService._validated.get(url)
+        if cached is not None:
+            return cached
+        
+        try:
+            async with session.head(
+                url,
+                headers={"User-Agent": settings.user_agent},
+                timeout=aiohttp.ClientTimeout(total=5),
+                allow_redirects=True,
+            ) as response:
+                content_type = response.headers.get("content-type", "").lower()
+            is_image = "image" in content_type
+            
+            if is_image:
+                logger.success(f"Image URL validated: {url}")
+            else:
+                logger.warning(f"URL is not an image: {url} ({content_type})")
+            
+            ImageService._validated.set(url, is_image)
+            return is_image
+            
+        except Exception as e:
+            logger.error(f"Failed to validate image URL {url}: {e}")
+            return False
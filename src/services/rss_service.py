@@ -1,133 +1,337 @@
-"""RSS feed service for fetching and parsing feeds."""
-
-import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-import feedparser
-from loguru import logger
-
-from src.config.settings import settings
-
-
-class RSSService:
-    """Service for RSS feed operations."""
-    
-    @staticmethod
-    def parse_feed(feed_url: str) -> Optional[feedparser.FeedParserDict]:
-        """Parse an RSS feed."""
-        try:
-            logger.info(f"Parsing feed: {feed_url}")
-            feed = feedparser.parse(feed_url)
-            
-            if feed.bozo:
-                logger.warning(
-                    f"Feed potentially malformed: {feed_url} - {feed.bozo_exception}"
-                )
-            
-            if not feed.entries:
-                logger.warning(f"No entries found in feed: {feed_url}")
-                return None
-            
-            logger.success(f"Parsed {len(feed.entries)} entries from {feed_url}")
-            return feed
-            
-        except Exception as e:
-            logger.error(f"Failed to parse feed {feed_url}: {e}")
-            return None
-    
-    @staticmethod
-    def extract_entry_data(entry: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract relevant data from a feed entry."""
-        # Get title
-        title = entry.get("title", "No Title")
-        
-        # Get link
-        link = entry.get("link", "#")
-        
-        # Get summary and clean HTML
-        summary = entry.get("summary", entry.get("description", ""))
-        if summary and "<" in summary:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(summary, "html.parser")
-            summary = soup.get_text(separator=" ", strip=True)
-        
-        # Limit summary length
-        if len(summary) > 300:
-            summary = summary[:300].rsplit(" ", 1)[0] + "..."
-        
-        # Get published date
-        published_at = None
-        if entry.get("published_parsed"):
-            try:
-                published_at = datetime.fromtimestamp(
-                    time.mktime(entry.get("published_parsed"))
-                )
-            except Exception as e:
-                logger.warning(f"Failed to parse published date: {e}")
-        
-        return {
-            "title": title,
-            "link": link,
-            "summary": summary,
-            "published_at": published_at,
-        }
-    
-    @staticmethod
-    def is_article_recent(published_at: Optional[datetime]) -> bool:
-        """Check if article is within the age limit."""
-        if not published_at:
-            return True  # If no date, assume it's recent
-        
-        cutoff_time = datetime.now() - timedelta(hours=settings.max_article_age_hours)
-        return published_at >= cutoff_time
-    
-    @staticmethod
-    def contains_keywords(text: str, keywords: List[str]) -> bool:
-        """Check if text contains any of the keywords."""
-        if not text:
-            return False
-        
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in keywords)
-    
-    @staticmethod
-    def filter_entry(entry_data: Dict[str, Any]) -> bool:
-        """Filter entry based on keywords and age."""
-        # Check age
-        if not RSSService.is_article_recent(entry_data.get("published_at")):
-            logger.debug(f"Article too old: {entry_data['title']}")
-            return False
-        
-        # Check keywords
-        keywords = settings.keyword_list
-        title = entry_data.get("title", "")
-        summary = entry_data.get("summary", "")
-        
-        if not (
-            RSSService.contains_keywords(title, keywords)
-            or RSSService.contains_keywords(summary, keywords)
-        ):
-            logger.debug(f"Article doesn't match keywords: {entry_data['title']}")
-            return False
-        
-        return True
-    
-    @staticmethod
-    async def fetch_relevant_entries(feed_url: str) -> List[Dict[str, Any]]:
-        """Fetch and filter relevant entries from a feed."""
-        feed = RSSService.parse_feed(feed_url)
-        if not feed:
-            return []
-        
-        relevant_entries = []
-        
-        for entry in feed.entries:
-            entry_data = RSSService.extract_entry_data(entry)
-            entry_data["raw_entry"] = entry  # Keep raw entry for image extraction
-            
-            if RSSService.filter_entry(entry_data):
-                relevant_entries.append(entry_data)
-                logger.info(f"Found relevant article: {entry_data['title']}")
-        
-        logger.info(f"Found {len(relevant_entries)} relevant entries from {feed_url}")
-        return relevant_entries
+"""RSS feed service for fetching and parsing feeds."""
+
+import asyncio
+import html
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from io import BytesIO
+from typing import Callable, List, Dict, Any, Optional, Tuple
+import aiohttp
+import feedparser
+from loguru import logger
+from lxml import etree
+
+from src.config.settings import settings
+from src.utils.cache import LRUCache
+from src.utils.markup import html_to_text
+
+try:
+    import ahocorasick
+except ImportError:  # Optional speedup, fall back to a compiled regex
+    ahocorasick = None
+
+# Summaries are short fragments; strip their tags with regexes instead of building a tree
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+# Contents of these tags aren't text, so leave them to the real parser
+_NON_TEXT_TAG_RE = re.compile(r"<(?:script|style|!--)", re.IGNORECASE)
+_FRAGMENT_LIMIT = 4096
+
+# Feeds this big are cut down to their leading entries before feedparser sees them
+_LARGE_FEED_BYTES = 1024 * 1024
+# RSS 2.0 items, RSS 1.0 (RDF) items and Atom entries
+_ENTRY_TAGS = ("item", "{http://purl.org/rss/1.0/}item", "{http://www.w3.org/2005/Atom}entry")
+# Where entries keep their publication date, in order of preference
+_DATE_TAGS = (
+    "pubDate",
+    "{http://purl.org/dc/elements/1.1/}date",
+    "{http://www.w3.org/2005/Atom}published",
+    "{http://www.w3.org/2005/Atom}updated",
+)
+
+
+def _entry_date(entry) -> Optional[datetime]:
+    """Read an entry's publication date from RSS, RDF or Atom markup, if it has one."""
+    for tag in _DATE_TAGS:
+        text = (entry.findtext(tag) or "").strip()
+        if not text:
+            continue
+        try:
+            date = parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            try:
+                date = datetime.fromisoformat(text)
+            except ValueError:
+                continue
+        return date if date.tzinfo else date.replace(tzinfo=timezone.utc)
+    return None
+
+
+def _truncate_feed(content: bytes, limit: int) -> bytes:
+    """
+    Keep only the first limit entries of a large feed document.
+    
+    Stream-parses the feed and stops after the limit-th entry, so the rest of
+    the document is never built into a tree. Small or unparseable feeds, and
+    feeds listing their oldest entries first, are returned unchanged for
+    feedparser to handle.
+    """
+    if len(content) < _LARGE_FEED_BYTES:
+        return content
+    
+    first = entry = None
+    try:
+        events = etree.iterparse(
+            BytesIO(content), events=("end",), tag=_ENTRY_TAGS,
+            resolve_entities=False, no_network=True,
+        )
+        for count, (_, entry) in enumerate(events, 1):
+            if first is None:
+                first = entry
+            if count >= limit:
+                break
+    except etree.LxmlError:
+        return content
+    if entry is None:
+        return content
+    
+    # The newest entries of an oldest-first feed are at the end, so keep them all
+    first_date, last_date = _entry_date(first), _entry_date(entry)
+    if first_date and last_date and last_date > first_date:
+        return content
+    
+    # The parser reads ahead, so drop anything it already built past the last entry
+    node = entry
+    while node is not None:
+        while node.getnext() is not None:
+            node.getparent().remove(node.getnext())
+        node = node.getparent()
+    return etree.tostring(entry.getroottree(), encoding="utf-8", xml_declaration=True)
+
+
+@lru_cache(maxsize=8)
+def _keyword_matcher(keywords: Tuple[str, ...]) -> Callable[[str], bool]:
+    """Build a predicate telling whether text contains any of the keywords as a substring."""
+    if not keywords or "" in keywords:
+        # Nothing to find, or an empty keyword that is in every text
+        matches = bool(keywords)
+        return lambda text: matches
+    if ahocorasick is None:
+        pattern = re.compile("|".join(re.escape(keyword) for keyword in keywords))
+        return lambda text: pattern.search(text) is not None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text), None) is not None
+
+
+class RSSService:
+    """Service for RSS feed operations."""
+    
+    # Feed URL -> ETag / Last-Modified validators from its last full download
+    _validators: Dict[str, Dict[str, str]] = {}
+    # Feed URL -> the feed parsed from that download, served again on 304
+    _last_feeds: Dict[str, feedparser.FeedParserDict] = {}
+    # Entries filter_entry rejected; they only get older, so skip re-extracting them
+    _rejected_ids = LRUCache(maxsize=4096)
+    
+    @staticmethod
+    def parse_feed(
+        feed_url: str, content: Optional[bytes] = None
+    ) -> Optional[feedparser.FeedParserDict]:
+        """Parse an RSS feed, from already downloaded content if given."""
+        try:
+            logger.info(f"Parsing feed: {feed_url}")
+            # Summaries are reduced to plain text later, so skip feedparser's
+            # HTML sanitizing and URI rewriting of entry content
+            if content is not None:
+                content = _truncate_feed(content, settings.max_entries_per_feed)
+            feed = feedparser.parse(
+                content if content is not None else feed_url,
+                sanitize_html=False,
+                resolve_relative_uris=False,
+            )
+            
+            if feed.bozo:
+                logger.warning(
+                    f"Feed potentially malformed: {feed_url} - {feed.bozo_exception}"
+                )
+            
+            if not feed.entries:
+                logger.warning(f"No entries found in feed: {feed_url}")
+                return None
+            
+            logger.success(f"Parsed {len(feed.entries)} entries from {feed_url}")
+            return feed
+            
+        except Exception as e:
+            logger.error(f"Failed to parse feed {feed_url}: {e}")
+            return None
+    
+    @staticmethod
+    async def fetch_feed(
+        feed_url: str, session: aiohttp.ClientSession
+    ) -> Optional[feedparser.FeedParserDict]:
+        """
+        Download a feed over a shared session and parse it off the event loop.
+        
+        Sends the validators from the previous download, so an unchanged feed
+        comes back as 304 Not Modified and is neither downloaded nor parsed;
+        the feed parsed last time is returned instead, so entries a previous
+        cycle didn't get to post are still offered.
+        
+        Returns:
+            Parsed feed, or None if it failed
+        """
+        headers = {"User-Agent": settings.user_agent}
+        validators = RSSService._validators.get(feed_url, {})
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "modified" in validators:
+            headers["If-Modified-Since"] = validators["modified"]
+        
+        try:
+            async with session.get(
+                feed_url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=settings.request_timeout),
+            ) as response:
+                if response.status == 304 and feed_url in RSSService._last_feeds:
+                    logger.info(f"Feed not modified: {feed_url}")
+                    return RSSService._last_feeds[feed_url]
+                response.raise_for_status()
+                content = await response.read()
+                etag = response.headers.get("ETag")
+                modified = response.headers.get("Last-Modified")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Failed to fetch feed {feed_url}: {e}")
+            return None
+        
+        feed = await asyncio.to_thread(RSSService.parse_feed, feed_url, content)
+        if feed is not None:
+            # Only remember validators for content we actually processed
+            validators = {}
+            if etag:
+                validators["etag"] = etag
+            if modified:
+                validators["modified"] = modified
+            RSSService._validators[feed_url] = validators
+            RSSService._last_feeds[feed_url] = feed
+        return feed
+    
+    @staticmethod
+    def extract_entry_data(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract relevant data from a feed entry."""
+        # Get title
+        title = entry.get("title", "No Title")
+        
+        # Get link
+        link = entry.get("link", "#")
+        
+        # Get summary and clean HTML
+        summary = entry.get("summary", entry.get("description", ""))
+        if summary and "<" in summary:
+            if len(summary) < _FRAGMENT_LIMIT and not _NON_TEXT_TAG_RE.search(summary):
+                summary = _WS_RE.sub(" ", html.unescape(_TAG_RE.sub(" ", summary))).strip()
+            else:
+                summary = html_to_text(summary)
+        
+        # Limit summary length
+        if len(summary) > 300:
+            summary = summary[:300].rsplit(" ", 1)[0] + "..."
+        
+        # Get published date
+        published_at = None
+        if entry.get("published_parsed"):
+            try:
+                published_at = datetime.fromtimestamp(
+                    time.mktime(entry.get("published_parsed"))
+                )
+            except Exception as e:
+                logger.warning(f"Failed to parse published date: {e}")
+        
+        return {
+            "title": title,
+            "link": link,
+            "summary": summary,
+            "published_at": published_at,
+        }
+    
+    @staticmethod
+    def is_article_recent(published_at: Optional[datetime]) -> bool:
+        """Check if article is within the age limit."""
+        if not published_at:
+            return True  # If no date, assume it's recent
+        
+        cutoff_time = datetime.now() - timedelta(hours=settings.max_article_age_hours)
+        return published_at >= cutoff_time
+    
+    @staticmethod
+    def contains_keywords(text: str, keywords: List[str]) -> bool:
+        """Check if text contains any of the keywords."""
+        if not text:
+            return False
+        
+        return RSSService.contains_keywords_lower(text.lower(), keywords)
+    
+    @staticmethod
+    def contains_keywords_lower(text_lower: str, keywords: List[str]) -> bool:
+        """Like contains_keywords, for text that is already lowercase."""
+        return _keyword_matcher(tuple(keywords))(text_lower)
+    
+    @staticmethod
+    def filter_entry(entry_data: Dict[str, Any]) -> bool:
+        """Filter entry based on keywords and age."""
+        # Check age
+        if not RSSService.is_article_recent(entry_data.get("published_at")):
+            logger.debug(f"Article too old: {entry_data['title']}")
+            return False
+        
+        # Check keywords
+        keywords = settings.keyword_list
+        title = entry_data.get("title") or ""
+        summary = entry_data.get("summary") or ""
+        
+        # Lowercase and scan title and summary together; keywords never span the newline
+        if not RSSService.contains_keywords_lower(f"{title}\n{summary}".lower(), keywords):
+            logger.debug(f"Article doesn't match keywords: {entry_data['title']}")
+            return False
+        
+        return True
+    
+    @staticmethod
+    async def fetch_relevant_entries(
+        feed_url: str, session: Optional[aiohttp.ClientSession] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch and filter relevant entries from a feed."""
+        if session is not None:
+            feed = await RSSService.fetch_feed(feed_url, session)
+        else:
+            # feedparser downloads and parses synchronously, so keep it off the event loop
+            feed = await asyncio.to_thread(RSSService.parse_feed, feed_url)
+        if not feed:
+            return []
+        
+        # Newest first, undated entries last; only the head of a long archive matters
+        entries = sorted(
+            feed.entries,
+            key=lambda entry: (
+                entry.get("published_parsed") is not None,
+                tuple(entry.get("published_parsed") or ()),
+            ),
+            reverse=True,
+        )[:settings.max_entries_per_feed]
+        
+        relevant_entries = []
+        
+        for entry in entries:
+            entry_id = entry.get("id") or entry.get("link")
+            if entry_id and RSSService._rejected_ids.get(entry_id):
+                continue
+            
+            entry_data = RSSService.extract_entry_data(entry)
+            entry_data["raw_entry"] = entry  # Keep raw entry for image extraction
+            
+            if RSSService.filter_entry(entry_data):
+                relevant_entries.append(entry_data)
+                logger.info(f"Found relevant article: {entry_data['title']}")
+            elif entry_id:
+                RSSService._rejected_ids.set(entry_id, True)
+        
+        logger.info(f"Found {len(relevant_entries)} relevant entries from {feed_url}")
+        return relevant_entries
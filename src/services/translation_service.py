@@ -1,103 +1,176 @@
-"""Translation service with fallback mechanisms."""
-
-from typing import Optional
-import translators as ts
-from loguru import logger
-
-from src.config.settings import settings
-
-
-class TranslationService:
-    """Service for text translation."""
-    
-    # Translation backends in order of preference
-    BACKENDS = ["bing", "google", "yandex"]
-    
-    @staticmethod
-    def translate(
-        text: str,
-        target_lang: str,
-        source_lang: str = "en",
-        backend: Optional[str] = None,
-    ) -> str:
-        """
-        Translate text with fallback mechanisms.
-        
-        Args:
-            text: Text to translate
-            target_lang: Target language code (uz, ru, etc.)
-            source_lang: Source language code (default: en)
-            backend: Preferred backend (default: from settings)
-        
-        Returns:
-            Translated text or original text if translation fails
-        """
-        if not text or not settings.enable_translation:
-            return text
-        
-        # Determine backends to try
-        preferred_backend = backend or settings.translation_backend
-        backends_to_try = [preferred_backend] + [
-            b for b in TranslationService.BACKENDS if b != preferred_backend
-        ]
-        
-        # Try each backend
-        for translator_backend in backends_to_try:
-            try:
-                logger.info(
-                    f"Translating to {target_lang} using {translator_backend}"
-                )
-                translated = ts.translate_text(
-                    text,
-                    translator=translator_backend,
-                    from_language=source_lang,
-                    to_language=target_lang,
-                )
-                
-                if translated and translated != text:
-                    logger.success(
-                        f"Translation successful with {translator_backend}: "
-                        f"{translated[:50]}..."
-                    )
-                    return translated
-                
-            except Exception as e:
-                logger.warning(
-                    f"Translation failed with {translator_backend}: {e}"
-                )
-                continue
-        
-        # All backends failed
-        logger.error(
-            f"All translation backends failed for target language {target_lang}. "
-            "Returning original text."
-        )
-        return text
-    
-    @staticmethod
-    def translate_to_uzbek(text: str) -> str:
-        """Translate text to Uzbek."""
-        return TranslationService.translate(
-            text, target_lang=settings.translation_target_lang
-        )
-    
-    @staticmethod
-    def translate_to_russian(text: str) -> str:
-        """Translate text to Russian."""
-        return TranslationService.translate(
-            text, target_lang=settings.translation_secondary_lang
-        )
-    
-    @staticmethod
-    def translate_multi(text: str) -> dict:
-        """
-        Translate text to multiple languages.
-        
-        Returns:
-            Dictionary with language codes as keys and translations as values
-        """
-        return {
-            "en": text,  # Original English
-            "uz": TranslationService.translate_to_uzbek(text),
-            "ru": TranslationService.translate_to_russian(text),
-        }
+"""Translation service with fallback mechanisms."""
+
+import asyncio
+import hashlib
+import threading
+from functools import cache, lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
+import translators as ts
+from loguru import logger
+
+from src.config.settings import settings
+from src.utils.cache import LRUCache, PersistentCache
+
+
+class TranslationService:
+    """Service for text translation."""
+    
+    # Translation backends in order of preference
+    BACKENDS = ["bing", "google", "yandex"]
+    
+    # Recent translations; feeds often republish the same entry across polls
+    _memory_cache = LRUCache(maxsize=4096)
+    # translate_multi calls translate from worker threads, and shelve is not thread-safe
+    _cache_lock = threading.Lock()
+    
+    @staticmethod
+    @cache
+    def _disk_cache() -> PersistentCache:
+        """Translations kept across restarts, opened on first use."""
+        return PersistentCache(
+            str(Path(settings.cache_dir) / "translations"),
+            ttl_seconds=settings.translation_cache_days * 86400,
+        )
+    
+    @staticmethod
+    def close():
+        """Flush and close the on-disk translation cache, if it was opened."""
+        with TranslationService._cache_lock:
+            if TranslationService._disk_cache.cache_info().currsize:
+                TranslationService._disk_cache().close()
+                TranslationService._disk_cache.cache_clear()
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _ordered_backends(preferred: str) -> Tuple[str, ...]:
+        """The preferred backend first, then the rest of BACKENDS in order."""
+        return (preferred, *(b for b in TranslationService.BACKENDS if b != preferred))
+    
+    @staticmethod
+    def translate(
+        text: str,
+        target_lang: str,
+        source_lang: str = "en",
+        backend: Optional[str] = None,
+    ) -> str:
+        """
+        Translate text with fallback mechanisms.
+        
+        Args:
+            text: Text to translate
+            target_lang: Target language code (uz, ru, etc.)
+            source_lang: Source language code (default: en)
+            backend: Preferred backend (default: from settings)
+        
+        Returns:
+            Translated text or original text if translation fails
+        """
+        if not text or not settings.enable_translation:
+            return text
+        
+        # Surrounding whitespace doesn't change the translation
+        stripped = text.strip()
+        cache_key = hashlib.blake2b(
+            f"{source_lang}\n{target_lang}\n{stripped}".encode(), digest_size=16
+        ).hexdigest()
+        with TranslationService._cache_lock:
+            translated = TranslationService._memory_cache.get(cache_key)
+            if translated is None:
+                translated = TranslationService._disk_cache().get(cache_key)
+                if translated is not None:
+                    TranslationService._memory_cache.set(cache_key, translated)
+        if translated is not None:
+            logger.debug(f"Using cached {target_lang} translation")
+            return translated
+        
+        translated = TranslationService._translate_uncached(
+            stripped, target_lang, source_lang, backend
+        )
+        if translated is None:
+            return text
+        
+        with TranslationService._cache_lock:
+            TranslationService._memory_cache.set(cache_key, translated)
+            TranslationService._disk_cache().set(cache_key, translated)
+        return translated
+    
+    @staticmethod
+    def _translate_uncached(
+        text: str,
+        target_lang: str,
+        source_lang: str,
+        backend: Optional[str],
+    ) -> Optional[str]:
+        """Try each backend in turn; returns None if none produced a translation."""
+        backends_to_try = TranslationService._ordered_backends(
+            backend or settings.translation_backend
+        )
+        
+        # Try each backend
+        for translator_backend in backends_to_try:
+            try:
+                logger.info(
+                    f"Translating to {target_lang} using {translator_backend}"
+                )
+                translated = ts.translate_text(
+                    text,
+                    translator=translator_backend,
+                    from_language=source_lang,
+                    to_language=target_lang,
+                )
+                
+                if translated and translated != text:
+                    logger.success(
+                        f"Translation successful with {translator_backend}: "
+                        f"{translated[:50]}..."
+                    )
+                    return translated
+                
+            except Exception as e:
+                logger.warning(
+                    f"Translation failed with {translator_backend}: {e}"
+                )
+                continue
+        
+        # All backends failed
+        logger.error(
+            f"All translation backends failed for target language {target_lang}. "
+            "Returning original text."
+        )
+        return None
+    
+    @staticmethod
+    def translate_to_uzbek(text: str) -> str:
+        """Translate text to Uzbek."""
+        return TranslationService.translate(
+            text, target_lang=settings.translation_target_lang
+        )
+    
+    @staticmethod
+    def translate_to_russian(text: str) -> str:
+        """Translate text to Russian."""
+        return TranslationService.translate(
+            text, target_lang=settings.translation_secondary_lang
+        )
+    
+    @staticmethod
+    async def translate_multi(text: str) -> dict:
+        """
+        Translate text to multiple languages.
+        
+        The translations are blocking HTTP calls, so each runs in its own
+        worker thread and both are in flight at once.
+        
+        Returns:
+            Dictionary with language codes as keys and translations as values
+        """
+        uz, ru = await asyncio.gather(
+            asyncio.to_thread(TranslationService.translate_to_uzbek, text),
+            asyncio.to_thread(TranslationService.translate_to_russian, text),
+        )
+        return {
+            "en": text,  # Original English
+            "uz": uz,
+            "ru": ru,
+        }
@@ -1,4 +1,14 @@
-"""Utility functions and helpers."""
-
-# Placeholder for future utilities
-__all__ = []
+"""Utility functions and helpers."""
+
+from src.utils.backoff import backoff_delay, sleep_backoff
+from src.utils.cache import LRUCache, PersistentCache
+from src.utils.markup import find_meta_content, html_to_text
+
+__all__ = [
+    "LRUCache",
+    "PersistentCache",
+    "backoff_delay",
+    "find_meta_content",
+    "html_to_text",
+    "sleep_backoff",
+]
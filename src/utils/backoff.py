@@ -0,0 +1,19 @@
+"""Retry backoff helpers."""
+
+import asyncio
+import random
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """
+    Pick a jittered delay before retry number attempt (0-based).
+    
+    The delay is drawn uniformly from [base, base * 3 ** attempt] and capped,
+    so callers failing at the same moment don't all retry in lockstep.
+    """
+    return min(cap, random.uniform(base, base * 3 ** attempt))
+
+
+async def sleep_backoff(attempt: int, base: float = 0.5, cap: float = 30.0):
+    """Sleep for a jittered backoff_delay before the next retry."""
+    await asyncio.sleep(backoff_delay(attempt, base, cap))
@@ -0,0 +1,108 @@
+"""Caching helpers."""
+
+import shelve
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional
+
+
+class PersistentCache:
+    """Small on-disk key/value cache with per-entry expiry, backed by shelve."""
+    
+    def __init__(self, path: str, ttl_seconds: float, sync_interval: float = 60.0):
+        """
+        Open (or create) the cache.
+        
+        Args:
+            path: Cache file path, without extension
+            ttl_seconds: How long an entry stays valid after it is set
+            sync_interval: Least number of seconds between flushes to disk on set
+        """
+        cache_path = Path(path)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.sync_interval = sync_interval
+        self._db = shelve.open(str(cache_path))
+        self._last_sync = time.monotonic()
+        self.purge_expired()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._db.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at < time.time():
+            del self._db[key]
+            return None
+        return value
+    
+    def set(self, key: str, value: Any):
+        """Store a value; it reaches disk with the next periodic sync or on close."""
+        self._db[key] = (time.time() + self.ttl_seconds, value)
+        if time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+    
+    def sync(self):
+        """Flush pending writes to disk."""
+        self._db.sync()
+        self._last_sync = time.monotonic()
+    
+    def purge_expired(self):
+        """Drop all expired entries."""
+        now = time.time()
+        expired = [key for key, (expires_at, _) in self._db.items() if expires_at < now]
+        for key in expired:
+            del self._db[key]
+        if expired:
+            self.sync()
+    
+    def close(self):
+        """Flush and close the cache file."""
+        self._db.close()
+
+
+class LRUCache:
+    """In-memory least-recently-used cache with optional per-entry expiry."""
+    
+    def __init__(self, maxsize: int = 128, ttl_seconds: Optional[float] = None):
+        """
+        Create an empty cache.
+        
+        Args:
+            maxsize: Most entries kept; the least recently used one is evicted first
+            ttl_seconds: How long an entry stays valid after it is set, or None for no expiry
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entry when full."""
+        expires_at = None if self.ttl_seconds is None else time.monotonic() + self.ttl_seconds
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self):
+        """Drop all entries."""
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
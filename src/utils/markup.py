@@ -0,0 +1,69 @@
+"""HTML helpers, backed by selectolax when installed and BeautifulSoup otherwise."""
+
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional speedup, fall back to BeautifulSoup
+    LexborHTMLParser = None
+
+# Joins text nodes internally; can't occur in HTML text
+_NODE_SEP = "\x00"
+_META_ONLY = SoupStrainer("meta")
+
+
+def html_to_text(html: str) -> str:
+    """Strip tags from HTML, joining its non-blank text nodes with single spaces."""
+    if not html:
+        return html
+    if LexborHTMLParser is None:
+        return BeautifulSoup(html, "html.parser").get_text(separator=" ", strip=True)
+    
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(["script", "style"])
+    parts = tree.text(separator=_NODE_SEP, strip=True).split(_NODE_SEP)
+    return " ".join(part for part in parts if part)
+
+
+def find_meta_content(
+    html: str, keys: Sequence[Tuple[str, str]]
+) -> Dict[Tuple[str, str], Optional[str]]:
+    """
+    Read <meta> tag contents from a page in a single pass over its meta tags.
+    
+    Args:
+        html: Page HTML
+        keys: (attribute, value) pairs to look up, e.g. ("property", "og:image")
+    
+    Returns:
+        The content of the first matching tag with non-empty content for each key, or None
+    """
+    found: Dict[Tuple[str, str], Optional[str]] = dict.fromkeys(keys)
+    if LexborHTMLParser is None:
+        tags = BeautifulSoup(html, "lxml", parse_only=_META_ONLY).find_all("meta")
+    else:
+        tags = LexborHTMLParser(html).css(_meta_selector(tuple(keys)))
+    
+    missing = len(found)
+    for tag in tags:
+        attributes = tag.attrs if LexborHTMLParser is None else tag.attributes
+        content = attributes.get("content")
+        if not content:
+            continue
+        for attr, value in keys:
+            key = (attr, value)
+            if found[key] is None and attributes.get(attr) == value:
+                found[key] = content
+                missing -= 1
+        if not missing:
+            break
+    return found
+
+
+@lru_cache(maxsize=16)
+def _meta_selector(keys: Tuple[Tuple[str, str], ...]) -> str:
+    """One CSS selector matching the meta tags for all keys."""
+    return ", ".join(f'meta[{attr}="{value}"]' for attr, value in keys)
@@ -0,0 +1,157 @@
+"""Tests for trimming large feeds to their leading entries before parsing."""
+import sys
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import feedparser
+
+from src.services import rss_service
+from src.services.rss_service import RSSService, _truncate_feed, _LARGE_FEED_BYTES
+
+LIMIT = 50
+ENTRIES = 600
+# Pads each entry so the whole document is well past the large-feed threshold
+PADDING = "x" * (2 * _LARGE_FEED_BYTES // ENTRIES)
+
+
+def rss_feed(encoding="utf-8", title="Entry"):
+    items = "".join(
+        f"<item><guid>id-{i}</guid><title>{title} {i}</title>"
+        f"<link>https://example.com/{i}</link><description>{PADDING}</description></item>"
+        for i in range(ENTRIES)
+    )
+    return (
+        f'<?xml version="1.0" encoding="{encoding}"?>'
+        f'<rss version="2.0"><channel><title>Feed</title>{items}</channel></rss>'
+    ).encode(encoding)
+
+
+def dated_rss_feed(oldest_first):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    order = range(ENTRIES) if oldest_first else reversed(range(ENTRIES))
+    items = "".join(
+        f"<item><guid>id-{i}</guid><title>Entry {i}</title>"
+        f"<pubDate>{format_datetime(start + timedelta(hours=i))}</pubDate>"
+        f"<description>{PADDING}</description></item>"
+        for i in order
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<rss version="2.0"><channel><title>Feed</title>{items}</channel></rss>'
+    ).encode()
+
+
+def rdf_feed():
+    items = "".join(
+        f'<item rdf:about="https://example.com/{i}"><title>Entry {i}</title>'
+        f"<link>https://example.com/{i}</link><description>{PADDING}</description></item>"
+        for i in range(ENTRIES)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+        'xmlns="http://purl.org/rss/1.0/">'
+        f'<channel rdf:about="https://example.com/"><title>Feed</title></channel>{items}</rdf:RDF>'
+    ).encode()
+
+
+def atom_feed():
+    entries = "".join(
+        f'<entry><id>id-{i}</id><title>Entry {i}</title>'
+        f'<link href="https://example.com/{i}"/><summary>{PADDING}</summary></entry>'
+        for i in range(ENTRIES)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<feed xmlns="http://www.w3.org/2005/Atom"><title>Feed</title>{entries}</feed>'
+    ).encode()
+
+
+def parse_trimmed(content):
+    trimmed = _truncate_feed(content, LIMIT)
+    assert len(trimmed) < len(content)
+    return feedparser.parse(trimmed)
+
+
+def assert_leading_entries(feed, title="Entry"):
+    assert not feed.bozo
+    assert len(feed.entries) == LIMIT
+    assert feed.entries[0].title == f"{title} 0"
+    assert feed.entries[-1].title == f"{title} {LIMIT - 1}"
+    assert feed.entries[-1].link == f"https://example.com/{LIMIT - 1}"
+
+
+def test_rss():
+    feed = parse_trimmed(rss_feed())
+    assert_leading_entries(feed)
+    assert feed.feed.title == "Feed"
+
+
+def test_rdf():
+    assert_leading_entries(parse_trimmed(rdf_feed()))
+
+
+def test_atom():
+    assert_leading_entries(parse_trimmed(atom_feed()))
+
+
+def test_declared_latin1_encoding():
+    feed = parse_trimmed(rss_feed(encoding="iso-8859-1", title="Café"))
+    assert_leading_entries(feed, title="Café")
+
+
+def test_small_feed_unchanged():
+    content = b'<?xml version="1.0"?><rss version="2.0"><channel><item><title>A</title></item></channel></rss>'
+    assert _truncate_feed(content, LIMIT) is content
+
+
+def test_malformed_feed_unchanged():
+    content = b"<rss><channel><item>" + b"<title>broken & unescaped</title>" * 40000
+    assert len(content) >= _LARGE_FEED_BYTES
+    assert _truncate_feed(content, LIMIT) is content
+
+
+def test_feed_without_entries_unchanged():
+    content = b"<rss><channel><title>" + b"x" * _LARGE_FEED_BYTES + b"</title></channel></rss>"
+    assert _truncate_feed(content, LIMIT) is content
+
+
+def test_damage_after_limit_is_cut_off():
+    # The document breaks off after the kept entries; the trimmed copy is still well formed
+    content = rss_feed()[:-len("</channel></rss>")] + b"<item><title>cut"
+    assert_leading_entries(parse_trimmed(content))
+
+
+def test_parse_feed_uses_entry_limit():
+    original = rss_service.settings.max_entries_per_feed
+    rss_service.settings.max_entries_per_feed = LIMIT
+    try:
+        feed = RSSService.parse_feed("https://example.com/feed", rss_feed())
+    finally:
+        rss_service.settings.max_entries_per_feed = original
+    assert_leading_entries(feed)
+
+
+def test_newest_first_feed_is_trimmed():
+    feed = parse_trimmed(dated_rss_feed(oldest_first=False))
+    assert len(feed.entries) == LIMIT
+    assert feed.entries[0].title == f"Entry {ENTRIES - 1}"
+
+
+def test_oldest_first_feed_keeps_newest_entries():
+    # Trimming would keep the oldest entries, so the whole feed goes to feedparser
+    content = dated_rss_feed(oldest_first=True)
+    assert _truncate_feed(content, LIMIT) is content
+    
+    original = rss_service.settings.max_entries_per_feed
+    rss_service.settings.max_entries_per_feed = LIMIT
+    try:
+        feed = RSSService.parse_feed("https://example.com/feed", content)
+    finally:
+        rss_service.settings.max_entries_per_feed = original
+    assert len(feed.entries) == ENTRIES
+    assert feed.entries[-1].title == f"Entry {ENTRIES - 1}"
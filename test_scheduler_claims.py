@@ -0,0 +1,194 @@
+import sys
+import asyncio
+from collections import Counter
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.core.scheduler import Scheduler
+from src.database import db, ArticleRepository
+from src.database.models import Base
+from src.utils.cache import LRUCache
+
+
+class FakeMessage:
+    id = 42
+
+
+class FakeTelegram:
+    """Stands in for TelegramService; send_message returns, fails or raises as told."""
+    
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.sent = []
+    
+    async def send_message(self, message, image_url=None):
+        self.sent.append(message)
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+@asynccontextmanager
+async def memory_database():
+    """Point the shared db at a fresh in-memory SQLite database, restoring it afterwards."""
+    original = db.engine, db.async_session
+    db.engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    db.async_session = async_sessionmaker(db.engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with db.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        yield
+    finally:
+        await db.engine.dispose()
+        db.engine, db.async_session = original
+
+
+def make_scheduler(outcome=None):
+    """A Scheduler with just the state the claim path uses, and no Telegram client."""
+    scheduler = Scheduler.__new__(Scheduler)
+    scheduler.telegram_service = FakeTelegram(outcome)
+    scheduler._default_feed_id = None
+    scheduler._default_feed_lock = asyncio.Lock()
+    scheduler._db_lock = asyncio.Lock()
+    scheduler._stat_deltas = Counter()
+    scheduler._posted_urls = LRUCache(maxsize=16)
+    return scheduler
+
+
+def make_article(link):
+    return {
+        "link": link,
+        "title": "Test article",
+        "summary": {"Qisqacha": "Summary"},
+        "message": "<b>Test article</b>",
+        "image_url": None,
+        "published_at": None,
+    }
+
+
+async def article_stored(link):
+    async with db.get_session() as session:
+        return await ArticleRepository.exists(session, link)
+
+
+def test_claim_and_duplicate_claim():
+    async def run():
+        async with memory_database():
+            scheduler = make_scheduler()
+            
+            article_id = await scheduler._claim_article(make_article("https://example.com/a"))
+            assert article_id is not None
+            assert await article_stored("https://example.com/a")
+            
+            # A second claim of the same URL must not get an id
+            assert await scheduler._claim_article(make_article("https://example.com/a")) is None
+            assert scheduler._stat_deltas["skipped"] == 1
+        
+    asyncio.run(run())
+
+
+def test_release_frees_the_url():
+    async def run():
+        async with memory_database():
+            scheduler = make_scheduler()
+            
+            article_id = await scheduler._claim_article(make_article("https://example.com/b"))
+            await scheduler._release_article(article_id)
+            assert not await article_stored("https://example.com/b")
+            
+            # Once released, the article can be claimed again
+            assert await scheduler._claim_article(make_article("https://example.com/b")) is not None
+        
+    asyncio.run(run())
+
+
+def test_successful_send_keeps_claim():
+    async def run():
+        async with memory_database():
+            scheduler = make_scheduler(FakeMessage())
+            
+            assert await scheduler.process_and_post_article(make_article("https://example.com/c"))
+            async with db.get_session() as session:
+                article = await ArticleRepository.get_by_url(session, "https://example.com/c")
+            assert article.telegram_message_id == FakeMessage.id
+            assert scheduler._posted_urls.get("https://example.com/c")
+        
+    asyncio.run(run())
+
+
+def test_failed_send_releases_claim():
+    async def run():
+        async with memory_database():
+            scheduler = make_scheduler(None)
+            
+            assert not await scheduler.process_and_post_article(make_article("https://example.com/d"))
+            assert not await article_stored("https://example.com/d")
+        
+    asyncio.run(run())
+
+
+def test_raising_send_releases_claim():
+    async def run():
+        async with memory_database():
+            scheduler = make_scheduler(RuntimeError("connection lost"))
+            
+            assert not await scheduler.process_and_post_article(make_article("https://example.com/e"))
+            assert not await article_stored("https://example.com/e")
+            
+            # The URL is free for the next cycle to retry
+            scheduler.telegram_service.outcome = FakeMessage()
+            assert await scheduler.process_and_post_article(make_article("https://example.com/e"))
+        
+    asyncio.run(run())
+
+
+async def age_claim(link, minutes):
+    """Backdate an article row, as if it were claimed minutes ago."""
+    async with db.get_session() as session:
+        await session.execute(
+            text("UPDATE articles SET created_at = datetime('now', :age) WHERE url = :url"),
+            {"age": f"-{minutes} minutes", "url": link},
+        )
+        await session.commit()
+
+
+def test_stale_unsent_claim_is_released():
+    async def run():
+        async with memory_database():
+            scheduler = make_scheduler(FakeMessage())
+            
+            await scheduler._claim_article(make_article("https://example.com/stale"))
+            await scheduler._claim_article(make_article("https://example.com/fresh"))
+            assert await scheduler.process_and_post_article(make_article("https://example.com/sent"))
+            for link in ("https://example.com/stale", "https://example.com/sent"):
+                await age_claim(link, Scheduler.STALE_CLAIM_MINUTES + 5)
+            
+            await scheduler._release_stale_claims()
+            assert not await article_stored("https://example.com/stale")
+            # Claims that may still be in flight, and posted articles, stay
+            assert await article_stored("https://example.com/fresh")
+            assert await article_stored("https://example.com/sent")
+        
+    asyncio.run(run())
+
+
+def test_recent_urls_skip_unsent_claims():
+    async def run():
+        async with memory_database():
+            scheduler = make_scheduler(FakeMessage())
+            
+            await scheduler._claim_article(make_article("https://example.com/claimed"))
+            assert await scheduler.process_and_post_article(make_article("https://example.com/posted"))
+            
+            async with db.get_session() as session:
+                urls = await ArticleRepository.get_recent_urls(session)
+            assert urls == ["https://example.com/posted"]
+        
+    asyncio.run(run())